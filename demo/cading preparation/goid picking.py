@@ -49,35 +49,42 @@ class MainWindow(Window):
         p1.frm = 'c'
         p1.goid_flag = False
 
-        self.is_rendered = False
+        # id frame is redrawn only when scene, camera or pane has changed
+        camera, pane = self.devices.cameras[0], self.devices.panes[1]
+        self.devices.frames[1].set_redraw(self.render_id,
+                                          stamp=lambda: (self.modeler.version, camera.version, pane.size.xy))
+        self.id_picker = self.devices.frames[1].create_async_pixel_picker(aid=1)
+
+    def render_id(self, rf):
+        with self.devices.cameras[0]:
+            rf.clear_depth()
+            rf.clear_texture(0, .5, .5, .5, 1)
+            rf.clear_texture(1, 0, 0, 0, 1)
+            self.modeler.render()
 
     def draw(self):
         with self.devices.frames[0] as df:
             df.clear(0, 0, 0, 1)
             df.clear_depth()
 
-            with self.devices.cameras[0]:
-                if not self.is_rendered:
-                    with self.devices.frames[1] as rf:
-                        rf.clear_depth()
-                        rf.clear_texture(0, .5, .5, .5, 1)
-                        rf.clear_texture(1, 0, 0, 0, 1)
-                        self.modeler.render()
-                        self.is_rendered = True
+            self.modeler.poll()
+            self.devices.frames[1].validate()
 
             with self.devices.panes[1]:
                 self.devices.frames[1].render_pane_space(0, (0, 1, 0, 1), (-1, 1, -1, 1), 0.9)
 
-            with self.devices.frames[1] as rf:
-                # manual pos transformation
-                pos = self.devices.cursors[0].pos_global
-                pos -= self.devices.panes[1].pos
-                pos /= self.devices.panes[1].size
-                # pick color id
-                goid, bitpattern = rf.pick_pixels(aid=1, pos=pos, size=(1, 1))
-                e = GIDP().get_registered_byvalue(goid[0][0], bitpattern)  # for last two bits being alpha
-                if e:
-                    print(e)
+            # manual pos transformation
+            pos = self.devices.cursors[0].pos_global
+            pos -= self.devices.panes[1].pos
+            pos /= self.devices.panes[1].size
+            # pick color id, hover does not wait for gpu but is delivered a frame or two later
+            self.id_picker.pick(pos=pos, size=(1, 1), callback=self.print_picked)
+            self.id_picker.update()
+
+    def print_picked(self, goid, bitpattern):
+        e = GIDP().get_registered_byvalue(goid[0][0], bitpattern)  # for last two bits being alpha
+        if e:
+            print(e)
 
 
 class SubWindow(Window):
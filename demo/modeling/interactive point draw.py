@@ -28,8 +28,9 @@ class MyWindow(Window):
         self.modeler.add_pln(self.model, (0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1))
 
 
-        self.id_picker = self.devices.frames[1].create_pixel_picker(aid=1)
-        self.coord_picker = self.devices.frames[1].create_pixel_picker(aid=2)
+        # readbacks are served a frame or two later by `update` in draw
+        self.id_picker = self.devices.frames[1].create_async_pixel_picker(aid=1)
+        self.coord_picker = self.devices.frames[1].create_async_pixel_picker(aid=2)
         self.controller = AController(self,
                                       self.modeler,
                                       self.model,
@@ -53,13 +54,17 @@ class MyWindow(Window):
                 # update camera move
                 # extract coordinate texture value
                 txtr_pos = self.devices.cursors[0].pos_local * self.devices.frames[1].size
-                coord, _ = self.coord_picker.pick(pos=txtr_pos.astype(int), size=(1, 1))
-                coord = coord[0][0].tolist()[:3]
-                if coord != [0, 0, 0]:
-                    self.cad_dolly.set_ref_point(*coord)
+                self.coord_picker.pick(pos=txtr_pos.astype(int), size=(1, 1), callback=self.set_ref_point)
+                self.id_picker.update()
+                self.coord_picker.update()
 
             df.render_pane_space_depth(aid=0)
 
+    def set_ref_point(self, coord, bitpattern):
+        coord = coord[0][0].tolist()[:3]
+        if coord != [0, 0, 0]:
+            self.cad_dolly.set_ref_point(*coord)
+
 
 class DebuggerWindow(Window):
     def __init__(self, mother):
@@ -0,0 +1,112 @@
+import glfw
+import OpenGL.GL as gl
+import numpy as np
+import ctypes
+import time
+
+"""
+benchmark at which hole ratio drawing live runs by glMultiDrawElements
+beats drawing whole index buffer padded with PRV.
+
+Index buffer of points is punched with holes filled with PRV, hole sizes are random(1~64).
+Live runs are drawn by a single glMultiDrawElements call, time includes building pointer array
+as `Renderer.draw_elements` does per frame.
+
+result: (hole ratio, number of live runs, PRV elapse, multi draw elapse in seconds)
+print out of this script, run on target machine and set crossing point into `Renderer.MULTI_DRAW_HOLE_RATIO`
+
+conclusion:
+PRV path cost grows with active size regardless of holes while multi draw path cost grows
+with number of live runs, so crossing point depends on hole scattering.
+"""
+
+glfw.init()
+window = glfw.create_window(1000, 1000, 'mywindow', None, None)
+glfw.make_context_current(window)
+
+num_points = 1_000_000
+points = np.random.uniform(-1, 1, (num_points, 4)).astype('f4')
+prgrm_src = {gl.GL_VERTEX_SHADER: """
+#version 450 core
+layout (location = 0) in vec4 vtx;
+void main() {
+    gl_Position = vtx;
+}
+""", gl.GL_FRAGMENT_SHADER: """
+#version 450 core
+out vec4 FragColor;
+void main() {
+    FragColor = vec4(1, 1, 1, 1);
+}
+"""}
+prgrm = gl.glCreateProgram()
+for typ, src in prgrm_src.items():
+    shdr = gl.glCreateShader(typ)
+    gl.glShaderSource(shdr, src)
+    gl.glCompileShader(shdr)
+    gl.glAttachShader(prgrm, shdr)
+gl.glLinkProgram(prgrm)
+gl.glUseProgram(prgrm)
+
+vao = gl.glGenVertexArrays(1)
+gl.glBindVertexArray(vao)
+vbo, ibo = gl.glGenBuffers(2)
+gl.glBindBuffer(gl.GL_ARRAY_BUFFER, vbo)
+gl.glBufferData(gl.GL_ARRAY_BUFFER, points.nbytes, points, gl.GL_STATIC_DRAW)
+gl.glEnableVertexAttribArray(0)
+gl.glVertexAttribPointer(0, 4, gl.GL_FLOAT, gl.GL_FALSE, 16, ctypes.c_void_p(0))
+gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, ibo)
+
+qid = gl.glGenQueries(1)[0]
+gl.glEnable(gl.GL_PRIMITIVE_RESTART_FIXED_INDEX)
+gl.glPointSize(1)
+
+
+def punch(hole_ratio):
+    """
+    :return: PRV padded indices, live offsets, live counts
+    """
+    idx = np.arange(num_points, dtype='uint32')
+    live = np.ones(num_points, bool)
+    while live.sum() > num_points * (1 - hole_ratio):
+        s = np.random.randint(num_points)
+        live[s:s + np.random.randint(1, 65)] = False
+    idx[~live] = 0xff_ff_ff_ff
+    edges = np.flatnonzero(np.diff(np.r_[0, live.astype(np.int8), 0]))
+    starts, stops = edges[0::2], edges[1::2]
+    return idx, starts, stops - starts
+
+
+def measure(query, num_test=50):
+    elapse_times = []
+    for _ in range(num_test):
+        gl.glBeginQuery(gl.GL_TIME_ELAPSED, qid)
+        query()
+        gl.glEndQuery(gl.GL_TIME_ELAPSED)
+        elapse_times.append(gl.glGetQueryObjectiv(qid, gl.GL_QUERY_RESULT))
+    return sum(elapse_times) / num_test / 1_000_000_000
+
+
+def multi_draw(offsets, counts):
+    ptrs = (offsets * 4).astype(np.uintp)
+    gl.glMultiDrawElements(gl.GL_POINTS,
+                           counts.astype(np.int32),
+                           gl.GL_UNSIGNED_INT,
+                           (ctypes.c_void_p * len(ptrs)).from_buffer(ptrs),
+                           len(ptrs))
+
+
+is_test = True
+while not glfw.window_should_close(window):
+    if is_test:
+        for hole_ratio in (0.05, 0.1, 0.2, 0.3, 0.5, 0.7, 0.9):
+            idx, offsets, counts = punch(hole_ratio)
+            gl.glBufferData(gl.GL_ELEMENT_ARRAY_BUFFER, idx.nbytes, idx, gl.GL_DYNAMIC_DRAW)
+            prv = measure(lambda: gl.glDrawElements(gl.GL_POINTS, num_points, gl.GL_UNSIGNED_INT, ctypes.c_void_p(0)))
+            multi = measure(lambda: multi_draw(offsets, counts))
+            print(hole_ratio, len(offsets), prv, multi)
+        is_test = False
+        print('TEST DONE')
+    glfw.swap_buffers(window)
+    glfw.poll_events()
+    time.sleep(1 / 60)
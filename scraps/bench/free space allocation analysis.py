@@ -0,0 +1,110 @@
+import random
+import heapq
+import time
+from ckernel.render_context.opengl_context.free_space import FreeSpace
+
+"""
+benchmark:
+replay random add/remove workload on free space managers
+and compare peak array size, high water index, scattering and fragmentation
+
+legacy: min heap of (start, stop) never merging released ranges, block spreads over holes from the front
+first : coalescing FreeSpace with FIRST_FIT policy
+best  : coalescing FreeSpace with BEST_FIT policy, holes by size in red black tree
+
+workload: 20k blocks of size 1~32 added, then 100k random add/remove
+
+result: (policy, peak array size, high water index, holes, spans per block, fragmentation, elapse time in second)
+legacy 524288 332662 349 3.1564 0.0117 0.6272
+first 524288 363869 6021 1.0 0.1726 1.656
+best 524288 338173 1682 1.0 0.0399 2.9149
+
+conclusion:
+Legacy pool packs tight only by scattering a block over ~3 holes, so blocks can't be sliced
+and every access is fancy indexed. Coalescing keeps every block a single span with the same peak array size.
+Best fit costs only ~2% of high water index over legacy while first fit costs ~9%.
+First fit allocation is ~2x slower in pure python, best fit ~4x as tree is balanced in python,
+both stay O(log n) and under ~30us per operation.
+"""
+
+random.seed(0)
+num_ramp = 20_000  # blocks added before churning
+num_churn = 100_000  # random add/remove after ramp
+max_block = 32
+
+
+class LegacyPool:
+    """
+    replica of previous `BffrCache` allocation
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.pool = [(0, capacity)]
+
+    def take(self, size):
+        spans = []
+        while 0 < size:
+            if not self.pool:
+                self.pool.append((self.capacity, self.capacity * 2))
+                self.capacity *= 2
+            s, e = self.pool[0]
+            spans.append((s, min(e, s + size)))
+            if e - s <= size:
+                heapq.heappop(self.pool)
+            else:
+                self.pool[0] = (s + size, e)
+            size -= e - s
+        return spans
+
+    def release(self, s, e):
+        heapq.heappush(self.pool, (s, e))
+
+    @property
+    def fragmentation(self):
+        sizes = [e - s for s, e in self.pool]
+        return 1 - max(sizes) / sum(sizes) if sizes else 0.
+
+
+# same workload for all
+workload = [('add', random.randint(1, max_block)) for _ in range(num_ramp)]
+churn = []
+for _ in range(num_churn // 2):
+    churn.append(('remove', random.random()))
+    churn.append(('add', random.randint(1, max_block)))
+random.shuffle(churn)
+workload += churn
+
+
+def replay(space, grow):
+    alive = []
+    peak = space.capacity
+    high = 0
+    s = time.time()
+    for op, v in workload:
+        if op == 'add':
+            if grow and space.total < v:
+                new_cap = space.capacity * 2
+                while new_cap - space.capacity + space.total < v:
+                    new_cap *= 2
+                space.grow(new_cap)
+            spans = space.take(v)
+            alive.append(spans)
+            high = max(high, spans[-1][1])
+        else:
+            spans = alive.pop(int(v * len(alive)))
+            for start, stop in spans:
+                space.release(start, stop)
+        peak = max(peak, space.capacity)
+    e = time.time()
+    spans_per_block = sum(len(spans) for spans in alive) / len(alive)
+    return peak, high, spans_per_block, space.fragmentation, e - s
+
+
+results = {'legacy': (LegacyPool(16), False),
+           'first': (FreeSpace(16, FreeSpace.FIRST_FIT), True),
+           'best': (FreeSpace(16, FreeSpace.BEST_FIT), True)}
+for name, (space, grow) in results.items():
+    peak, high, spans_per_block, frag, t = replay(space, grow)
+    num_holes = len(space.pool) if isinstance(space, LegacyPool) else len(space)
+    print(name, peak, high, num_holes, round(spans_per_block, 4), round(frag, 4), round(t, 4))
@@ -0,0 +1,44 @@
+import time
+import numpy as np
+
+from mkernel.global_id_provider import GIDP, GOID
+
+"""
+benchmark registering 1M entities into `GIDP` and encoding their ids
+
+result: (case, elapse in seconds), machine allocating 1M plain objects in 0.71s
+single 3.42   register_entity per entity
+bulk 0.79     register_entities
+encode 0.20   GOID.encode_rgb_float of 1M ids, list conversion included
+decode 0.07   GOID.decode_rgb_float of 1M float rgb
+
+conclusion:
+Registration itself is a list pop and a weakref, most of single registration cost is cyclic gc rescanning
+growing table, so shapes created in bulk should be registered by `register_entities`.
+Ids in batch should be encoded by array methods, `GOID.as_rgb_float` is dominated by array creation.
+"""
+
+
+class Entity:
+    pass
+
+
+if __name__ == '__main__':
+    gidp = GIDP()
+    entities = [Entity() for _ in range(1_000_000)]
+    s = time.perf_counter()
+    goids = [gidp.register_entity(e) for e in entities]
+    print('single', time.perf_counter() - s)
+
+    entities = [Entity() for _ in range(1_000_000)]
+    s = time.perf_counter()
+    goids = gidp.register_entities(entities)
+    print('bulk', time.perf_counter() - s)
+
+    s = time.perf_counter()
+    rgb = GOID.encode_rgb_float(goids)
+    print('encode', time.perf_counter() - s)
+    s = time.perf_counter()
+    raws = GOID.decode_rgb_float(rgb)
+    print('decode', time.perf_counter() - s)
+    assert np.array_equal(raws, goids)
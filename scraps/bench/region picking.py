@@ -0,0 +1,65 @@
+import time
+import numpy as np
+
+from mkernel.global_id_provider import GIDP, GOID
+from mkernel.control.util import RegionPicker
+
+"""
+benchmark selecting shapes within 1000x800 region of 1920x1080 id image holding 2000 rectangular shapes
+
+result: (case, elapse in milliseconds)
+unique 28.3   np.unique over every decoded pixel
+rect 5.1      RegionPicker.pick_rect, 826 shapes found
+lasso 12.2    RegionPicker.pick_lasso of 200 vertex ellipse inscribed, 658 shapes found
+
+conclusion:
+Sorting every pixel dominates naive decoding. Id image is mostly runs of background or the same shape
+so collapsing runs before `np.unique` leaves few thousand values to sort.
+Lasso pays for rasterizing mask and gathering masked pixels, scanline spans filled by cumulative sum
+keep it linear to pixel count.
+"""
+
+
+class Entity:
+    pass
+
+
+class ArrayPicker:
+    """
+    stands for `FramePixelPicker` returning pixels like glReadPixels
+    """
+    def __init__(self, img):
+        self.img = img
+        self.size = img.shape[::-1]
+
+    def pick(self, pos, size):
+        (x, y), (w, h) = pos, size
+        return self.img[y:y + h, x:x + w].copy().reshape(w, h), (10, 10, 10, 2)
+
+
+if __name__ == '__main__':
+    w, h, n = 1920, 1080, 20
+    rng = np.random.default_rng(0)
+    entities = [Entity() for _ in range(2000)]
+    img = np.zeros((h, w), dtype=np.uint32)
+    for goid in GIDP().register_entities(entities):
+        x, y = rng.integers(0, w - 40), rng.integers(0, h - 40)
+        img[y:y + rng.integers(2, 40), x:x + rng.integers(2, 40)] = int(goid) << 2 | 3
+    picker = RegionPicker(ArrayPicker(img))
+
+    s = time.perf_counter()
+    for _ in range(n):
+        np.unique(GOID.decode_packed(img[100:900, 200:1200], (10, 10, 10, 2)))
+    print('unique', (time.perf_counter() - s) / n * 1e3)
+
+    s = time.perf_counter()
+    for _ in range(n):
+        found = picker.pick_rect((200, 100), (1000, 800))
+    print('rect', (time.perf_counter() - s) / n * 1e3, len(found))
+
+    angles = np.linspace(0, 2 * np.pi, 200, endpoint=False)
+    lasso = np.c_[700 + 500 * np.cos(angles), 500 + 400 * np.sin(angles)] / (w, h)
+    s = time.perf_counter()
+    for _ in range(n):
+        found = picker.pick_lasso(lasso)
+    print('lasso', (time.perf_counter() - s) / n * 1e3, len(found))
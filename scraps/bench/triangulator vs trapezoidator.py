@@ -0,0 +1,60 @@
+import time
+import numpy as np
+
+import gkernel.dtype.geometric as gt
+from gkernel.tools import Triangulator
+from mkernel.model.shapes.polygon_wrapper import _Trapezoidator
+
+"""
+benchmark polygon fill generation of `Triangulator`(y-monotone partition, GL_TRIANGLES)
+against `_Trapezoidator`(GL_QUAD_STRIP) on star shaped polygons of growing vertex count.
+
+Polygons are random star shaped, vertex radius in (0.3, 1) so that roughly half of vertices are reflex.
+Both are fed with the same `gt.Pgon`, time includes normalization.
+Trapezoidator is skipped once a size takes longer than `TRAPEZOIDATOR_LIMIT` seconds.
+
+result: (number of vertices, triangulator elapse, trapezoidator elapse in seconds)
+10 0.00071 0.039
+100 0.0013 0.83
+1000 0.012 14.1
+10000 0.15 -
+100000 3.4 -
+
+conclusion:
+Triangulator grows by n log n while trapezoidator grows close to n^2,
+triangulator is ~30x faster on small polygons and three orders faster at 1000 vertices.
+"""
+
+TRAPEZOIDATOR_LIMIT = 10
+
+
+def star(num_vrtx, rng):
+    angles = np.sort(rng.uniform(0, 2 * np.pi, num_vrtx))
+    radius = rng.uniform(0.3, 1, num_vrtx)
+    vs = [tuple(v) for v in np.c_[np.cos(angles) * radius, np.sin(angles) * radius, np.zeros(num_vrtx)]]
+    return gt.Pgon(*vs, vs[0])
+
+
+def measure(func, pgon, num_test=3):
+    elapse_times = []
+    for _ in range(num_test):
+        pgon = gt.Pgon(*map(tuple, pgon[:3].T))  # fresh one for normalization
+        s = time.perf_counter()
+        func(pgon)
+        elapse_times.append(time.perf_counter() - s)
+    return sum(elapse_times) / num_test
+
+
+rng = np.random.default_rng(0)
+is_trapezoidator_on = True
+for num_vrtx in (10, 100, 1_000, 10_000, 100_000):
+    pgon = star(num_vrtx, rng)
+    tri = measure(lambda p: Triangulator.triangulate(p.normalized[:2, :-1].T), pgon)
+    trp = '-'
+    if is_trapezoidator_on:
+        try:
+            trp = measure(lambda p: _Trapezoidator().gen_quad_strip(p), pgon)
+            is_trapezoidator_on = trp < TRAPEZOIDATOR_LIMIT
+        except Exception:
+            trp = 'failed'
+    print(num_vrtx, tri, trp)
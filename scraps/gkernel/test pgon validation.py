@@ -0,0 +1,25 @@
+from gkernel.dtype.geometric.complex import Pgon
+
+print('test 0: simple polygon is normalized')
+square = Pgon((0, 0, 0), (2, 0, 0), (2, 2, 0), (0, 2, 0), (0, 0, 0))
+assert square.self_intersections() == []
+print(square.normalized.shape)
+
+print('test 1: bowtie is rejected naming crossing edges')
+bowtie = Pgon((0, 0, 0), (2, 2, 0), (2, 0, 0), (0, 2, 0), (0, 0, 0))
+print(bowtie.self_intersections())
+try:
+    bowtie.normalized
+except ValueError as e:
+    print(e)
+else:
+    raise AssertionError('self intersecting polygon passed validation')
+
+print('test 2: edge folding back onto its neighbor is rejected')
+folded = Pgon((0, 0, 0), (4, 0, 0), (4, 2, 0), (4, 1, 0), (0, 1, 0), (0, 0, 0))
+try:
+    folded.normalized
+except ValueError as e:
+    print(e)
+else:
+    raise AssertionError('folded polygon passed validation')
@@ -0,0 +1,31 @@
+import warnings
+from mkernel.control.util.tessellator import Tessellator
+
+"""
+one self intersecting polygon mixed into a chunk of valid ones
+is dropped with a warning while the rest of the chunk is delivered
+"""
+
+square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+bowtie = [(0, 0), (2, 2), (2, 0), (0, 2)]
+polygons = {i: square for i in range(8)}
+polygons[3] = bowtie
+
+if __name__ == '__main__':
+    for workers in (0, 2):
+        print(f'test {workers} workers')
+        tess = Tessellator(workers)
+        delivered = {}
+        for key, outer in polygons.items():
+            tess.submit(key, outer, callback=lambda tris, key=key: delivered.__setitem__(key, tris))
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            tess.flush()
+        print(sorted(delivered), [str(w.message) for w in caught])
+        assert sorted(delivered) == [k for k in polygons if k != 3]
+        assert len(caught) == 1 and len(tess) == 0
+        # key of dropped job is free to be submitted again
+        tess.submit(3, square, callback=lambda tris: delivered.__setitem__(3, tris))
+        tess.flush()
+        assert 3 in delivered
+        tess.shutdown()
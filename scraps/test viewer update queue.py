@@ -0,0 +1,46 @@
+from mkernel.control.modeler.amodeler import AModeler
+import mkernel.model.shapes as st
+
+"""
+viewer update queue keeps the latter of free and malloc of the same shape,
+checked within a batch, across merged batches and across flushes
+"""
+
+if __name__ == '__main__':
+    modeler = AModeler(tessellation_workers=0)
+    viewer = modeler._AModeler__viewer
+    model = modeler.add_model(None)
+    pnt = modeler.add_pnt(model, 0, 0, 0)
+    viewer.flush()
+    renderer = viewer.renderers[st.Pnt]
+
+    print('test 0: free, malloc, update in one batch')
+    with modeler.batch():
+        viewer.free_shape(pnt)
+        viewer.malloc_shape(pnt)
+        pnt.dia = 11
+    viewer.flush()
+    assert pnt in renderer.datasets and renderer.datasets[pnt]['vrtx']['dia'] == 11
+
+    print('test 1: free in one batch, malloc and update in the next before flush')
+    with modeler.batch():
+        viewer.free_shape(pnt)
+    with modeler.batch():
+        viewer.malloc_shape(pnt)
+        pnt.dia = 12
+    viewer.flush()
+    assert pnt in renderer.datasets and renderer.datasets[pnt]['vrtx']['dia'] == 12
+
+    print('test 2: update after free is dropped')
+    with modeler.batch():
+        viewer.free_shape(pnt)
+    pnt.dia = 13
+    viewer.flush()
+    assert pnt not in renderer.datasets
+
+    print('test 3: malloc after free of the previous frame')
+    viewer.malloc_shape(pnt)
+    pnt.dia = 14
+    viewer.flush()
+    assert renderer.datasets[pnt]['vrtx']['dia'] == 14
+    print('ok')
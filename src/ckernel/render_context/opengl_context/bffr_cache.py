@@ -1,9 +1,13 @@
 import numpy as np
 from collections import namedtuple
-import heapq
+import weakref
+import gc
+import time
 
 from .translators import npdtype_to_gldtype
-from global_tools.skip_list import SkipList
+from .free_space import FreeSpace
+from ckernel.constants import PRIMITIVE_RESTART_VAL as PRV
+from global_tools.interval_set import IntervalSet
 from itertools import repeat
 
 
@@ -12,11 +16,55 @@ class _Block:
     redirector to buffer array
 
     Syncs value update between sliced array and master array
+
+    Block is described by sorted `spans`, ((start, stop), ...) of the array.
+    Block of a single span is accessed through slice thus reading returns view not copy.
     """
+    # lightweight as there can be a block per point
+    __slots__ = ('__cache', '__spans', '__size', '__indices', '__selector')
 
-    def __init__(self, array_container, indices):
+    def __init__(self, array_container, spans):
         self.__cache = array_container
-        self.__indices = list(indices)
+        self.__set_spans(spans)
+
+    @classmethod
+    def _from_bounds(cls, array_container, starts, stops):
+        """
+        bulk create single span blocks
+
+        ! skips `__init__` for being lightweight
+        :param array_container: cache owning blocks
+        :param starts: (int, ...), start of each block
+        :param stops: (int, ...), stop of each block
+        :return: [_Block, ...]
+        """
+        blocks = []
+        # blocks don't form reference cycle, collecting while creating millions is pure overhead
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for s, e in zip(starts, stops):
+                block = cls.__new__(cls)
+                block.__cache = array_container
+                block.__spans = ((s, e),)
+                block.__size = e - s
+                block.__indices = None
+                block.__selector = slice(s, e)
+                blocks.append(block)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return blocks
+
+    def __set_spans(self, spans):
+        self.__spans = tuple(spans)
+        self.__size = sum(e - s for s, e in self.__spans)
+        self.__indices = None  # lazy
+        # single span is sliced, else fancy indexed
+        if len(self.__spans) == 1:
+            self.__selector = slice(*self.__spans[0])
+        else:
+            self.__selector = None
 
     def __getitem__(self, item):
         """
@@ -26,7 +74,7 @@ class _Block:
         :param item:
         :return:
         """
-        return self.__cache.array[item][self.__indices]
+        return self.__cache.array[item][self.__select()]
 
     def __setitem__(self, key, value):
         """
@@ -36,30 +84,85 @@ class _Block:
         :param value:
         :return:
         """
+        value = self.__cache._prepare_value(key[0] if isinstance(key, tuple) else key, value)
         # for 1D setitem
         if not isinstance(key, tuple):
-            self.__cache.array[key][self.__indices] = value
+            self.__cache.array[key][self.__select()] = value
+            for s, e in self.__spans:
+                self.__cache._mark_dirty(s, e)
+        elif self.__selector is not None:
+            self.__cache.array[key[0]][self.__selector][key[1]] = value
+            # translate local key into array range
+            offset = self.__spans[0][0]
+            if isinstance(key[1], slice):
+                s, e, step = key[1].indices(self.__size)
+                if step < 0:
+                    s, e = e + 1, s + 1
+                if s < e:
+                    self.__cache._mark_dirty(offset + s, offset + e)
+            else:
+                i = key[1] + self.__size if key[1] < 0 else key[1]
+                self.__cache._mark_dirty(offset + i, offset + i + 1)
         else:
-            self.__cache.array[key[0]][self.__indices[key[1]]] = value
+            indices = self.indx_array[key[1]]
+            self.__cache.array[key[0]][indices] = value
+            self.__cache._mark_dirty_indices(indices)
 
     def __len__(self):
-        return len(self.__indices)
+        return self.__size
 
     def __str__(self):
-        return f"<Block {self.__indices}]>"
+        return f"<Block {self.__spans}]>"
+
+    def __select(self):
+        """
+        :return: slice or index array selecting block from the array
+        """
+        if self.__selector is not None:
+            return self.__selector
+        return self.indx_array
+
+    @property
+    def spans(self):
+        """
+        :return: tuple((start, stop), ...), sorted consecutive ranges of the block
+        """
+        return self.__spans
 
     @property
     def indices(self):
         """
+        ! built lazily, prefer `spans` or `indx_array` for big blocks
         :return: tuple of array indices
         """
-        return tuple(self.__indices)
+        if self.__indices is None:
+            self.__indices = tuple(i for s, e in self.__spans for i in range(s, e))
+        return self.__indices
+
+    @property
+    def indx_array(self):
+        """
+        :return: ndarray of array indices
+        """
+        if len(self.__spans) == 1:
+            return np.arange(*self.__spans[0])
+        return np.concatenate([np.arange(s, e) for s, e in self.__spans])
 
     #
     # @property
     # def size(self):
     #     return len(self.__indices)
 
+    @property
+    def low_indx(self):
+        """
+        smallest index of blocks' indices
+
+        ! block may be non-contiguous, this is not an offset to add local index to
+        :return:
+        """
+        return self.__spans[0][0]
+
     @property
     def high_indx(self):
         """
@@ -67,7 +170,7 @@ class _Block:
 
         :return:
         """
-        return self.__indices[-1]
+        return self.__spans[-1][1] - 1
 
     @property
     def arr(self):
@@ -77,6 +180,15 @@ class _Block:
         """
         return self.__cache.array
 
+    def _relocate(self, spans):
+        """
+        ! only for the cache owning the block
+
+        :param spans: new spans of the block
+        :return:
+        """
+        self.__set_spans(spans)
+
     def release(self, reset_val=None):
         """
         end of usage, release memory
@@ -87,6 +199,7 @@ class _Block:
         self.__cache._release_block(self, reset_val)
         # ! resetting has to be below
         self.__cache = None
+        self.__spans = None
         self.__indices = None
 
     def release_refill(self, reset_val=None):
@@ -102,10 +215,63 @@ class _Block:
         self.__cache._release_block(self, reset_val)
         mapping = self.__cache.refill_foremost(reset_val)
         self.__cache = None
+        self.__spans = None
         self.__indices = None
         return mapping
 
 
+class IndxRemap:
+    """
+    old to new index mapping of vertices moved by compaction
+    """
+
+    def __init__(self, src, trg):
+        """
+
+        :param src: ndarray, old indices
+        :param trg: ndarray, new indices
+        """
+        self.__src = src
+        self.__trg = trg
+        # sorted for searching
+        order = np.argsort(src, kind='stable')
+        self.__sorted_src = src[order]
+        self.__sorted_trg = trg[order]
+
+    def __len__(self):
+        return len(self.__src)
+
+    def __bool__(self):
+        return bool(len(self.__src))
+
+    def __str__(self):
+        return f"<IndxRemap {len(self)}>"
+
+    @property
+    def src(self):
+        return self.__src
+
+    @property
+    def trg(self):
+        return self.__trg
+
+    def apply(self, values):
+        """
+        replace old indices with new in place
+
+        Values not in old indices, like primitive restart value, are left untouched.
+        :param values: ndarray of indices
+        :return: ndarray, positions of replaced values
+        """
+        if not len(self.__src) or not len(values):
+            return np.empty(0, dtype=np.int64)
+        pos = np.searchsorted(self.__sorted_src, values)
+        pos[pos == len(self.__sorted_src)] = 0
+        hit = np.flatnonzero(self.__sorted_src[pos] == values)
+        values[hit] = self.__sorted_trg[pos[hit]]
+        return hit
+
+
 class ArrayContainer:
     """
     in case class can't become array itself
@@ -131,8 +297,17 @@ class BffrCache(ArrayContainer):
     """
 
     # initial size of array for placeholder
+    FIRST_FIT, BEST_FIT = FreeSpace.FIRST_FIT, FreeSpace.BEST_FIT
 
-    def __init__(self, dtype, locs, size=1, def_val=None):
+    def __init__(self, dtype, locs, size=1, def_val=None, fit=FIRST_FIT):
+        """
+
+        :param dtype: structured dtype of the array
+        :param locs: location value for each field
+        :param size: initial size of the array
+        :param def_val: value to fill vacant vertices with
+        :param fit: block allocation policy, one of (FIRST_FIT, BEST_FIT)
+        """
         # extra location data
         if not isinstance(locs, (list, tuple)):
             raise TypeError
@@ -143,18 +318,23 @@ class BffrCache(ArrayContainer):
 
         self.__array = np.ndarray(size, dtype=dtype)
         if self.__def_val:
-            self.__array[:] = [self.__def_val]*len(self.__array)
+            self.__array[:] = self.__def_val
 
-        # for first fit allocation free space record,
-        self.__block_pool = [(0, len(self.__array))]  # (start, stop) min heap
-        self.__block_inuse = SkipList(key_provider=lambda x: x.indices[-1])
+        # free space record, coalesces released holes
+        self.__free_space = FreeSpace(len(self.__array), policy=fit)
+        self.__block_inuse = {}  # {high index: block}
         self.__num_vertex_inuse = 0
-        self.__highest_indx = -1
+        self.__live_runs = (None, None)  # (free space version, runs)
+
+        # dirty index ranges per consumer(ex. ogl buffer of each context)
+        self.__dirty = weakref.WeakKeyDictionary()
 
     def __getitem__(self, item):
         """
         for direct access into the array
 
+        ! writing through returned view is not tracked as dirty, use block
+
         :param item:
         :return:
         """
@@ -170,23 +350,126 @@ class BffrCache(ArrayContainer):
     def __str__(self):
         return f"<BffrCache {tuple(ps[0] for ps in self.field_props)}>"
 
-    def __expand_array(self):
+    def __expand_array(self, num_vacant=1):
         """
         in case of overflow double the size of the array
 
+        :param num_vacant: keep doubling until this number of vertices is vacant
         :return:
         """
         old_len = len(self.__array)
         new_len = old_len * 2
+        while new_len - old_len + self.__free_space.total < num_vacant:
+            new_len *= 2
         new_arr = np.ndarray(shape=new_len, dtype=self.__array.dtype)
 
         new_arr[:old_len] = self.__array
         if self.__def_val:
-            new_arr[old_len:] = [self.__def_val] * old_len
+            new_arr[old_len:] = self.__def_val
 
-        self.__block_pool.append((old_len, new_len))
+        self.__free_space.grow(new_len)
         self.__array = new_arr
 
+    def _mark_dirty(self, start, stop):
+        """
+        record index range [start, stop) as modified for every consumer
+
+        :param start: int, inclusive
+        :param stop: int, exclusive
+        :return:
+        """
+        for ranges in self.__dirty.values():
+            ranges.add(start, stop)
+
+    def _mark_dirty_indices(self, indices):
+        """
+        record given indices as modified, consecutive indices are recorded as a range
+
+        :param indices: int or sequence of int
+        :return:
+        """
+        if not self.__dirty:
+            return
+        idxs = np.atleast_1d(indices)
+        if not idxs.size:
+            return
+        # split into consecutive runs
+        breaks = np.flatnonzero(np.diff(idxs) != 1) + 1
+        starts = idxs[np.r_[0, breaks]]
+        stops = idxs[np.r_[breaks - 1, len(idxs) - 1]] + 1
+        for s, e in zip(starts.tolist(), stops.tolist()):
+            self._mark_dirty(s, e)
+
+    def pop_dirty_ranges(self, consumer):
+        """
+        return ranges modified since last pop of given consumer and reset them
+
+        Consumer unknown to the cache is considered to have never seen the array,
+        so whole array is returned as dirty.
+        :param consumer: weak referencable object syncing the array, ex) `_Bffr`
+        :return: tuple((start, stop), ...), sorted minimal index ranges
+        """
+        ranges = self.__dirty.get(consumer)
+        if ranges is None:
+            self.__dirty[consumer] = IntervalSet()
+            return ((0, len(self.__array)),)
+        return ranges.pop_all()
+
+    def write_range(self, key, start, stop, value):
+        """
+        vectorized write into consecutive range
+
+        ex) initializing region returned by `request_blocks`
+        :param key: field name
+        :param start: int, inclusive
+        :param stop: int, exclusive
+        :param value: value to write
+        :return:
+        """
+        self.__array[key][start:stop] = self._prepare_value(key, value)
+        self._mark_dirty(start, stop)
+
+    def write_blocks(self, key, blocks, values):
+        """
+        vectorized write of a value per block, same as `block[key] = value` for each pair
+
+        Single span blocks of the same size with values of the same shape are written at once,
+        else blocks are written one by one.
+        :param key: field name
+        :param blocks: (_Block, ...)
+        :param values: (value, ...), value of each block
+        :return:
+        """
+        blocks = list(blocks)
+        if not blocks:
+            return
+        size = len(blocks[0])
+        field_shape = self.__array.dtype[key].shape
+        try:
+            if any(len(b) != size or len(b.spans) != 1 for b in blocks):
+                raise ValueError
+            vals = np.asarray(values)
+            if vals.dtype == object or len(vals) != len(blocks):
+                raise ValueError
+            # align each value to its block as assignment broadcasting would
+            ndim = 1 + len(field_shape) - (vals.ndim - 1)
+            if ndim < 0:
+                raise ValueError
+            vals = vals.reshape(len(vals), *(1,) * ndim, *vals.shape[1:])
+            vals = np.broadcast_to(vals, (len(vals), size, *field_shape)).reshape(-1, *field_shape)
+        except ValueError:
+            for block, value in zip(blocks, values):
+                block[key] = value
+            return
+
+        starts = np.fromiter((b.spans[0][0] for b in blocks), dtype=np.int64, count=len(blocks))
+        indices = (starts[:, None] + np.arange(size)).ravel()
+        order = indices.argsort(kind='stable')
+        vals = self._prepare_value(key, vals[order])
+        indices = indices[order]
+        self.__array[key][indices] = vals
+        self._mark_dirty_indices(indices)
+
     def fill_array(self, v):
         """
         fill array with given value
@@ -195,7 +478,34 @@ class BffrCache(ArrayContainer):
         :param v:
         :return:
         """
+        v = self._prepare_value(None, v)
         self.__array[:] = v
+        self._mark_dirty(0, len(self.__array))
+
+    def _prepare_value(self, key, value):
+        """
+        hook adapting value right before it's written into the array
+
+        ! subclass may swap the array while preparing, so fetch array after calling this
+        :param key: field name or item the value is written into, None for the whole array
+        :param value: value to write
+        :return: value to write
+        """
+        return value
+
+    def _retype(self, dtype, def_val=None):
+        """
+        convert array into given dtype keeping values
+
+        Whole array becomes dirty so consumers reallocate and upload the converted array.
+        Blocks refer the cache not the array so they stay valid.
+        :param dtype: new structured dtype of the same fields
+        :param def_val: new value to fill vacant vertices with
+        :return:
+        """
+        self.__array = self.__array.astype(dtype)
+        self.__def_val = def_val
+        self._mark_dirty(0, len(self.__array))
 
     @property
     def active_size(self):
@@ -205,45 +515,103 @@ class BffrCache(ArrayContainer):
         ! this doesnt mean given size is tightly packed
         :return: None or int
         """
-        return self.__highest_indx + 1
+        return self.__free_space.tail
+
+    @property
+    def live_runs(self):
+        """
+        consecutive ranges in use, holes excluded
+
+        ! recalculated only when free space has changed
+        ex) drawing live ranges only by `glMultiDrawElements`
+        :return: (offsets, counts), int ndarrays of start index and size of each run
+        """
+        version, runs = self.__live_runs
+        if version != self.__free_space.version:
+            bounds = np.fromiter((v for hole in self.__free_space for v in hole), dtype=np.int64)
+            # runs lie between holes
+            starts = np.r_[0, bounds[1::2]]
+            stops = np.r_[bounds[0::2], len(self.__array)]
+            live = starts < stops
+            runs = starts[live], stops[live] - starts[live]
+            self.__live_runs = self.__free_space.version, runs
+        return runs
+
+    @property
+    def hole_ratio(self):
+        """
+        ratio of vacant vertices within active size
+
+        :return: float, 0 when active range is packed
+        """
+        active_size = self.active_size
+        if not active_size:
+            return 0.
+        return 1 - self.__num_vertex_inuse / active_size
 
     @property
     def blocks(self):
-        for b in self.__block_inuse:
+        for b in tuple(self.__block_inuse.values()):
             yield b
 
     def request_block(self, size) -> _Block:
         """
         get subarray not in use
 
-        ! returned block is guaranteed to fill in buffer holes from the front
+        ! returned block is guaranteed to fill in buffer holes from the front:
+        foremost(or smallest for BEST_FIT) hole that fits is taken, if no single hole fits
+        holes are taken from the front, array expands only when vacant vertices are not enough
         :return: _Block, consecutive vacant vertices from array of given size
         """
         if size == 0:
             raise ValueError
 
-        # find vacant indices
-        indices = []
-        while 0 < size:
-            if not self.__block_pool:
-                self.__expand_array()
-
-            s, e = self.__block_pool[0]
-            vacant_size = e - s
-            indices += list(range(s, min(e, s + size)))  # take as much as possible
-            if vacant_size <= size:  # vacant is fully taken
-                heapq.heappop(self.__block_pool)  # remove
-            else:  # vacant is partially taken
-                self.__block_pool[0] = (s + size, e)  # simply replace
-            size -= vacant_size
-
-        block = _Block(self, indices)
-        self.__block_inuse.push(block)  # pushing into skip list
+        block = _Block(self, self.__take_spans(size))
+        self.__block_inuse[block.high_indx] = block
         # update blocks inuse size
-        self.__num_vertex_inuse += len(indices)
-        self.__highest_indx = max(self.__highest_indx, indices[-1])
+        self.__num_vertex_inuse += size
         return block
 
+    def request_blocks(self, sizes):
+        """
+        get multiple subarrays not in use at once
+
+        Blocks are laid out back to back in a single consecutive region,
+        so the region can be filled by a single vectorized write. ex) `cache['idx'][start:stop] = ...`
+        :param sizes: (int, ...), size of each block
+        :return: (start, stop, [_Block, ...]), bounds of the whole region and blocks in the given order
+        """
+        sizes = np.asarray(sizes, dtype=np.int64)
+        if not len(sizes) or (sizes <= 0).any():
+            raise ValueError
+        total = int(sizes.sum())
+
+        # region has to be consecutive, expand so that the trailing hole fits if no hole fits
+        start = self.__free_space.first_fit(total)
+        if start is None:
+            trailing = self.__free_space.capacity - self.__free_space.tail
+            self.__expand_array(total - trailing + self.__free_space.total)
+            start = self.__free_space.first_fit(total)
+        self.__free_space.take_at(start, total)
+
+        stops = start + np.cumsum(sizes)
+        starts = stops - sizes
+        blocks = _Block._from_bounds(self, starts.tolist(), stops.tolist())
+        self.__block_inuse.update(zip((stops - 1).tolist(), blocks))
+        self.__num_vertex_inuse += total
+        return start, start + total, blocks
+
+    def __take_spans(self, size):
+        """
+        take vacant ranges following fit policy, expand only if free space is not enough
+
+        :param size: int, number of vertices to take
+        :return: [(start, stop), ...]
+        """
+        if self.__free_space.total < size:
+            self.__expand_array(size)
+        return self.__free_space.take(size)
+
     def _release_block(self, block, reset_val=None):
         """
         return block, release ownership of subarray
@@ -254,37 +622,24 @@ class BffrCache(ArrayContainer):
         :return:
         """
 
-        if block not in self.__block_inuse:
+        if self.__block_inuse.get(block.high_indx) is not block:
             raise ValueError('block not of this cache, please access via block.release()')
-        # reset val
-        if self.__def_val:
-            block[:] = self.__def_val
         # stop tracking
-        self.__block_inuse.remove(block)
+        del self.__block_inuse[block.high_indx]
 
+        # fill released with reset_val, else default value
+        if reset_val is not None:
+            reset_val = self._prepare_value(None, reset_val)
+        elif self.__def_val:
+            reset_val = self.__def_val
         # return into pool
-        s, e = None, None
-        for i in block.indices:  # if not modified illegally, indices are already sorted
-            # fill released with reset_val
+        for s, e in block.spans:
             if reset_val is not None:
-                self.array[i] = reset_val
-            # compact consecutive
-            if s is None:
-                s = e = i
-            elif i == e + 1:
-                e = i
-            else:  # consecutive finish, wrap as a block
-                heapq.heappush(self.__block_pool, (s, e + 1))  # start, stop
-                s = e = i  # start counting new consecutive
-        heapq.heappush(self.__block_pool, (s, e + 1))  # dont forget remaining
+                self.__array[s:e] = reset_val
+                self._mark_dirty(s, e)
+            self.__free_space.release(s, e)
         # count vertex in use
         self.__num_vertex_inuse -= len(block)
-        # update highest index
-        if block.indices[-1] == self.__highest_indx:
-            if self.__block_inuse:
-                self.__highest_indx = self.__block_inuse[-1].high_indx
-            else:
-                self.__highest_indx = -1  # 0 size
 
     def refill_foremost(self, reset_val=None):
         """
@@ -296,39 +651,102 @@ class BffrCache(ArrayContainer):
         :param reset_val: value to fill into released vertex
         :return: mapping info tuple((from indices...), (to indices...))
         """
+        remap = self.compact(max_blocks=1, reset_val=reset_val)
+        if remap:
+            return tuple(remap.src.tolist()), tuple(remap.trg.tolist())
 
-        # size can differ, last can be bigger than to fill and smaller or equal
-        if self.__block_pool[0][0] < self.active_size:  # cant be equal
-            src_block = self.__block_inuse[-1]
-            self._release_block(src_block)
-            src_idxs = src_block.indices
-            src_size = len(src_idxs)
-            # collect indicies
-            trg_idxs = []
-            while True:
-                start, stop = self.__block_pool[0]
-                left = src_size - (stop - start)
-                if 0 <= left:  # fully taken or need more
-                    heapq.heappop(self.__block_pool)
-                    trg_idxs += list(range(start, stop))
-                else:  # underflow
-                    self.__block_pool[0] = (start + src_size, stop)
-                    trg_idxs = list(range(start, start + src_size))
-                if left <= 0:
+    def compact(self, byte_budget=None, time_budget=None, max_blocks=None, reset_val=None, split=True):
+        """
+        move latest blocks into foremost holes until budget runs out
+
+        Incremental packing, call every frame to shrink `active_size` steadily.
+        Blocks are relocated one by one but data is moved in a single vectorized copy.
+        At least one block is moved if there is a hole to fill.
+
+        ! this changes the arrangement of the cache.
+        Caller has to patch values referring moved vertices using returned remap,
+        ex) `MetaIndxBffr.remap_indices(remap)`
+        ! with `split` block may end up in multiple spans, so never index its vertices by `low_indx` + offset
+          but through `indx_array`
+        :param byte_budget: stop after moving this many bytes, None for no limit
+        :param time_budget: stop after this many seconds, None for no limit
+        :param max_blocks: stop after moving this many blocks, None for no limit
+        :param reset_val: value to fill into vacated vertices
+        :param split: allow moved block to be split over holes,
+                      if False block is moved only into a single hole that fits, which keeps order of
+                      vertices consecutive for primitives like GL_LINES
+        :return: `IndxRemap`, old to new index mapping of moved vertices
+        """
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        src_parts, trg_parts, data_parts = [], [], []
+        moved_blocks = set()  # block moved twice in a batch would chain the mapping
+        moved_bytes = 0
+        while self.__block_inuse:
+            foremost = self.__free_space.foremost
+            if foremost is None or self.active_size <= foremost:
+                break
+            src_block = self.__block_inuse[self.active_size - 1]
+            if src_block in moved_blocks:
+                break
+            moved_blocks.add(src_block)
+            size = len(src_block)
+            if not split:
+                hole = self.__free_space.first_fit(size)
+                if hole is None or src_block.low_indx < hole:
                     break
-            # copy data, reset released, and reset indices
-            self.__array[trg_idxs] = self.__array[list(src_idxs)]
-            if reset_val:
-                self.__array[src_idxs] = reset_val
-            setattr(src_block, f"_{src_block.__class__.__name__[2:]}__indices", trg_idxs)  # bad hidden access
-            # relocated source block with new indices
-            self.__block_inuse.push(src_block)
-            if self.__block_inuse:
-                self.__highest_indx = self.__block_inuse[-1].high_indx
+            src_idxs = src_block.indx_array
+            data_parts.append(self.__array[src_idxs])  # copy, writing is deferred
+            # release and take, but without resetting values
+            del self.__block_inuse[src_block.high_indx]
+            for s, e in src_block.spans:
+                self.__free_space.release(s, e)
+            if split:
+                trg_spans = self.__free_space.take_front(size)
             else:
-                self.__highest_indx = -1
-
-            return tuple(src_idxs), tuple(trg_idxs)
+                trg_spans = self.__free_space.take_at(hole, size)
+            src_block._relocate(trg_spans)
+            # relocated source block with new indices
+            self.__block_inuse[src_block.high_indx] = src_block
+
+            src_parts.append(src_idxs)
+            trg_parts.append(src_block.indx_array)
+            moved_bytes += size * self.__array.itemsize
+            # check budget
+            if max_blocks is not None and max_blocks <= len(moved_blocks):
+                break
+            if byte_budget is not None and byte_budget <= moved_bytes:
+                break
+            if deadline is not None and deadline <= time.perf_counter():
+                break
+
+        if not src_parts:
+            return IndxRemap(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+        src_idxs, trg_idxs = np.concatenate(src_parts), np.concatenate(trg_parts)
+        # copy data, reset vacated
+        self.__array[trg_idxs] = np.concatenate(data_parts)
+        self._mark_dirty_indices(np.sort(trg_idxs))
+        reset_val = self._prepare_value(None, reset_val) if reset_val else self.__def_val
+        if reset_val:
+            # source can partially overlap with target
+            vacated = np.setdiff1d(src_idxs, trg_idxs, assume_unique=True)
+            self.__array[vacated] = reset_val
+            self._mark_dirty_indices(vacated)
+        return IndxRemap(src_idxs, trg_idxs)
+
+    def remap_values(self, field, remap):
+        """
+        replace values of a field, that refer to other cache's indices, in a single vectorized pass
+
+        ex) index cache remapping vertex indices after vertex cache compaction
+        :param field: str, name of the field to remap
+        :param remap: `IndxRemap`
+        :return:
+        """
+        if not remap:
+            return
+        values = self.__array[field][:self.active_size]
+        changed = remap.apply(values)
+        self._mark_dirty_indices(changed)
 
     @property
     def array(self):
@@ -350,6 +768,20 @@ class BffrCache(ArrayContainer):
     def gldtype(self):
         return npdtype_to_gldtype(self.__array.dtype)
 
+    @property
+    def free_space(self):
+        """
+        :return: `FreeSpace`, record of vacant ranges
+        """
+        return self.__free_space
+
+    @property
+    def fragmentation(self):
+        """
+        :return: float, 0 for a single hole and approaches 1 as free space breaks into tiny holes
+        """
+        return self.__free_space.fragmentation
+
     @property
     def num_vrtx_inuse(self):
         """
@@ -386,3 +818,87 @@ class BffrCache(ArrayContainer):
         :return:
         """
         raise NotImplementedError
+
+
+class IndxBffrCache(BffrCache):
+    """
+    Cache of vertex indices that starts narrow and widens itself on overflow
+
+    ! primitive restart value is the max of the index dtype(GL_PRIMITIVE_RESTART_FIXED_INDEX),
+    so the biggest index storable is one less.
+    Index is written as a plain int and `PRIMITIVE_RESTART_VAL` is written for restart regardless of dtype,
+    it is translated into restart value of the current dtype.
+    When an index doesn't fit, array is promoted into next wider dtype in place and
+    `gldtype` reports the new type.
+    """
+    DTYPES = (np.dtype(np.uint8), np.dtype(np.uint16), np.dtype(np.uint32))
+
+    def __init__(self, dtype='ushort', size=1):
+        """
+
+        :param dtype: initial index dtype, one of (ubyte, ushort, uint)
+        :param size: initial size of the array
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in self.DTYPES:
+            raise ValueError(f'index dtype has to be one of {self.DTYPES}')
+        super().__init__(np.dtype([('idx', dtype)]), (0,), size=size, def_val=self.restart_of(dtype))
+        self.fill_array(PRV)
+
+    @staticmethod
+    def restart_of(dtype):
+        """
+        :param dtype: index dtype
+        :return: int, primitive restart value of given dtype
+        """
+        return int(np.iinfo(dtype).max)
+
+    @property
+    def idx_dtype(self):
+        """
+        :return: current dtype of index field
+        """
+        return self.array.dtype['idx']
+
+    @property
+    def restart_val(self):
+        """
+        :return: int, primitive restart value of current dtype
+        """
+        return self.restart_of(self.idx_dtype)
+
+    def _prepare_value(self, key, value):
+        """
+        promote array if any index overflows and translate restart value
+
+        :param key: field name or item written into
+        :param value: indices to write
+        :return: indices fitting current dtype
+        """
+        value = np.asarray(value)
+        if value.dtype.names or value.dtype.kind not in 'ui' or not value.size:
+            return value
+        is_restart = value == PRV
+        biggest = value.max(where=~is_restart, initial=0)
+        if self.restart_val <= biggest:
+            self.__promote(biggest)
+        if is_restart.any():
+            value = np.where(is_restart, self.restart_val, value)
+        return value
+
+    def __promote(self, biggest):
+        """
+        widen array to the narrowest dtype that can hold given index
+
+        :param biggest: int, biggest index to store
+        :return:
+        """
+        for dtype in self.DTYPES[self.DTYPES.index(self.idx_dtype) + 1:]:
+            if biggest < self.restart_of(dtype):
+                break
+        else:
+            raise ValueError(f'index {biggest} can not be stored')
+        old_restart = self.restart_val
+        self._retype(np.dtype([('idx', dtype)]), def_val=self.restart_of(dtype))
+        idx = self.array['idx']
+        idx[idx == old_restart] = self.restart_val
@@ -4,7 +4,7 @@ from collections import namedtuple
 import ctypes
 
 from ckernel.render_context.opengl_context.entities.meta.base import OGLMetaEntity
-from ckernel.render_context.opengl_context.bffr_cache import BffrCache
+from ckernel.render_context.opengl_context.bffr_cache import BffrCache, IndxBffrCache
 from ckernel.render_context.opengl_context.translators import npdtype_to_gldtype
 from ckernel.constants import PRIMITIVE_RESTART_VAL as PRV
 import ckernel.render_context.opengl_context.opengl_hooker as gl
@@ -113,18 +113,28 @@ class MetaIndxBffr(_MetaBffr):
     Buffer of GL_ELEMENT_ARRAY_BUFFER
     """
 
-    def __init__(self, dtype: str):
+    def __init__(self, dtype: str = 'ushort'):
         """
 
-        :param dtype: str, describe IBO dtype, one of (uint, ushort, ubyte)
+        ! buffer is promoted into wider dtype automatically when index overflows,
+        always write `PRIMITIVE_RESTART_VAL` for restart, it's translated for current dtype
+        :param dtype: str, describe initial IBO dtype, one of (uint, ushort, ubyte)
         """
-        self.__cache = BffrCache(np.dtype([('idx', dtype)]), (0,), def_val=PRV)
-        self.__cache.fill_array(PRV)
+        self.__cache = IndxBffrCache(dtype)
 
     @property
     def target(self):
         return gl.GL_ELEMENT_ARRAY_BUFFER
 
+    def remap_indices(self, remap):
+        """
+        patch stored vertex indices after vertex cache is compacted
+
+        :param remap: `IndxRemap` returned by `BffrCache.compact`
+        :return:
+        """
+        self.__cache.remap_values('idx', remap)
+
     @property
     def cache(self):
         return self.__cache
@@ -139,6 +149,74 @@ class MetaIndxBffr(_MetaBffr):
         return bffr
 
 
+class MetaUfrmBffr(_MetaBffr):
+    """
+    Buffer of GL_UNIFORM_BUFFER
+
+    Holds a single std140 uniform block. Programs declaring the block of the same binding point
+    all read from this buffer once it's bound, so values are pushed once for all of them.
+    """
+
+    def __init__(self, dtype: np.dtype, binding: int):
+        """
+
+        :param dtype: std140 structured dtype of the block, ex) `UfrmBlockSchema.dtype`
+        :param binding: binding point of the block
+        """
+        if not (isinstance(dtype, np.dtype) and dtype.fields is not None):
+            raise StructuredDtypeError
+        self.__binding = binding
+        self.__cache = BffrCache(dtype, tuple(range(len(dtype.fields))))
+        self.__block = self.__cache.request_block(1)
+
+    @property
+    def target(self):
+        return gl.GL_UNIFORM_BUFFER
+
+    @property
+    def binding(self):
+        return self.__binding
+
+    @property
+    def cache(self):
+        return self.__cache
+
+    @property
+    def uniforms(self):
+        """
+        ex) ubo.uniforms['PM'] = camera.body.PM
+
+        :return: block of block members
+        """
+        return self.__block
+
+    def push_cache(self):
+        """
+        push modified members and bind buffer to its binding point
+
+        :return:
+        """
+        super().push_cache()
+        self.bind_base()
+
+    def bind_base(self):
+        """
+        bind buffer to binding point of the block
+
+        :return:
+        """
+        gl.glBindBufferBase(self.target, self.__binding, self.get_concrete())
+
+    def _create_entity(self):
+        """
+        :return:
+        """
+        bffr = gl.glGenBuffers(1)
+        bffr.set_target(self.target)
+        bffr.set_cache(self.__cache)
+        return bffr
+
+
 class MetaVrtxArry(OGLMetaEntity):
 
     def __init__(self, *bffrs, indx_bffr=None):
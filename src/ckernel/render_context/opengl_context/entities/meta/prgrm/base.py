@@ -1,4 +1,5 @@
 import os
+import weakref
 from collections import defaultdict
 import numpy as np
 import ckernel.render_context.opengl_context.opengl_hooker as gl
@@ -6,12 +7,58 @@ from ..base import OGLMetaEntity
 from ..error import *
 
 from .shdr_parser import SimpleShdrParser
-from .shdr_parser import VrtxAttrSchema, UfrmSchema
+from .shdr_parser import VrtxAttrSchema, UfrmSchema, UfrmBlockSchema
 from global_tools.lazy import lazyProp
 from ckernel.render_context.opengl_context.context_stack import get_current_ogl
 from ckernel.render_context.opengl_context.entities.meta.frame import MetaFrameBffr
 
 
+class _UfrmBlock:
+    """
+    Uniform values of a program recording modified fields
+
+    ex) prgrm.uniforms['MM'] = matrix
+
+    Field is recorded as modified only when its value actually changes,
+    so writing the same values every frame doesn't cause pushes.
+    Modified fields are recorded per consumer(concrete prgrm of each context).
+    """
+
+    def __init__(self, block, names):
+        """
+
+        :param block: `_Block` of uniform cache
+        :param names: (str, ...), names of all uniform fields
+        """
+        self.__block = block
+        self.__names = tuple(names)
+        self.__dirty = weakref.WeakKeyDictionary()  # {consumer: set(field name, ...)}
+
+    def __getitem__(self, name):
+        return self.__block[name]
+
+    def __setitem__(self, name, value):
+        old = self.__block[name].copy()
+        self.__block[name] = value
+        if not np.array_equal(old, self.__block[name]):
+            for names in self.__dirty.values():
+                names.add(name)
+
+    def pop_dirty_names(self, consumer):
+        """
+        return names of fields modified since last pop of given consumer and reset them
+
+        Consumer unknown to the block is considered to have never seen the values, so all names are returned.
+        :param consumer: weak referencable object, ex) concrete prgrm
+        :return: (name, ...)
+        """
+        names = self.__dirty.get(consumer)
+        self.__dirty[consumer] = set()
+        if names is None:
+            return self.__names
+        return names
+
+
 class MetaPrgrm(OGLMetaEntity):
 
     def __init__(self, vrtx_path=None, geom_path=None, frgm_path=None):
@@ -46,6 +93,10 @@ class MetaPrgrm(OGLMetaEntity):
     def ufrm_schema(self) -> UfrmSchema:
         return SimpleShdrParser.parse_uniforms(*[s for s, n in self.__shdr_srcs.values()])
 
+    @lazyProp
+    def ufrm_block_schemas(self) -> {str: UfrmBlockSchema}:
+        return SimpleShdrParser.parse_ufrm_blocks(*[s for s, n in self.__shdr_srcs.values()])
+
     @lazyProp
     def frgm_outputs(self):
         return SimpleShdrParser.parse_frgm_outputs(*self.__shdr_srcs[gl.GL_FRAGMENT_SHADER])
@@ -59,8 +110,17 @@ class MetaPrgrm(OGLMetaEntity):
         return self.ufrm_schema.create_bffr_cache(size=1)
 
     @lazyProp
-    def uniforms(self):
-        return self.__uniform_cache.request_block(size=1)
+    def uniforms(self) -> _UfrmBlock:
+        return _UfrmBlock(self.__uniform_cache.request_block(size=1), self.ufrm_schema.dtype.names)
+
+    @lazyProp
+    def __ufrm_setters(self):
+        """
+        uniform setters resolved once per field
+
+        :return: {name: (location, setter, is matrix)}
+        """
+        return self.__parse_ufrm_setters(self.__uniform_cache)
 
     def __read_source(self, file_path, shdr_type):
         """
@@ -106,30 +166,52 @@ class MetaPrgrm(OGLMetaEntity):
         return prgrm
 
     def push_uniforms(self):
+        """
+        push uniforms modified since last push
+
+        :return:
+        """
+        if self.ufrm_schema is None:  # all uniforms could be in uniform blocks
+            return
+        names = self.uniforms.pop_dirty_names(self.get_concrete())
+        if not names:
+            return
         with self:
-            self.__push_ufrms(self.__uniform_cache)
+            self.__push_ufrms(self.__uniform_cache, self.__ufrm_setters, names)
 
     def push_external_ufrm_cache(self, cache):
         with self:
-            self.__push_ufrms(cache)
+            setters = self.__parse_ufrm_setters(cache)
+            self.__push_ufrms(cache, setters, setters.keys())
 
-    def __push_ufrms(self, bffr_cache):
+    @staticmethod
+    def __push_ufrms(bffr_cache, setters, names):
         """
         push data into bound ogl prgrm
 
         :param bffr_cache: `_BffrCache`, data to push into ogl prgrm
+        :param setters: {name: (location, setter, is matrix)}
+        :param names: names of fields to push
         :return:
         """
-        for name, loc, shape, dtype, _, _ in bffr_cache.field_props:
-            func = self.__parse_ufrm_func(shape, dtype)
-            count = len(bffr_cache.array)
-            transpose = gl.GL_TRUE
-            value = bffr_cache.array[name]
-            is_matrix = len(shape) == 2
+        count = len(bffr_cache.array)
+        for name in names:
+            loc, setter, is_matrix = setters[name]
             if is_matrix:
-                func(loc, count, transpose, value)
+                setter(loc, count, gl.GL_TRUE, bffr_cache.array[name])
             else:
-                func(loc, count, value)
+                setter(loc, count, bffr_cache.array[name])
+
+    @classmethod
+    def __parse_ufrm_setters(cls, bffr_cache):
+        """
+        resolve uniform setter of each field
+
+        :param bffr_cache: `_BffrCache`, uniform cache
+        :return: {name: (location, setter, is matrix)}
+        """
+        return {name: (loc, cls.__parse_ufrm_func(shape, dtype), len(shape) == 2)
+                for name, loc, shape, dtype, _, _ in bffr_cache.field_props}
 
     @staticmethod
     def __parse_ufrm_func(shape, dtype):
@@ -185,7 +267,7 @@ class MetaPrgrm(OGLMetaEntity):
             t = 'i'
         else:
             raise NotImplementedError
-        return eval(f"gl.glUniform{m}{d}{t}v")
+        return getattr(gl, f"glUniform{m}{d}{t}v")
 
     # attachers
     def attach_vrtx_shdr(self, shader_path):
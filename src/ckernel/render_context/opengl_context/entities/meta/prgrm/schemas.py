@@ -1,5 +1,5 @@
 from ckernel.render_context.opengl_context.bffr_cache import BffrCache
-from ckernel.render_context.opengl_context.entities.meta.others import MetaVrtxBffr
+from ckernel.render_context.opengl_context.entities.meta.others import MetaVrtxBffr, MetaUfrmBffr
 from ckernel.render_context.opengl_context.entities.draw_bffr import DrawBffr
 
 import numpy as np
@@ -104,6 +104,44 @@ class UfrmSchema(_GLSLParamSchema):
         return cache
 
 
+class UfrmBlockSchema(_GLSLParamSchema):
+    """
+    Uniform block skema
+
+    Describes std140 layout of a uniform block.
+    """
+
+    def __init__(self, name, dtype, binding):
+        self._name = name
+        self._dtype = dtype
+        self._binding = binding
+        self._locs = tuple(range(len(dtype.names)))
+
+    def __eq__(self, other):
+        if not isinstance(other, UfrmBlockSchema):
+            return False
+        return (self._name, self._dtype, self._binding) == (other._name, other._dtype, other._binding)
+
+    def __hash__(self):
+        return hash((self._name, self._binding))
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def binding(self):
+        return self._binding
+
+    def create_ufrm_bffr(self) -> MetaUfrmBffr:
+        """
+        create uniform buffer factory of the block
+
+        :return:
+        """
+        return MetaUfrmBffr(self._dtype, self._binding)
+
+
 class FrgmOutputSchema(_GLSLParamSchema):
     def __init__(self, dtype: np.dtype, locs: (tuple, list)):
         # useless for now
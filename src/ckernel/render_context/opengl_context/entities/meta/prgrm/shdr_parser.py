@@ -81,6 +81,41 @@ class SimpleShdrParser:
 ;                       # end of statement
     """, re.VERBOSE | re.MULTILINE)
 
+    __ufrm_block_patt = re.compile("""
+    ^                               # begining of a line
+    [ ]*                            # witespace
+        layout                      # keyword
+    [ ]*                            # witespace
+        \(                          # parenthesis
+            (?P<qualifiers>         # grouping
+                [^)]*               # layout qualifiers, ex) std140, row_major, binding = 0
+            )
+        \)
+    [ ]*                            # witespace
+        uniform                     # keyword
+    [ ]+                            # one or more witespace
+        (?P<name>                   # grouping
+            [a-zA-Z]+[\w]*          # block name starting with alph
+        )
+    \s*\{                           # opening brace
+        (?P<members>                # grouping
+            [^}]*                   # member declarations
+        )
+    \}[ ]*                          # closing brace
+;                       # end of statement, ! instance name is not supported
+    """, re.VERBOSE | re.MULTILINE)
+
+    __block_member_patt = re.compile("""
+        (?P<dtype>                  # grouping
+            [a-zA-Z]+[\w]*          # type name starting with alph
+        )
+        \s+                         # one or more witespace
+        (?P<name>                   # grouping
+            [a-zA-Z]+[\w]*          # var name starting with alph
+        )
+        \s*;                        # end of statement
+        """, re.VERBOSE)
+
     __frgm_output_patt = re.compile("""
         ^                           # begining of a line
         (                           # optional layout
@@ -219,6 +254,80 @@ class SimpleShdrParser:
         else:
             return None
 
+    @classmethod
+    def parse_ufrm_blocks(cls, *sources):
+        """
+        parse uniform blocks into std140 structured dtype
+
+        ! uniform block must declare std140 layout and binding point,
+        and row_major if it has matrix members as numpy arrays are row major
+        ! block has to be anonymous so members are accessed by their names as plain uniforms
+        :param sources: (str, ...), shader sources
+        :return: {block name: UfrmBlockSchema}
+        """
+        blocks = {}
+        for src in sources:
+            for m in re.finditer(cls.__ufrm_block_patt, src):
+                d = m.groupdict()
+                qualifiers = [q.replace(' ', '') for q in d['qualifiers'].split(',')]
+                if 'std140' not in qualifiers:
+                    raise SyntaxError(f"{d['name']} <- uniform block has to be std140 layout")
+                bindings = [int(q.split('=')[1]) for q in qualifiers if q.startswith('binding=')]
+                if not bindings:
+                    raise SyntaxError(f"{d['name']} <- uniform block's binding not declared")
+
+                # strip comments then parse members
+                members = re.sub(r'//.*', '', d['members'])
+                fields = []
+                for mm in re.finditer(cls.__block_member_patt, members):
+                    if mm.group('dtype').startswith('mat') and 'row_major' not in qualifiers:
+                        raise SyntaxError(f"{d['name']} <- uniform block with matrix has to be row_major")
+                    fields.append(cls.__translate_dtype(mm.group('name'), mm.group('dtype')))
+                schema = UfrmBlockSchema(d['name'], cls.__std140_dtype(fields), bindings[0])
+
+                if d['name'] in blocks and blocks[d['name']] != schema:
+                    raise Exception(f"uniform block {d['name']} contradictory")
+                blocks[d['name']] = schema
+        return blocks
+
+    @staticmethod
+    def __std140_dtype(fields):
+        """
+        place fields following std140 layout rule
+
+        :param fields: [(name, dtype, shape), ...], numpy dtype field descriptions
+        :return: numpy structured dtype with explicit offsets
+        """
+        names, formats, offsets = [], [], []
+        offset = 0
+        for name, dtype, *shape in fields:
+            shape = shape[0] if shape else ()
+            shape = (shape,) if isinstance(shape, int) else shape
+            base = np.dtype(dtype)
+            if base == np.bool_:  # glsl bool is 4 bytes
+                base = np.dtype('uint32')
+            elif base.kind in 'iu':
+                base = np.dtype(f'{base.kind}4')
+            if base.itemsize != 4:
+                raise NotImplementedError('only 4 bytes components are supported in uniform block')
+            if len(shape) == 2 and shape != (4, 4):
+                raise NotImplementedError('only mat4 is supported in uniform block')
+            # scalar and vec2 align to their size, others to vec4
+            if not shape:
+                size = align = 4
+            elif len(shape) == 1:
+                size = 4 * shape[0]
+                align = 8 if shape[0] == 2 else 16
+            else:
+                size, align = 64, 16
+            offset = -(-offset // align) * align
+            names.append(name)
+            formats.append((base, shape) if shape else base)
+            offsets.append(offset)
+            offset += size
+        itemsize = -(-offset // 16) * 16  # block size rounds up to vec4
+        return np.dtype({'names': names, 'formats': formats, 'offsets': offsets, 'itemsize': itemsize})
+
     @classmethod
     def parse_frgm_outputs(cls, frgm_src, name):
         """
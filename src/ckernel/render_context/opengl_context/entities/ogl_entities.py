@@ -138,6 +138,7 @@ class _Bffr(OGLEntity):
         self.__target = None
         self.__usage = gl.GL_DYNAMIC_DRAW
         self.__cache = None
+        self.__allocated = 0  # bytesize of ogl buffer storage
 
     def __str__(self):
         return f"<Buffer: {self.__id}>"
@@ -154,18 +155,31 @@ class _Bffr(OGLEntity):
 
     def push_cache(self):
         """
-        push whole data of given array into ogl buffer
+        push modified data of given array into ogl buffer
 
+        Storage is reallocated only when cache array has grown, whole array is pushed then.
+        Else only dirty ranges of the cache are pushed via sub data.
         :return:
         """
         if self.__cache is None:
             raise NotImplementedError
 
+        array = self.__cache.array
+        dirty = self.__cache.pop_dirty_ranges(self)
         with self as bffr:
-            gl.glBufferData(target=bffr.__target,
-                            size=self.__cache.active_bytesize,
-                            data=self.__cache.array,
-                            usage=bffr.__usage)
+            if self.__allocated < array.nbytes:
+                gl.glBufferData(target=bffr.__target,
+                                size=array.nbytes,
+                                data=array,
+                                usage=bffr.__usage)
+                self.__allocated = array.nbytes
+            else:
+                itemsize = array.itemsize
+                for start, stop in dirty:
+                    gl.glBufferSubData(bffr.__target,
+                                       start * itemsize,
+                                       (stop - start) * itemsize,
+                                       array[start:stop])
             # unbinding needed? does vao affected by vbo binding before its binding?
 
     def set_target(self, target):
@@ -0,0 +1,279 @@
+import numpy as np
+
+from global_tools.red_black_tree import RedBlackTree
+
+
+class FreeSpace:
+    """
+    Free range manager of a linear array
+
+    ! vocabulary:
+        hole: vacant consecutive range (start, stop)
+
+    Holes are always coalesced with adjacent holes when released
+    so the array doesn't fragment into tiny holes.
+
+    Holes are recorded in:
+        1. dicts mapping start->stop and stop->start for O(1) neighbor coalescing
+        2. max segment tree over addresses for O(log n) foremost fitting hole search
+        3. red black tree of (size, start) for O(log n) best fit search, only when best fit policy is used
+    """
+    FIRST_FIT, BEST_FIT = 'FIRST_FIT', 'BEST_FIT'
+
+    def __init__(self, capacity, policy=FIRST_FIT):
+        if policy not in (self.FIRST_FIT, self.BEST_FIT):
+            raise ValueError('policy has to be one of FIRST_FIT, BEST_FIT')
+        self.__policy = policy
+
+        self.__by_start = {}
+        self.__by_stop = {}
+        self.__by_size = RedBlackTree()
+        self.__total = 0
+        self.__version = 0  # bumped whenever holes change
+
+        self.__capacity = 0
+        self.__num_leaves = 1
+        self.__tree = [0, 0]
+        self.grow(capacity)
+
+    def __len__(self):
+        return len(self.__by_start)
+
+    def __iter__(self):
+        """
+        iter holes in address order
+
+        :return:
+        """
+        for s in sorted(self.__by_start):
+            yield s, self.__by_start[s]
+
+    def __str__(self):
+        return f"<FreeSpace {self.__policy} holes:{len(self)} free:{self.__total}/{self.__capacity}>"
+
+    @property
+    def policy(self):
+        return self.__policy
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+    @property
+    def version(self):
+        """
+        :return: int, changes whenever holes change, for caching values derived from holes
+        """
+        return self.__version
+
+    @property
+    def total(self):
+        """
+        :return: int, number of vacant vertices
+        """
+        return self.__total
+
+    @property
+    def largest(self):
+        """
+        :return: int, size of the biggest hole
+        """
+        return self.__tree[1]
+
+    @property
+    def tail(self):
+        """
+        :return: start of the trailing hole which ends at capacity, capacity if the last vertex is taken
+        """
+        return self.__by_stop.get(self.__capacity, self.__capacity)
+
+    @property
+    def foremost(self):
+        """
+        :return: start of the foremost hole, None if there is no hole
+        """
+        leaf = self.__search_leftmost(1)
+        if leaf is None:
+            return None
+        return leaf - self.__num_leaves
+
+    @property
+    def fragmentation(self):
+        """
+        how much free space is broken into pieces
+
+        0 when free space is a single hole(or none), approaches 1 as holes get tinier
+        :return: float, 1 - largest hole / total free
+        """
+        if not self.__total:
+            return 0.
+        return 1 - self.largest / self.__total
+
+    def grow(self, capacity):
+        """
+        extend the space, appended range becomes vacant
+
+        :param capacity: new capacity
+        :return:
+        """
+        if capacity < self.__capacity:
+            raise ValueError('space can not shrink')
+        old_cap = self.__capacity
+        self.__capacity = capacity
+        # rebuild tree if leaves overflow
+        if self.__num_leaves < capacity:
+            num_leaves = 1 << (capacity - 1).bit_length()
+            leaves = np.zeros(num_leaves, dtype=np.int64)
+            for s, e in self.__by_start.items():
+                leaves[s] = e - s
+            levels = [leaves]
+            while len(levels[-1]) != 1:
+                levels.append(levels[-1].reshape(-1, 2).max(axis=1))
+            self.__tree = [0] + np.concatenate(levels[::-1]).tolist()
+            self.__num_leaves = num_leaves
+        if old_cap < capacity:
+            self.release(old_cap, capacity)
+
+    def take(self, size):
+        """
+        take vacant ranges of given size
+
+        Hole that fits is searched following the policy.
+        If no single hole fits, holes are taken from the front.
+        :param size: int, number of vertices to take
+        :return: [(start, stop), ...] sorted ranges taken, None if total free is not enough
+        """
+        if self.__total < size:
+            return None
+        if self.__policy == self.FIRST_FIT:
+            start = self.first_fit(size)
+        else:
+            # smallest hole not smaller than size, start of hole is never negative
+            fit = self.__by_size.search_greater((size, -1)) if len(self.__by_size) else None
+            start = None if fit is None else fit[1]
+        if start is None:
+            return self.take_front(size)
+        self.__split(start, start + size)
+        return [(start, start + size)]
+
+    def take_at(self, start, size):
+        """
+        take vacant range from the front of the hole beginning at given start
+
+        :param start: start of the hole
+        :param size: int, number of vertices to take
+        :return: [(start, stop)]
+        """
+        if self.__by_start.get(start, start) - start < size:
+            raise ValueError('hole not found or too small')
+        self.__split(start, start + size)
+        return [(start, start + size)]
+
+    def first_fit(self, size):
+        """
+        search foremost hole that fits without taking it
+
+        :param size: int, number of vertices to fit
+        :return: start of the hole, None if not found
+        """
+        leaf = self.__search_leftmost(size)
+        if leaf is None:
+            return None
+        return leaf - self.__num_leaves
+
+    def take_front(self, size):
+        """
+        take vacant ranges of given size beginning from the foremost hole
+
+        :param size: int, number of vertices to take
+        :return: [(start, stop), ...] sorted ranges taken, None if total free is not enough
+        """
+        if self.__total < size:
+            return None
+        spans = []
+        while 0 < size:
+            start = self.foremost
+            stop = min(self.__by_start[start], start + size)
+            self.__split(start, stop)
+            spans.append((start, stop))
+            size -= stop - start
+        return spans
+
+    def release(self, start, stop):
+        """
+        return range as vacant, coalescing with adjacent holes
+
+        :param start: int, inclusive
+        :param stop: int, exclusive
+        :return:
+        """
+        if stop <= start:
+            return
+        self.__total += stop - start
+        # coalesce with left and right neighbors
+        if start in self.__by_stop:
+            left = self.__by_stop[start]
+            self.__remove_hole(left)
+            start = left
+        if stop in self.__by_start:
+            right_stop = self.__by_start[stop]
+            self.__remove_hole(stop)
+            stop = right_stop
+        self.__add_hole(start, stop)
+
+    def __split(self, start, stop):
+        """
+        take [start, stop) from the hole beginning at start
+
+        :return:
+        """
+        hole_stop = self.__by_start[start]
+        self.__remove_hole(start)
+        if stop < hole_stop:
+            self.__add_hole(stop, hole_stop)
+        self.__total -= stop - start
+
+    def __add_hole(self, start, stop):
+        self.__version += 1
+        self.__by_start[start] = stop
+        self.__by_stop[stop] = start
+        self.__update_leaf(start, stop - start)
+        if self.__policy == self.BEST_FIT:
+            self.__by_size.insert((stop - start, start))
+
+    def __remove_hole(self, start):
+        self.__version += 1
+        stop = self.__by_start.pop(start)
+        del self.__by_stop[stop]
+        self.__update_leaf(start, 0)
+        if self.__policy == self.BEST_FIT:
+            self.__by_size.delete((stop - start, start))
+
+    def __update_leaf(self, addr, val):
+        tree = self.__tree
+        i = addr + self.__num_leaves
+        tree[i] = val
+        i >>= 1
+        while i:
+            l, r = tree[2 * i], tree[2 * i + 1]
+            m = l if r < l else r
+            if tree[i] == m:  # ancestors unaffected
+                break
+            tree[i] = m
+            i >>= 1
+
+    def __search_leftmost(self, size):
+        """
+        search leftmost leaf of value bigger or equal to given size
+
+        :return: tree index of the leaf, None if not found
+        """
+        tree = self.__tree
+        if tree[1] < size:
+            return None
+        i = 1
+        while i < self.__num_leaves:
+            i *= 2
+            if tree[i] < size:
+                i += 1
+        return i
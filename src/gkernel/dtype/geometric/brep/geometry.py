@@ -1,4 +1,5 @@
-from global_tools.red_black_tree import RedBlackTree
+from global_tools.spatial_hash import SpatialHash
+from gkernel.constants import ATOL
 import gkernel.dtype.geometric.primitive as pgt
 
 
@@ -7,12 +8,15 @@ class Geometries:
     stores geometric entities
     Think this as mere database
 
+    Points and curves are indexed per class in `SpatialHash`,
+    points by their coordinates and curves by coordinates of their end points,
+    so coincident lookup is O(1) expected.
     """
     def __init__(self, brep):
         self.__brep = brep
         self.__surface = {}
-        self.__curve = {}
-        self.__point = {}
+        self.__curve = {}   # {class: SpatialHash}
+        self.__point = {}   # {class: SpatialHash}
 
     def __str__(self):
         return f"<BrepGeometry s:{self.num_surfaces} c:{self.num_curves} p:{self.num_points}>"
@@ -33,10 +37,7 @@ class Geometries:
         :param pnt:
         :return:
         """
-        if pnt.__class__ not in self.__point:
-            return True
-        else:  # checking red black tree
-            return not self.__point[pnt.__class__].has_value(pnt)
+        return self.get_coinoident_point(pnt) is None
 
     @property
     def num_surfaces(self):
@@ -61,12 +62,25 @@ class Geometries:
     def iter_surfaces(self):
         raise NotImplementedError
 
+    @staticmethod
+    def __pnt_key(pnt):
+        return pnt.xyz
+
+    @staticmethod
+    def __curve_key(curve):
+        return curve.start.xyz + curve.end.xyz
+
+    def __hash_of(self, table, cls):
+        if cls not in table:
+            table[cls] = SpatialHash(ATOL)
+        return table[cls]
+
     def add_point(self, pnt):
         """
         register point
         :return:
         """
-        self.__point.setdefault(pnt.__class__, RedBlackTree()).insert(pnt)
+        self.__hash_of(self.__point, pnt.__class__).insert(self.__pnt_key(pnt), pnt)
         return pnt
 
     def addnew_curve(self, curve):
@@ -80,22 +94,20 @@ class Geometries:
 
         # 0. check existence
         pcurve = self.get_coinoident_curve(curve)
-        pstart = self.get_coinoident_curve(start)
-        pend = self.get_coinoident_curve(end)
+        pstart = self.get_coinoident_point(start)
+        pend = self.get_coinoident_point(end)
         if all([g is not None for g in (pcurve, pstart, pend)]):
             raise Exception('trying to register pre-existing curve')
 
         # 1. check coinoident edge
-        if not pcurve:
-            self.__curve.setdefault(curve.__class__, []).append(curve)
+        if pcurve is None:
+            self.__hash_of(self.__curve, curve.__class__).insert(self.__curve_key(curve), curve)
             pcurve = curve
         # 2. check coinoident points
-        if not pstart:
-            self.__point.setdefault(start.__class__, RedBlackTree()).insert(start)
-            pstart = start
-        if not pend:
-            self.__point.setdefault(start.__class__, RedBlackTree()).insert(end)
-            pend = end
+        if pstart is None:
+            pstart = self.add_point(start)
+        if pend is None:
+            pend = self.add_point(end)
 
         return pcurve, pstart, pend
 
@@ -107,12 +119,8 @@ class Geometries:
 
         :return:
         """
-        present = self.get_coinoident_curve(curve)
-        if present:
-            return present
-        else:
-            self.__curve.setdefault(curve.__class__, []).append(curve)
-            return curve
+        table = self.__hash_of(self.__curve, curve.__class__)
+        return table.find_or_insert(self.__curve_key(curve), curve)[0]
 
     def __getadd_point(self, point):
         """
@@ -123,12 +131,8 @@ class Geometries:
         :param point:
         :return:
         """
-        present = self.get_coinoident_point(point)
-        if present:
-            return present
-        else:
-            self.__point.setdefault(point.__class__, RedBlackTree()).insert(point)
-            return point
+        table = self.__hash_of(self.__point, point.__class__)
+        return table.find_or_insert(self.__pnt_key(point), point)[0]
 
     def get_coinoident_curve(self, curve):
         """
@@ -140,22 +144,18 @@ class Geometries:
         # if no record of its kind
         if curve.__class__ not in self.__curve:
             return None
-        # if using RBtree, objects has to have ==, <
-        # but is it logical for geometry have such operations?
-        # line can be sorted but curves cant
-        # what data structure can be used to speed up searching?
-        for obj in self.__curve[curve.__class__]:
-            if obj == curve:
-                return obj
-        return None
+        # ! only end points are compared, curves of same class sharing end points are considered coincident
+        return self.__curve[curve.__class__].find(self.__curve_key(curve))
 
     def get_coinoident_point(self, point):
+        """
+        check if point pre exists
+
+        :param point:
+        :return: pre existing point or None
+        """
         if point.__class__ not in self.__point:
             return None
-
-        for obj in self.__point.get(point.__class__, []):
-            if obj == point:
-                return point
-        return None
+        return self.__point[point.__class__].find(self.__pnt_key(point))
 
 
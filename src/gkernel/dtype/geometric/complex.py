@@ -1,13 +1,14 @@
 from numbers import Number
+from math import inf, hypot
 from collections import Counter
 import numpy as np
 
 from gkernel.array_like import ArrayLikeData
-from gkernel.constants import DTYPE, DUNIT
+from gkernel.constants import DTYPE, DUNIT, ATOL
 from global_tools.singleton import Singleton
 from global_tools.red_black_tree import RedBlackTree
 
-from .primitive import Pnt, Vec, Pln, Lin, ZVec, ZeroVec
+from .primitive import Pnt, Vec, Pln, Lin, ZVec, ZeroVec, PntArray
 
 
 class Plin(ArrayLikeData):
@@ -38,12 +39,11 @@ class Plin(ArrayLikeData):
 
     def vertices(self):
         """
-        generator of polyline vertices
+        polyline vertices
 
-        :return:
+        :return: PntArray, iterates as Pnt
         """
-        for i in range(self.shape[1]):
-            yield Pnt(x=self[0, i], y=self[1, i], z=self[2, i])
+        return PntArray.from_array(self)
 
     def length(self):
         raise NotImplementedError
@@ -101,6 +101,7 @@ class Pgon(ArrayLikeData):
         * first vertex lying on WCS origin(0, 0, 0) and
         * first edge lying on WCS X axis
 
+        ! validates, raises ValueError if polygon is not planar or edges intersect
         :return:
         """
         self.__normalize()
@@ -119,23 +120,32 @@ class Pgon(ArrayLikeData):
 
     def __calc_normal(self):
         """
-        calculate normal vector
+        calculate normal vector by Newell's method
 
         ref: https://stackoverflow.com/questions/22838071/robust-polygon-normal-calculation
         :return:
         """
-        norm = ZeroVec()
-        for a, b in zip(self[:3, :-1].T, self[:3, 1:].T):
-            norm += Vec.cross(Pnt(*a), Pnt(*b))
-        return norm.normalize()
-
-    def __normalize(self):
+        vrtxs = self.view(np.ndarray)[:3]
+        vrtxs = (vrtxs - vrtxs[:, :1]).T  # relative to the first vertex for precision far from origin
+        normal = np.cross(vrtxs[:-1], vrtxs[1:]).sum(axis=0)
+        length = np.linalg.norm(normal)
+        if length <= ATOL:
+            # zero area like figure eight, take the widest span from the first edge
+            crosses = np.cross(vrtxs[1], vrtxs[2:-1])
+            normal = crosses[np.linalg.norm(crosses, axis=1).argmax()]
+            length = np.linalg.norm(normal)
+        if length <= ATOL:
+            raise ValueError('degenerate polygon has no normal')
+        return Vec(*(normal / length))
+
+    def __normalize(self, is_checking=True):
         """
         store normalized
 
+        :param is_checking: raise if edges intersect
         :return:
         """
-        if not (self[:3, 0] == self[:3, -1]).all:
+        if not (self[:3, 0] == self[:3, -1]).all():
             raise ValueError('first and last vertex has to be identical')
         # find z
         axis_z = self.__calc_normal()
@@ -150,20 +160,129 @@ class Pgon(ArrayLikeData):
         self.__normalized = pln.TM.I * self.view(np.ndarray)
         if not self.__test_planarity():
             raise ValueError('given vertices not planar')
+        if is_checking:
+            found = self.__sweep_intersections()
+            if found:
+                raise ValueError(f'polygon not simple, edges intersecting: {found}')
 
+    def __tol(self):
+        """
+        tolerance scaled by the size of polygon
+
+        :return:
+        """
+        return ATOL * max(1, np.ptp(self.__normalized[:2], axis=1).max())
 
     def __test_planarity(self):
         """
-        mytest is polygon is planner
+        test if every vertex lies on the plane within tolerance
 
         :return:
         """
         if self.__normalized is None:
             raise Exception('object not normalized')
-        return (self.__normalized[3] == 0).all
+        return (np.abs(self.__normalized[2]) <= self.__tol()).all()
+
+    def self_intersections(self):
+        """
+        find intersecting edges by Shamos-Hoey sweep in O(n log n)
+
+        Edge i runs from vertex i to vertex i+1, adjacent edges count only when folding back onto each other.
+        ! sweep stops at the first event meeting intersection so not every pair is reported,
+          empty list means polygon is simple
+        :return: [(i, j), ...] sorted intersecting edge index pairs
+        """
+        self.__normalize(is_checking=False)
+        return self.__sweep_intersections()
+
+    def __sweep_intersections(self):
+        """
+        ! has to be normalized
+        :return: [(i, j), ...] sorted intersecting edge index pairs
+        """
+        arr = self.__normalized[:2]
+        xs, ys = arr.tolist()
+        tol = self.__tol()
+        num_edges = len(xs) - 1
+
+        # left and right end of edges in sweep order
+        is_flipped = np.lexsort((arr[1], arr[0])).argsort()
+        is_flipped = (is_flipped[1:] < is_flipped[:-1])
+        lft = np.arange(num_edges) + is_flipped
+        rgt = np.arange(num_edges) + ~is_flipped
+        lx, ly, rx, ry = arr[0, lft], arr[1, lft], arr[0, rgt], arr[1, rgt]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slopes = np.where(lx == rx, inf, (ry - ly) / (rx - lx)).tolist()
+        lx, ly, rx, ry = lx.tolist(), ly.tolist(), rx.tolist(), ry.tolist()
+
+        def key(e, x, y):
+            # y of edge at sweep line, vertical edge is clamped to the sweep point
+            if slopes[e] == inf:
+                return min(max(y, ly[e]), ry[e])
+            return ly[e] + (x - lx[e]) * slopes[e]
+
+        def bisect_status(x, y, slope):
+            # index of the first edge not below (y, slope) at sweep line
+            lo, hi = 0, len(status)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                e = status[mid]
+                if (key(e, x, y), slopes[e]) < (y, slope):
+                    lo = mid + 1
+                else:
+                    hi = mid
+            return lo
+
+        def side(a, b, c):
+            # signed distance of c from line ab, 0 within tolerance
+            dx, dy = xs[b] - xs[a], ys[b] - ys[a]
+            d = (dx * (ys[c] - ys[a]) - dy * (xs[c] - xs[a])) / hypot(dx, dy)
+            return 0 if abs(d) <= tol else d
+
+        def within(a, b, c):
+            # collinear c lies within bounding box of ab
+            return (min(xs[a], xs[b]) - tol <= xs[c] <= max(xs[a], xs[b]) + tol and
+                    min(ys[a], ys[b]) - tol <= ys[c] <= max(ys[a], ys[b]) + tol)
+
+        def is_intersecting(e, f):
+            if f < e:
+                e, f = f, e
+            if f - e == 1 or (e == 0 and f == num_edges - 1):  # adjacent, test folding
+                p, q, r = (e, f, f + 1) if f - e == 1 else (f, e, e + 1)
+                dot = (xs[q] - xs[p]) * (xs[r] - xs[q]) + (ys[q] - ys[p]) * (ys[r] - ys[q])
+                return side(p, q, r) == 0 and dot < 0
+            p0, p1, q0, q1 = e, e + 1, f, f + 1
+            d0, d1 = side(q0, q1, p0), side(q0, q1, p1)
+            d2, d3 = side(p0, p1, q0), side(p0, p1, q1)
+            if d0 * d1 < 0 and d2 * d3 < 0:
+                return True
+            return ((d0 == 0 and within(q0, q1, p0)) or (d1 == 0 and within(q0, q1, p1)) or
+                    (d2 == 0 and within(p0, p1, q0)) or (d3 == 0 and within(p0, p1, q1)))
+
+        def test(*pairs):
+            return sorted({(min(e, f), max(e, f)) for e, f in pairs if is_intersecting(e, f)})
+
+        # at the same point insertion precedes deletion
+        events = [(x, y, 0, e) for e, (x, y) in enumerate(zip(lx, ly))]
+        events += [(x, y, 1, e) for e, (x, y) in enumerate(zip(rx, ry))]
+        events.sort()
+
+        status = []  # edges sorted by y at sweep line
+        for x, y, is_leaving, e in events:
+            if is_leaving:
+                # leaving edge ends at sweep point, look up from just below it
+                i = bisect_status(x, y - tol, -inf)
+                i = status.index(e, i)
+                found = test((status[i - 1], status[i + 1])) if 0 < i < len(status) - 1 else []
+                del status[i]
+            else:
+                i = bisect_status(x, y, slopes[e])
+                status.insert(i, e)
+                found = test(*((e, status[j]) for j in (i - 1, i + 1) if 0 <= j < len(status)))
+            if found:
+                return found
+        return []
 
-    def __test_intersection(self):
-        raise NotImplementedError('shamos-Hoey algorithm needed')
 
 # this should be subclass of polygon
 # class Rect(ArrayLikeData):
@@ -7,7 +7,7 @@ import numpy as np
 from global_tools.singleton import Singleton
 from global_tools.lazy import lazyProp
 from gkernel.constants import DTYPE
-from gkernel.dtype.nongeometric.matrix.primitive import TrnsfMats, RotXMat, RotYMat, RotZMat, MoveMat
+from gkernel.dtype.nongeometric.matrix.primitive import TrnsfMats, RotXMat, RotYMat, RotZMat, MoveMat, RigidMat
 from gkernel.array_like import ArrayLikeData
 from gkernel.constants import ATOL
 
@@ -22,8 +22,8 @@ class Mat1(ArrayLikeData):
         :return:
         """
         if not (set(item) - {'x', 'y', 'z', 'w'}):
-            d = dict(zip('xyzw', self[:, 0].tolist()))
-            vs = tuple(d[c] for c in item)
+            coords = self.view(np.ndarray)[:, 0].tolist()
+            vs = tuple(coords['xyzw'.index(c)] for c in item)
             return vs[0] if len(vs) == 1 else vs
         return super().__getattribute__(item)
 
@@ -346,7 +346,6 @@ class Vec(Mat1, VecConv, PntConv):
         """
         self.__clean_cache = True
         self.__length = None
-        self.__s = Pnt(0, 0, 0)
 
     def __str__(self):
         return f"<{self.__class__.__name__} : {[round(n, 3) for n in self[:3, 0]]}>"
@@ -379,8 +378,7 @@ class Vec(Mat1, VecConv, PntConv):
 
     @property
     def vertices(self):
-        self.__e = self.as_pnt()
-        return self.__s, self.__e
+        return Pnt(0, 0, 0), self.as_pnt()
 
     @classmethod
     def cross(cls, a, b):
@@ -692,6 +690,300 @@ class Pnt(Mat1, VecConv, PntConv):
         return self
 
 
+class _Mat1Array(ArrayLikeData):
+    """
+    Homogeneous 4xN collection of Mat1, each column is an element
+
+    Bulk counterpart of Pnt and Vec. Arithmetic runs on the whole array at once
+    following the same type rules as scalar classes.
+    Scalar element is created only when single element is indexed or iterated.
+    """
+    _W = None   # homogeneous coordinate of elements
+
+    def __new__(cls, coords=()):
+        """
+
+        :param coords: ([x, y, z], [x, y, z], ...) or (N, 3) array
+        """
+        coords = np.asarray(coords, dtype=DTYPE).reshape(-1, 3)
+        arr = np.empty((4, len(coords)), dtype=DTYPE)
+        arr[:3] = coords.T
+        arr[3] = cls._W
+        return arr.view(cls)
+
+    def __len__(self):
+        if self.ndim < 2:  # not a collection, ex) raw view
+            return super().__len__()
+        return self.shape[1]
+
+    def __iter__(self):
+        for i in range(self.shape[1]):
+            yield self[i]
+
+    def __str__(self):
+        if self.ndim < 2:
+            return str(self.view(np.ndarray))
+        return f"<{self.__class__.__name__} {len(self)}>"
+
+    def __array_wrap__(self, obj, *args):
+        """
+        result not shaped (4, N) is not a collection, ex) reduction like `sum`, `max`
+
+        :param obj: result array
+        :return: collection of self's type, else plain ndarray or scalar for 0-d result
+        """
+        if obj.ndim != 2 or obj.shape[0] != 4:
+            arr = obj.view(np.ndarray)
+            return arr[()] if arr.ndim == 0 else arr
+        return super().__array_wrap__(obj, *args)
+
+    def __getitem__(self, item):
+        """
+        indexed by element
+
+        ! tuple indexing is treated as raw array indexing as ArrayLikeData does
+        :param item: int for single element, slice or index array for sub collection
+        :return: Pnt or Vec for single element, collection of self's type for others
+        """
+        arr = self.view(np.ndarray)
+        if isinstance(item, tuple):
+            return arr[item]
+        if isinstance(item, (int, np.integer)):
+            return arr[:, [item]].view(self._scalar_type())
+        return arr[:, item].view(self.__class__)
+
+    @classmethod
+    def _scalar_type(cls):
+        raise NotImplementedError
+
+    @classmethod
+    def from_array(cls, arr):
+        """
+        create new collection from homogeneous 4xN array
+
+        ! User has full responsibility providing correct raw data
+        :param arr: (4, N) array
+        :return:
+        """
+        arr = np.array(arr, dtype=DTYPE)
+        arr[3] = cls._W
+        return arr.view(cls)
+
+    @classmethod
+    def from_elems(cls, elems):
+        """
+        create new collection from scalar elements
+
+        :param elems: iterable of Pnt or Vec
+        :return:
+        """
+        elems = tuple(elems)
+        if not elems:
+            return cls()
+        return cls.from_array(np.hstack([e.view(np.ndarray) for e in elems]))
+
+    @property
+    def x(self):
+        return self.view(np.ndarray)[0]
+
+    @property
+    def y(self):
+        return self.view(np.ndarray)[1]
+
+    @property
+    def z(self):
+        return self.view(np.ndarray)[2]
+
+    @property
+    def xyz(self):
+        """
+        :return: (N, 3) array of coordinates
+        """
+        return self.view(np.ndarray)[:3].T
+
+    def transform(self, tm):
+        """
+        transform all elements
+
+        :param tm: TrnsfMat
+        :return: new collection of self's type
+        """
+        return np.dot(tm.view(np.ndarray), self.view(np.ndarray)).view(self.__class__)
+
+    def _arith(self, other, op):
+        """
+        apply element wise operation, scalar Pnt or Vec is broadcast
+
+        :return: (4, N) raw array, w is fixed by `from_array`
+        """
+        return op(self.view(np.ndarray), other.view(np.ndarray))
+
+    def __add__(self, other):
+        """
+        retain constant type casting in between Vec and Pnt addition
+
+        :param other: Vec, Pnt, VecArray, PntArray
+        :return:
+        """
+        if isinstance(other, (Pnt, PntArray)) and isinstance(self, VecArray):
+            return PntArray.from_array(self._arith(other, np.add))
+        if isinstance(other, (Vec, VecArray)):
+            return self.from_array(self._arith(other, np.add))
+        raise ArithmeticError(f'{self.__class__.__name__}, {other.__class__.__name__} add unknown')
+
+    def __sub__(self, other):
+        """
+        retain constant type casting in between Vec and Pnt subtraction
+
+        :param other: Vec, Pnt, VecArray, PntArray
+        :return:
+        """
+        if isinstance(other, (Pnt, PntArray)) and isinstance(self, PntArray):
+            return VecArray.from_array(self._arith(other, np.subtract))
+        if isinstance(other, (Vec, VecArray)):
+            return self.from_array(self._arith(other, np.subtract))
+        raise ArithmeticError(f'{self.__class__.__name__}, {other.__class__.__name__} sub unknown')
+
+    def __mul__(self, other):
+        raise TypeError(f'{self.__class__.__name__}, {other.__class__.__name__} mul unknown')
+
+    def __truediv__(self, other):
+        raise TypeError(f'{self.__class__.__name__}, {other.__class__.__name__} div unknown')
+
+    # all __i~__ return new object
+    def __iadd__(self, other):
+        return self.__add__(other)
+
+    def __isub__(self, other):
+        return self.__sub__(other)
+
+    def __imul__(self, other):
+        return self.__mul__(other)
+
+    def __itruediv__(self, other):
+        return self.__truediv__(other)
+
+
+class VecArray(_Mat1Array):
+    """
+    Collection of vectors
+    """
+    _W = 0
+
+    @classmethod
+    def _scalar_type(cls):
+        return Vec
+
+    def __neg__(self):
+        return self.from_array(-self.view(np.ndarray))
+
+    def __mul__(self, other):
+        """
+        amplify by scalar or by per element scalars
+
+        :param other: Number or (N,) array
+        :return: new VecArray
+        """
+        if isinstance(other, (Number, np.ndarray)) and not isinstance(other, ArrayLikeData):
+            return self.from_array(self.view(np.ndarray) * other)
+        raise TypeError(f'{self.__class__.__name__}, {other.__class__.__name__} mul unknown')
+
+    def __truediv__(self, other):
+        """
+        divide by scalar or by per element scalars
+
+        :param other: Number or (N,) array
+        :return: new VecArray
+        """
+        if isinstance(other, (Number, np.ndarray)) and not isinstance(other, ArrayLikeData):
+            return self.from_array(self.view(np.ndarray) / other)
+        raise TypeError(f'{self.__class__.__name__}, {other.__class__.__name__} div unknown')
+
+    @classmethod
+    def cross(cls, a, b):
+        """
+        element wise cross product, scalar Vec is broadcast
+
+        ! cross product is anticommutative
+        :param a: VecArray or Vec
+        :param b: VecArray or Vec
+        :return: new VecArray
+        """
+        a, b = a.view(np.ndarray)[:3], b.view(np.ndarray)[:3]
+        arr = np.zeros((4, max(a.shape[1], b.shape[1])), dtype=DTYPE)
+        arr[:3] = np.cross(a, b, axis=0)
+        return arr.view(cls)
+
+    @classmethod
+    def dot(cls, a, b):
+        """
+        element wise dot product, scalar Vec is broadcast
+
+        :param a: VecArray or Vec
+        :param b: VecArray or Vec
+        :return: (N,) array
+        """
+        return (a.view(np.ndarray)[:3] * b.view(np.ndarray)[:3]).sum(axis=0)
+
+    @property
+    def length(self):
+        """
+        :return: (N,) array of vector lengths
+        """
+        return np.sqrt(VecArray.dot(self, self))
+
+    def normalize(self):
+        """
+        return normalized
+
+        ! zero vectors are left as they are
+        :return: new VecArray
+        """
+        length = self.length
+        length[np.isclose(length, 0, atol=ATOL)] = 1
+        return self / length
+
+    def amplify(self, magnitude):
+        """
+        return amplified of self
+
+        :param magnitude: Number or (N,) array
+        :return: new VecArray
+        """
+        return self.normalize() * magnitude
+
+    def total(self):
+        """
+        sum of all vectors
+
+        :return: Vec
+        """
+        return self.view(np.ndarray).sum(axis=1, keepdims=True).view(Vec)
+
+    def as_vec(self):
+        return self
+
+    def as_pnt(self):
+        return PntArray.from_array(self)
+
+
+class PntArray(_Mat1Array):
+    """
+    Collection of points
+    """
+    _W = 1
+
+    @classmethod
+    def _scalar_type(cls):
+        return Pnt
+
+    def as_vec(self):
+        return VecArray.from_array(self)
+
+    def as_pnt(self):
+        return self
+
+
 class _NamedVec(Vec):
     """
     Named vector: special vectors
@@ -824,116 +1116,86 @@ class Pln(ArrayLikeData, PntConv):
         return Pln(o.xyz, x.xyz, y.xyz, z.xyz)
 
     def __new__(cls, o=(0, 0, 0), x=(1, 0, 0), y=(0, 1, 0), z=(0, 0, 1)):
+        (xx, yx, zx), (xy, yy, zy), (xz, yz, zz) = cls.__orthonormal(x, y)
+        # fill through raw view not to finalize from ndarray
         obj = super().__new__(cls, shape=(4, 4), dtype=DTYPE)
-        obj[:3, (0, 1, 2, 3)] = np.array([o, x, y, z]).T
-        obj[3] = 1, 0, 0, 0
-        obj.__normalize()
+        obj.view(np.ndarray)[:] = [[o[0], xx, yx, zx],
+                                   [o[1], xy, yy, zy],
+                                   [o[2], xz, yz, zz],
+                                   [1, 0, 0, 0]]
         return obj
 
-    def __normalize(self):
+    @staticmethod
+    def __orthonormal(x, y):
         """
-        standarization? of plane
+        make axes perpendicular and normalized
 
-        1. Make vectors perpendicular, normalized and
-        2. create transformation matrix into plane space
         !vectors are made perpendicular by referencing vectors in xyz order!
-        :param arr: array in np.ndarray type
-        :return:
-        """
-        if (self.view(np.ndarray) == [[0, 1, 0, 0],
-                                      [0, 0, 1, 0],
-                                      [0, 0, 0, 1],
-                                      [1, 0, 0, 0]]).all():
-            # unit plane transformation matrix equals to eye(4) matrix
-            self._trnsf_mat = TrnsfMats()
-            return
-        # make vectors normalized and perpendicular
-        x, y = self.axis_x, self.axis_y
-
-        if Vec.cross(x, y) == 0:
+        :param x: (x, y, z) axis x
+        :param y: (x, y, z) axis y
+        :return: 3x3 nested list, axes as columns
+        """
+        xx, xy, xz = x
+        yx, yy, yz = y
+        # z = x cross y, y = z cross x
+        zx, zy, zz = xy * yz - xz * yy, xz * yx - xx * yz, xx * yy - xy * yx
+        if abs(zx) <= ATOL and abs(zy) <= ATOL and abs(zz) <= ATOL:
             raise ValueError('cant define plane with parallel axes')
-        z = Vec.cross(x, y)  # find z
-        y = Vec.cross(z, x)  # find y
-        x, y, z = [v.normalize() for v in (x, y, z)]
-        self[:, 1:] = np.array([x, y, z]).T
-        # calculate 'plane to origin' rotation matrices
-        # last rotation is of x so match axis x to unit x prior
-        plane = np.array([[0, x.x, y.x, z.x],
-                          [0, x.y, y.y, z.y],
-                          [0, x.z, y.z, z.z],
-                          [1, 0, 0, 0]], dtype=DTYPE)
-        x_on_xy = x.project_on_xy()
-        dir_vec = Vec.cross(XVec(), x_on_xy)
-        if dir_vec.is_zero():
-            if Vec.dot(XVec(), x_on_xy) < 0:
-                rot_dir = 1
-            else:
-                rot_dir = 0
-        elif dir_vec.z > 0:
-            rot_dir = -1
-        else:
-            rot_dir = 1
-        rz = RotZMat(Vec.angle_between(Vec(1, 0, 0), x_on_xy) * rot_dir)
-
-        plane = rz * plane
-        x_on_zx = Vec(*plane[:3, 1])
-        dir_vec = Vec.cross(XVec(), x_on_zx)
-        if dir_vec.is_zero():
-            if Vec.dot(XVec(), x_on_zx) < 0:
-                rot_dir = 1
-            else:
-                rot_dir = 0
-        elif dir_vec.y > 0:
-            rot_dir = -1
-        else:
-            rot_dir = 1
-        ry = RotYMat(Vec.angle_between(Vec(1, 0, 0), x_on_zx) * rot_dir)
-
-        # axis x is aligned so lastly match axis y
-        plane = ry * plane
-        y_on_yz = Vec(*plane[:3, 2])
-        dir_vec = Vec.cross(YVec(), y_on_yz)
-        if dir_vec.is_zero():  # parallel, need opposite checking
-            if Vec.dot(YVec(), y_on_yz) < 0:  # opposite
-                rot_dir = 1
-            else:
-                rot_dir = 0
-        elif dir_vec.x > 0:
-            rot_dir = -1
-        else:
-            rot_dir = 1
-        rx = RotXMat(Vec.angle_between(YVec(), y_on_yz) * rot_dir)
+        yx, yy, yz = zy * xz - zz * xy, zz * xx - zx * xz, zx * xy - zy * xx
+        lx, ly, lz = sqrt(xx * xx + xy * xy + xz * xz), sqrt(yx * yx + yy * yy + yz * yz), sqrt(zx * zx + zy * zy + zz * zz)
+        return [[xx / lx, yx / ly, zx / lz],
+                [xy / lx, yy / ly, zy / lz],
+                [xz / lx, yz / ly, zz / lz]]
 
-        to_origin = MoveMat(*(-self.origin).xyz)
+    def __normalize(self):
+        """
+        standarization? of plane
 
-        # found 'plane to origin' so 'origin to plane' is inverse of it
-        self._trnsf_mat = TrnsfMats([to_origin, rz, ry, rx]).I
+        Make vectors perpendicular and normalized in place.
+        Transformation matrix is not calculated here but lazily by `TM`.
+        :return:
+        """
+        arr = self.view(np.ndarray)
+        x, y = arr[:3, 1].tolist(), arr[:3, 2].tolist()
+        arr[:3, 1:] = self.__orthonormal(x, y)
+        self.__tm = None
 
     def __array_finalize__(self, obj):
         """
 
         :return:
         """
+        self.__tm = None
         if obj is None:
             return
         """
-        dont know when this can happen:
         1.  happens when copying plane:
-            Somehow copy() internally circumvents Pln.__new__ and creates Pln with eye(4) value 
+            copy() internally circumvents Pln.__new__, values are copied after finalizing
+            but origin is already normalized so only cache is reset
+        2.  happens when viewing raw array as Pln, ex) result of transformation
         """
-
         if isinstance(obj, self.__class__):
-            self[:] = obj
-            self.__normalize()
+            return
         elif isinstance(obj, np.ndarray):
             # self already has resulting value, need to check array correctness
-            if self.validate_array(self):
+            if self.validate_array(self.view(np.ndarray)):
                 self.__normalize()
             else:
                 raise ValueError('given is not Pln-like')
         else:
             raise
 
+    def __setitem__(self, key, value):
+        """
+        overridden to drop cached transformation matrix
+
+        :param key:
+        :param value:
+        :return:
+        """
+        super().__setitem__(key, value)
+        self.__tm = None
+
     @classmethod
     def validate_array(cls, arr):
         """
@@ -996,9 +1258,14 @@ class Pln(ArrayLikeData, PntConv):
     def TM(self):
         """
         return transformation matrix(origin -> plane)
-        :return:
+
+        Plane's axes and origin as columns, calculated on first access.
+        ! cached until plane is mutated, don't modify returned matrix
+        :return: RigidMat
         """
-        return self._trnsf_mat
+        if self.__tm is None:
+            self.__tm = self.view(np.ndarray)[:, [1, 2, 3, 0]].view(RigidMat)
+        return self.__tm
 
     def __str__(self):
         return f"<Pln : {[round(n, 3) for n in self[:3, 0]]}>"
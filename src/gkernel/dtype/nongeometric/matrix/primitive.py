@@ -1,6 +1,4 @@
-import copy
-
-from gkernel.constants import DTYPE
+from gkernel.constants import DTYPE, ATOL
 from .._NoneGeomDataType import *
 
 
@@ -36,7 +34,7 @@ class TrnsfMat(Mat4):
         """
         # combine transformation matrix
         if isinstance(other, TrnsfMat):
-            return np.dot(self, other).view(TrnsfMat)
+            return np.dot(self.view(np.ndarray), other.view(np.ndarray)).view(TrnsfMat)
         else:
             # try calculating
             try:
@@ -46,6 +44,47 @@ class TrnsfMat(Mat4):
             except Exception as e:
                 raise e
 
+    @property
+    def is_rigid(self):
+        """
+        check if matrix only rotates and moves, preserving lengths and angles
+
+        :return: bool
+        """
+        arr = self.view(np.ndarray)
+        rot = arr[:3, :3]
+        return bool(np.allclose(arr[3], (0, 0, 0, 1), atol=ATOL)
+                    and np.allclose(rot.T.dot(rot), np.eye(3), atol=ATOL)
+                    and 0 < np.linalg.det(rot))
+
+    def transform_all(self, geos):
+        """
+        transform many geometries at once
+
+        Columns of all geometries are packed into single 4xN array and transformed by one dot product,
+        then scattered back into new instances of each geometry's class.
+        For rigid transformation geometric properties(ex. orthonormal axes of `Pln`) are preserved
+        so instances are created without finalizing from array, skipping re-validation.
+        Else as `__mul__` does.
+        :param geos: iterable of geometries of 4xk homogeneous array, classes can be mixed
+        :return: list of new transformed geometries in given order
+        """
+        geos = list(geos)
+        if not geos:
+            return []
+        widths = [g.shape[1] for g in geos]
+        result = np.dot(self.view(np.ndarray), np.hstack([g.view(np.ndarray) for g in geos]))
+        stops = np.cumsum(widths).tolist()
+        transformed = []
+        if self.is_rigid:
+            for g, w, stop in zip(geos, widths, stops):
+                block = np.ascontiguousarray(result[:, stop - w:stop])
+                transformed.append(np.ndarray.__new__(g.__class__, (4, w), dtype=block.dtype, buffer=block))
+        else:
+            for g, w, stop in zip(geos, widths, stops):
+                transformed.append(result[:, stop - w:stop].copy().view(g.__class__))
+        return transformed
+
 
 class TrnsfMats(TrnsfMat):
     """
@@ -53,6 +92,9 @@ class TrnsfMats(TrnsfMat):
 
     Useful retrieving intermediate transformation matrix
     of getting inverse of all transformation.
+
+    Inverse is the chain of factors' own inverses in reversed order so rigid motions stay exact.
+    It is built on first access and cached, both ways, until either chain is appended.
     """
     type_nickname = 'CM'
 
@@ -74,24 +116,30 @@ class TrnsfMats(TrnsfMat):
     def __array_finalize__(self, obj):
         """
         copies matrix stack of original if obj is one of its kind
-        and update self as merged
 
+        ! value is copied, or calculated into, by numpy so no need to merge
         :param obj:
         :return:
         """
-        if obj is None:
+        self._inverse = None
+        if isinstance(obj, TrnsfMats) and self.shape == (4, 4):
+            self._matrices = list(obj._matrices)  # factors are never modified in place
+        else:
             self._matrices = []
-        elif isinstance(obj, self.__class__):
-            self._matrices = copy.deepcopy(obj._matrices)  # deepcopying? what if its a view?
-            self.__merge()
 
     @property
     def I(self):
         """
         Inverse of all transformation matrix
+
+        ! cached, don't modify returned matrix
         :return:
         """
-        return TrnsfMats([m.I for m in reversed(self._matrices)])
+        if self._inverse is None:
+            inverse = TrnsfMats([m.I for m in reversed(self._matrices)])
+            inverse._inverse = self
+            self._inverse = inverse
+        return self._inverse
 
     @property
     def matrices(self):
@@ -103,10 +151,19 @@ class TrnsfMats(TrnsfMat):
         :return:
         """
         # update as merged array
-        arr = np.eye(4)
+        arr = np.eye(4, dtype=DTYPE)
         for m in self._matrices:
-            arr = np.dot(m, arr)
-        self[:] = arr
+            arr = np.dot(m.view(np.ndarray), arr)
+        self.view(np.ndarray)[:] = arr
+
+    def __drop_inverse(self):
+        """
+        unlink cached inverse as chain is mutated
+        :return:
+        """
+        if self._inverse is not None:
+            self._inverse._inverse = None
+            self._inverse = None
 
     def append(self, matrix):
         """
@@ -116,8 +173,10 @@ class TrnsfMats(TrnsfMat):
         :param matrix: matrix used to translate
         :return:
         """
-        self[:] = matrix * self  # be careful for the applying order
+        arr = self.view(np.ndarray)
+        arr[:] = np.dot(matrix.view(np.ndarray), arr)  # be careful for the applying order
         self._matrices.append(matrix)
+        self.__drop_inverse()
 
     def append_all(self, *matrices):
         """
@@ -126,9 +185,11 @@ class TrnsfMats(TrnsfMat):
         :param matrices: matrices for transformation
         :return:
         """
+        arr = self.view(np.ndarray)
         for mat in matrices:
-            self[:] = mat * self
+            arr[:] = np.dot(mat.view(np.ndarray), arr)
         self._matrices += list(matrices)
+        self.__drop_inverse()
 
     def mat_iter(self):
         """
@@ -180,6 +241,34 @@ class MoveMat(TrnsfMat):
     #     if obj is None: return obj
 
 
+class RigidMat(TrnsfMat):
+    """
+    Rotation followed by translation
+
+    Columns are axes and origin of the frame transformed into.
+    ! axes has to be orthonormal as inverse is given analytically by transposing rotation
+    """
+    type_nickname = 'RG'
+
+    def __new__(cls, o=(0, 0, 0), x=(1, 0, 0), y=(0, 1, 0), z=(0, 0, 1)):
+        arr = np.empty((4, 4), dtype=DTYPE)
+        arr[:3] = np.array([x, y, z, o], dtype=DTYPE).T
+        arr[3] = 0, 0, 0, 1
+        return arr.view(cls)
+
+    @property
+    def I(self):
+        arr = self.view(np.ndarray)
+        inv = np.empty((4, 4), dtype=DTYPE)
+        inv[:3, :3] = arr[:3, :3].T
+        inv[:3, 3] = -inv[:3, :3].dot(arr[:3, 3])
+        inv[3] = 0, 0, 0, 1
+        return inv.view(RigidMat)
+
+    def __str__(self):
+        return f"<RigidMat {[round(v, 3) for v in self[:3, 3]]}>"
+
+
 class ScaleMat(TrnsfMat):
     """
     Scale matrix
@@ -1 +1,3 @@
-from .intersector import Intersector
\ No newline at end of file
+from .intersector import Intersector
+from .box import AABB, BVH
+from .triangulator import Triangulator
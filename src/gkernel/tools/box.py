@@ -1,5 +1,10 @@
+from math import inf
+
 import numpy as np
-from gkernel.constants import ATOL
+from gkernel.constants import ATOL, DTYPE
+from gkernel.array_like import ArrayLikeData
+from gkernel.dtype.geometric.primitive import Pnt, Vec, _Mat1Array
+from .intersector import Intersector
 
 
 def iszero(v):
@@ -8,4 +13,485 @@ def iszero(v):
 
     :return:
     """
-    return np.isclose(v, 0, atol=ATOL)
\ No newline at end of file
+    return np.isclose(v, 0, atol=ATOL)
+
+
+def _coords(obj, k):
+    """
+    :param obj: PntArray, Pnt or array like of shape (N, k, 3)
+    :param k: number of vertices per primitive
+    :return: (N, k, 3) array of coordinates
+    """
+    if isinstance(obj, _Mat1Array):
+        obj = obj.xyz
+    elif isinstance(obj, Pnt):
+        obj = obj.view(np.ndarray)[:3].T
+    return np.asarray(obj, dtype=DTYPE).reshape(-1, k, 3)
+
+
+def _ray_arr(ray):
+    """
+    :param ray: Ray
+    :return: origin, normal as (3,) arrays
+    """
+    arr = ray.view(np.ndarray)
+    return arr[:3, 0], arr[:3, 1]
+
+
+class AABB(ArrayLikeData):
+    """
+    Axis aligned bounding box
+
+    Described by its min and max corners as columns of 4x2 homogeneous array.
+    Empty box has inverted corners (inf, -inf) so union with any box returns the other.
+    """
+
+    def __new__(cls, lo=(inf, inf, inf), hi=(-inf, -inf, -inf)):
+        """
+
+        :param lo: (x, y, z) min corner
+        :param hi: (x, y, z) max corner
+        """
+        obj = super().__new__(cls, shape=(4, 2), dtype=DTYPE)
+        obj[:3, 0] = lo
+        obj[:3, 1] = hi
+        obj[3] = 1
+        return obj
+
+    def __str__(self):
+        if self.is_empty():
+            return "<AABB empty>"
+        return f"<AABB {[round(n, 3) for n in self.lo.xyz]} {[round(n, 3) for n in self.hi.xyz]}>"
+
+    @classmethod
+    def from_pnts(cls, pnts):
+        """
+        smallest box containing all given points
+
+        :param pnts: PntArray or (N, 3) array
+        :return: new AABB
+        """
+        coords = _coords(pnts, 1)[:, 0]
+        if not len(coords):
+            return cls()
+        return cls(coords.min(axis=0), coords.max(axis=0))
+
+    @classmethod
+    def union(cls, *boxes):
+        """
+        smallest box containing all given boxes
+
+        :param boxes: AABB
+        :return: new AABB
+        """
+        arrs = [b.view(np.ndarray) for b in boxes]
+        return cls(np.min([a[:3, 0] for a in arrs], axis=0), np.max([a[:3, 1] for a in arrs], axis=0))
+
+    @property
+    def lo(self) -> Pnt:
+        return Pnt(*self[:3, 0])
+
+    @property
+    def hi(self) -> Pnt:
+        return Pnt(*self[:3, 1])
+
+    @property
+    def center(self) -> Pnt:
+        return Pnt(*(self[:3, 0] + self[:3, 1]) / 2)
+
+    @property
+    def size(self) -> Vec:
+        return Vec(*(self[:3, 1] - self[:3, 0]))
+
+    def is_empty(self):
+        return bool((self[:3, 1] < self[:3, 0]).any())
+
+    def expanded(self, dist):
+        """
+        box grown by given distance in all directions
+
+        :param dist: Number
+        :return: new AABB
+        """
+        return AABB(self[:3, 0] - dist, self[:3, 1] + dist)
+
+    def contains(self, pnt):
+        """
+        check if point is inside or on the border
+
+        :param pnt: Pnt
+        :return: bool
+        """
+        xyz = pnt.view(np.ndarray)[:3, 0]
+        return bool(((self[:3, 0] - ATOL <= xyz) & (xyz <= self[:3, 1] + ATOL)).all())
+
+    def intersects(self, other):
+        """
+        check if two boxes overlap, touching counts
+
+        :param other: AABB
+        :return: bool
+        """
+        return bool(((self[:3, 0] <= other[:3, 1] + ATOL) & (other[:3, 0] <= self[:3, 1] + ATOL)).all())
+
+
+class BVH:
+    """
+    Bounding volume hierarchy over triangles, segments and points
+
+    Primitives are ordered along morton curve of their centroids and chunked into leaves of `leaf_size`.
+    Tree is an implicit complete binary tree stored as node bounds array,
+    node i has children 2i, 2i+1 and leaves are nodes [num_leaves, 2 * num_leaves),
+    so build, refit and traversal run level by level over whole arrays.
+
+    ! primitives are identified by (kind, index) where index is of the array given for the kind
+    """
+    TGL, LIN, PNT = 'TGL', 'LIN', 'PNT'
+    KINDS = TGL, LIN, PNT
+    __NUM_VRTX = {TGL: 3, LIN: 2, PNT: 1}
+    MORTON_BITS = 10
+
+    def __init__(self, tgls=(), lins=(), pnts=(), leaf_size=4):
+        """
+
+        :param tgls: (N, 3, 3) array of (triangle, vertex, xyz)
+        :param lins: (N, 2, 3) array of (segment, vertex, xyz)
+        :param pnts: PntArray or (N, 3) array
+        :param leaf_size: number of primitives per leaf
+        """
+        self.__leaf_size = leaf_size
+        self.__coords = {k: _coords(c, self.__NUM_VRTX[k]) for k, c in zip(self.KINDS, (tgls, lins, pnts))}
+        # global id ranges of each kind
+        self.__offsets = {}
+        offset = 0
+        for kind in self.KINDS:
+            self.__offsets[kind] = offset
+            offset += len(self.__coords[kind])
+        self.__num_prims = offset
+        self.__build()
+
+    def __len__(self):
+        return self.__num_prims
+
+    def __str__(self):
+        return f"<BVH prims:{self.__num_prims} leaves:{self.__num_leaves}>"
+
+    @property
+    def bound(self):
+        """
+        :return: AABB of all primitives
+        """
+        return AABB(self.__lo[1], self.__hi[1])
+
+    def coords(self, kind):
+        """
+        :param kind: one of KINDS
+        :return: coordinate array of primitives of kind
+        """
+        return self.__coords[kind]
+
+    def __calc_prim_bounds(self):
+        """
+        cache bounds of all primitives in global id order
+        """
+        coords = [self.__coords[k] for k in self.KINDS]
+        self.__prim_lo = np.concatenate([c.min(axis=1) for c in coords])
+        self.__prim_hi = np.concatenate([c.max(axis=1) for c in coords])
+
+    def __build(self):
+        """
+        sort primitives along morton curve and build implicit tree
+        """
+        self.__calc_prim_bounds()
+        lo, hi = self.__prim_lo, self.__prim_hi
+        # morton code of centroid quantized in scene bound
+        cent = (lo + hi) / 2
+        scale = (1 << self.MORTON_BITS) - 1
+        if self.__num_prims:
+            c_lo, c_hi = cent.min(axis=0), cent.max(axis=0)
+            extent = np.where(c_hi - c_lo < ATOL, 1, c_hi - c_lo)
+            quant = ((cent - c_lo) / extent * scale).astype(np.uint64)
+        else:
+            quant = np.zeros((0, 3), dtype=np.uint64)
+        codes = np.zeros(len(quant), dtype=np.uint64)
+        for axis in range(3):
+            codes |= self.__spread_bits(quant[:, axis]) << np.uint64(2 - axis)
+        order = np.argsort(codes, kind='stable')
+
+        num_leaves = 1 << max(0, -(-self.__num_prims // self.__leaf_size) - 1).bit_length()
+        self.__num_leaves = num_leaves
+        # slot -> global id, padded with -1
+        self.__order = np.full(num_leaves * self.__leaf_size, -1, dtype=np.int64)
+        self.__order[:self.__num_prims] = order
+        # global id -> leaf node
+        self.__leaf_of = np.empty(self.__num_prims, dtype=np.int64)
+        self.__leaf_of[order] = np.arange(self.__num_prims) // self.__leaf_size + num_leaves
+
+        self.__lo = np.full((2 * num_leaves, 3), inf, dtype=DTYPE)
+        self.__hi = np.full((2 * num_leaves, 3), -inf, dtype=DTYPE)
+        if self.__num_prims:
+            self.__refit_leaves(np.arange(num_leaves) + num_leaves)
+
+    @staticmethod
+    def __spread_bits(v):
+        """
+        insert two zero bits between each bit
+
+        :param v: uint64 array of 10 bit values
+        :return:
+        """
+        v = v & np.uint64(0x3ff)
+        v = (v | (v << np.uint64(16))) & np.uint64(0x30000ff)
+        v = (v | (v << np.uint64(8))) & np.uint64(0x300f00f)
+        v = (v | (v << np.uint64(4))) & np.uint64(0x30c30c3)
+        v = (v | (v << np.uint64(2))) & np.uint64(0x9249249)
+        return v
+
+    def __refit_leaves(self, leaves):
+        """
+        recalculate bounds of given leaves and propagate to the root
+
+        :param leaves: sorted unique leaf node indices
+        :return:
+        """
+        lo, hi = self.__prim_lo, self.__prim_hi
+        slots = (leaves[:, None] - self.__num_leaves) * self.__leaf_size + np.arange(self.__leaf_size)
+        gids = self.__order[slots]
+        valid = (0 <= gids)[..., None]
+        self.__lo[leaves] = np.where(valid, lo[gids], inf).min(axis=1)
+        self.__hi[leaves] = np.where(valid, hi[gids], -inf).max(axis=1)
+        nodes = leaves
+        while nodes[0] > 1:
+            nodes = np.unique(nodes >> 1)
+            self.__lo[nodes] = np.minimum(self.__lo[2 * nodes], self.__lo[2 * nodes + 1])
+            self.__hi[nodes] = np.maximum(self.__hi[2 * nodes], self.__hi[2 * nodes + 1])
+
+    def refit(self, kind, coords, indxs=None):
+        """
+        update coordinates of moved primitives and refit bounds
+
+        Tree topology is kept, only bounds of affected nodes are recalculated.
+        Rebuild when geometry moved far for query efficiency.
+        :param kind: one of KINDS
+        :param coords: new coordinates of primitives, shaped as given at init
+        :param indxs: indices of primitives to update, all of kind if None
+        :return:
+        """
+        new = _coords(coords, self.__NUM_VRTX[kind])
+        if indxs is None:
+            indxs = np.arange(len(self.__coords[kind]))
+        indxs = np.asarray(indxs, dtype=np.int64)
+        if len(new) != len(indxs):
+            raise ValueError('number of coordinates and indices do not match')
+        self.__coords[kind][indxs] = new
+        if not len(indxs):
+            return
+        gids = indxs + self.__offsets[kind]
+        self.__prim_lo[gids], self.__prim_hi[gids] = new.min(axis=1), new.max(axis=1)
+        self.__refit_leaves(np.unique(self.__leaf_of[gids]))
+
+    def rebuild(self):
+        """
+        rebuild tree with current coordinates
+        """
+        self.__build()
+
+    def __split_gids(self, gids):
+        """
+        :param gids: global ids
+        :return: {kind: indices of kind}
+        """
+        split = {}
+        for kind in self.KINDS:
+            offset = self.__offsets[kind]
+            indxs = gids[(offset <= gids) & (gids < offset + len(self.__coords[kind]))] - offset
+            split[kind] = indxs
+        return split
+
+    def __traverse(self, test):
+        """
+        collect primitives of leaves whose ancestors all pass the test
+
+        :param test: callable(lo, hi) -> bool mask, lo and hi are (N, 3) node bounds
+        :return: global ids of candidate primitives
+        """
+        nodes = np.array([1])
+        while True:
+            lo, hi = self.__lo[nodes], self.__hi[nodes]
+            nodes = nodes[(lo <= hi).all(axis=1) & test(lo, hi)]
+            if not len(nodes) or self.__num_leaves <= nodes[0]:
+                break
+            nodes = np.stack((2 * nodes, 2 * nodes + 1), axis=1).ravel()
+        slots = (nodes[:, None] - self.__num_leaves) * self.__leaf_size + np.arange(self.__leaf_size)
+        gids = self.__order[slots].ravel()
+        return gids[0 <= gids]
+
+    @staticmethod
+    def __ray_slab(ray_o, ray_v, tol):
+        """
+        :return: ray box test function for `__traverse`
+        """
+        with np.errstate(divide='ignore'):
+            inv = 1 / ray_v
+
+        def test(lo, hi):
+            with np.errstate(invalid='ignore'):
+                t1, t2 = (lo - tol - ray_o) * inv, (hi + tol - ray_o) * inv
+            tmin = np.fmax.reduce(np.fmin(t1, t2), axis=1)
+            tmax = np.fmin.reduce(np.fmax(t1, t2), axis=1)
+            return np.maximum(tmin, 0) <= tmax
+        return test
+
+    def __ray_hits(self, ray, tol):
+        """
+        hit all primitives, segments and points are hit within tolerance
+
+        :return: {kind: (indices, ray parameters)}
+        """
+        ray_o, ray_v = _ray_arr(ray)
+        split = self.__split_gids(self.__traverse(self.__ray_slab(ray_o, ray_v, tol)))
+        hits = {}
+        # triangles
+        indxs = split[self.TGL]
+        hit, t, _ = Intersector.ray_tgls(ray, self.__coords[self.TGL][indxs])
+        hits[self.TGL] = indxs[hit], t[hit]
+        # segments, closest approach between ray and clamped segment
+        indxs = split[self.LIN]
+        lins = self.__coords[self.LIN][indxs]
+        starts, lv = lins[:, 0], lins[:, 1] - lins[:, 0]
+        w = starts - ray_o
+        b, c, d, e = lv.dot(ray_v), np.einsum('ij,ij->i', lv, lv), w.dot(ray_v), np.einsum('ij,ij->i', w, lv)
+        denom = c - b * b
+        with np.errstate(divide='ignore', invalid='ignore'):
+            s = np.clip(np.where(ATOL < denom, (b * d - e) / denom, 0), 0, 1)
+            t = np.maximum(d + b * s, 0)
+            s = np.clip(np.where(ATOL < c, (t * b - e) / c, 0), 0, 1)
+        gap = np.linalg.norm(starts + s[:, None] * lv - (ray_o + t[:, None] * ray_v), axis=1)
+        hit = gap <= tol
+        hits[self.LIN] = indxs[hit], t[hit]
+        # points
+        indxs = split[self.PNT]
+        pnts = self.__coords[self.PNT][indxs, 0]
+        t = np.maximum((pnts - ray_o).dot(ray_v), 0)
+        hit = np.linalg.norm(ray_o + t[:, None] * ray_v - pnts, axis=1) <= tol
+        hits[self.PNT] = indxs[hit], t[hit]
+        return hits
+
+    def closest_hit(self, ray, tol=ATOL):
+        """
+        first primitive hit by the ray
+
+        :param ray: Ray
+        :param tol: distance within which segments and points are considered hit
+        :return: (kind, index, ray parameter, Pnt) or None
+        """
+        best = None
+        for kind, (indxs, ts) in self.__ray_hits(ray, tol).items():
+            if len(ts):
+                i = ts.argmin()
+                if best is None or ts[i] < best[2]:
+                    best = kind, int(indxs[i]), float(ts[i])
+        if best is None:
+            return None
+        ray_o, ray_v = _ray_arr(ray)
+        return (*best, Pnt(*(ray_o + ray_v * best[2])))
+
+    def all_hits(self, ray, tol=ATOL):
+        """
+        all primitives hit by the ray ordered by distance
+
+        :param ray: Ray
+        :param tol: distance within which segments and points are considered hit
+        :return: [(kind, index, ray parameter), ...]
+        """
+        hits = []
+        for kind, (indxs, ts) in self.__ray_hits(ray, tol).items():
+            hits += zip([kind] * len(ts), indxs.tolist(), ts.tolist())
+        return sorted(hits, key=lambda h: h[2])
+
+    def query_box(self, box):
+        """
+        primitives whose bounds overlap with given box
+
+        :param box: AABB
+        :return: {kind: indices of kind}
+        """
+        b_lo, b_hi = box.view(np.ndarray)[:3, 0], box.view(np.ndarray)[:3, 1]
+
+        def test(lo, hi):
+            return ((lo <= b_hi) & (b_lo <= hi)).all(axis=1)
+        gids = self.__traverse(test)
+        return self.__split_gids(gids[test(self.__prim_lo[gids], self.__prim_hi[gids])])
+
+    def nearest_pnt(self, pnt, max_dist=inf):
+        """
+        closest point on primitives from given point, for snapping
+
+        :param pnt: Pnt
+        :param max_dist: search radius
+        :return: (kind, index, Pnt closest, distance) or None if nothing within max_dist
+        """
+        xyz = pnt.view(np.ndarray)[:3, 0]
+        bound = [max_dist]
+
+        def test(lo, hi):
+            # min distance to box, max distance to the farthest corner as an upper bound
+            d_min = np.linalg.norm(np.maximum(np.maximum(lo - xyz, xyz - hi), 0), axis=1)
+            d_max = np.linalg.norm(np.maximum(np.abs(lo - xyz), np.abs(hi - xyz)), axis=1)
+            bound[0] = min(bound[0], d_max.min(initial=inf))
+            return d_min <= bound[0]
+        split = self.__split_gids(self.__traverse(test))
+
+        best = None
+        for kind, indxs in split.items():
+            if not len(indxs):
+                continue
+            coords = self.__coords[kind][indxs]
+            if kind == self.TGL:
+                closest = self.__closest_on_tgls(xyz, coords)
+            elif kind == self.LIN:
+                starts, lv = coords[:, 0], coords[:, 1] - coords[:, 0]
+                c = np.einsum('ij,ij->i', lv, lv)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    s = np.clip(np.where(ATOL < c, np.einsum('ij,ij->i', xyz - starts, lv) / c, 0), 0, 1)
+                closest = starts + s[:, None] * lv
+            else:
+                closest = coords[:, 0]
+            dists = np.linalg.norm(closest - xyz, axis=1)
+            i = dists.argmin()
+            if dists[i] <= max_dist and (best is None or dists[i] < best[3]):
+                best = kind, int(indxs[i]), Pnt(*closest[i]), float(dists[i])
+        return best
+
+    @staticmethod
+    def __closest_on_tgls(p, tgls):
+        """
+        closest point on triangles by barycentric region test
+
+        reference: Real-Time Collision Detection by Christer Ericson 5.1.5
+        :param p: (3,) point
+        :param tgls: (N, 3, 3) triangles
+        :return: (N, 3) closest points
+        """
+        a, b, c = tgls[:, 0], tgls[:, 1], tgls[:, 2]
+        ab, ac, bc = b - a, c - a, c - b
+        dot = lambda u, v: np.einsum('ij,ij->i', u, v)
+        ap, bp, cp = p - a, p - b, p - c
+        d1, d2, d3, d4, d5, d6 = dot(ab, ap), dot(ac, ap), dot(ab, bp), dot(ac, bp), dot(ab, cp), dot(ac, cp)
+        va, vb, vc = d3 * d6 - d5 * d4, d5 * d2 - d1 * d6, d1 * d4 - d3 * d2
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            denom = va + vb + vc
+            closest = a + ab * (vb / denom)[:, None] + ac * (vc / denom)[:, None]
+            # regions checked in reverse so that the first matching region wins
+            regions = (
+                ((va <= 0) & (0 <= d4 - d3) & (0 <= d5 - d6),
+                 b + bc * ((d4 - d3) / ((d4 - d3) + (d5 - d6)))[:, None]),
+                ((vb <= 0) & (0 <= d2) & (d6 <= 0), a + ac * (d2 / (d2 - d6))[:, None]),
+                ((0 <= d6) & (d5 <= d6), c),
+                ((vc <= 0) & (0 <= d1) & (d3 <= 0), a + ab * (d1 / (d1 - d3))[:, None]),
+                ((0 <= d3) & (d4 <= d3), b),
+                ((d1 <= 0) & (d2 <= 0), a))
+            for mask, pnts in regions:
+                closest = np.where(mask[:, None], pnts, closest)
+        return closest
@@ -1,14 +1,21 @@
 from warnings import warn
 
+import numpy as np
+
 from ..constants import ATOL
 from ..dtype.geometric.primitive import *
+from ..dtype.geometric.primitive import _Mat1Array
 
 
 class Intersector:
     """
     for example, in case of intersecting ray and plane, where the method should be?
     inside `Pln` or inside `Ray`? That is why this class is created.
+
+    Single pair intersection is dispatched by `intx`,
+    batch intersection of packed arrays is given by `ray_tgls`, `rays_pln` and `ray_lins`.
     """
+    __dispatch = None  # {(class a, class b): (method, is_swapped)}
 
     def __new__(cls):
         """
@@ -26,16 +33,148 @@ class Intersector:
         :param b: object b
         :return:
         """
+        if cls.__dispatch is None:
+            cls.__dispatch = cls.__build_dispatch()
         # find single concrete intersection method
-        cls_names = [a.__class__.__name__, b.__class__.__name__]
-        method_name = '_Intersector__' + '_'.join(cls_names)
-        if hasattr(cls, method_name):
-            return getattr(cls, method_name)(a, b)
-        else:
-            method_name = '_Intersector__' + '_'.join(reversed(cls_names))
-            if hasattr(cls, method_name):
-                return getattr(cls, method_name)(b, a)
-        raise NotImplementedError("intersection between given class is not implemented")
+        found = cls.__dispatch.get((a.__class__, b.__class__))
+        if found is None:
+            raise NotImplementedError("intersection between given class is not implemented")
+        method, is_swapped = found
+        return method(b, a) if is_swapped else method(a, b)
+
+    @classmethod
+    def __build_dispatch(cls):
+        """
+        map class pairs to intersection methods named as `__<class a>_<class b>`
+
+        :return: {(class a, class b): (method, is_swapped)}
+        """
+        table = {}
+        prefix = '_Intersector__'
+        for attr in dir(cls):
+            if not attr.startswith(prefix) or attr.count('_') != 4:
+                continue
+            a, b = (globals().get(n) for n in attr[len(prefix):].split('_'))
+            if not (isinstance(a, type) and isinstance(b, type)):
+                continue
+            method = getattr(cls, attr)
+            table.setdefault((b, a), (method, True))
+            table[(a, b)] = (method, False)
+        return table
+
+    @staticmethod
+    def __coords(obj):
+        """
+        :param obj: PntArray, VecArray, Pnt, Vec or array of shape (N, 3)
+        :return: (N, 3) array of coordinates
+        """
+        if isinstance(obj, _Mat1Array):
+            return obj.xyz
+        if isinstance(obj, (Pnt, Vec)):
+            return obj.view(np.ndarray)[:3].T
+        return np.asarray(obj, dtype=DTYPE).reshape(-1, 3)
+
+    @staticmethod
+    def pack_tgls(tgls):
+        """
+        pack triangles for batch intersection
+
+        :param tgls: iterable of Tgl
+        :return: (N, 3, 3) array of (triangle, vertex, xyz)
+        """
+        return np.array([tgl.view(np.ndarray)[:3].T for tgl in tgls], dtype=DTYPE).reshape(-1, 3, 3)
+
+    @classmethod
+    def ray_tgls(cls, ray, tgls):
+        """
+        intersect single ray with multiple triangles at once
+
+        Moller-Trumbore as `__Ray_Tgl` run over all triangles, culling disabled.
+        ! ray lying on triangle plane is treated as not intersecting
+        :param ray: Ray
+        :param tgls: (N, 3, 3) array of (triangle, vertex, xyz), see `pack_tgls`
+        :return: (hit mask (N,), ray parameter (N,), PntArray of intersection points)
+                 parameter and point are nan where not hit
+        """
+        tgls = np.asarray(tgls, dtype=DTYPE).reshape(-1, 3, 3)
+        ray_o, ray_v = ray.view(np.ndarray)[:3, 0], ray.view(np.ndarray)[:3, 1]
+        v0 = tgls[:, 0]
+        A = tgls[:, 1] - v0
+        B = tgls[:, 2] - v0
+
+        pvec = np.cross(ray_v, B)
+        det = np.einsum('ij,ij->i', A, pvec)
+        hit = ATOL <= np.abs(det)
+        inv_det = np.divide(1, det, out=np.zeros_like(det), where=hit)
+
+        tvec = ray_o - v0
+        u = np.einsum('ij,ij->i', tvec, pvec) * inv_det
+        hit &= (0 <= u) & (u <= 1)
+
+        qvec = np.cross(tvec, A)
+        v = qvec.dot(ray_v) * inv_det
+        hit &= (0 <= v) & (u + v <= 1)
+
+        t = np.einsum('ij,ij->i', B, qvec) * inv_det
+        hit &= 0 <= t
+        t[~hit] = np.nan
+        return hit, t, PntArray(ray_o + t[:, None] * ray_v)
+
+    @classmethod
+    def rays_pln(cls, origins, normals, pln):
+        """
+        intersect multiple rays with single plane at once
+
+        :param origins: ray origins, PntArray or (N, 3) array
+        :param normals: ray directions, VecArray or (N, 3) array
+        :param pln: Pln
+        :return: (hit mask (N,), ray parameter (N,), PntArray of intersection points)
+                 parameter and point are nan where not hit
+        """
+        origins, normals = cls.__coords(origins), cls.__coords(normals)
+        pln_arr = pln.view(np.ndarray)
+        pln_o, pln_n = pln_arr[:3, 0], pln_arr[:3, 3]
+        denom = normals.dot(pln_n)
+        hit = ATOL <= np.abs(denom)
+        dist = np.divide((pln_o - origins).dot(pln_n), denom, out=np.full_like(denom, np.nan), where=hit)
+        hit &= 0 <= dist
+        dist[~hit] = np.nan
+        return hit, dist, PntArray(origins + dist[:, None] * normals)
+
+    @classmethod
+    def ray_lins(cls, ray, starts, ends):
+        """
+        intersect single ray with multiple line segments at once
+
+        Segment is hit when its closest approach to the ray is within ATOL.
+        ! parallel segments, including collinear ones, are treated as not intersecting
+        :param ray: Ray
+        :param starts: segment starts, PntArray or (N, 3) array
+        :param ends: segment ends, PntArray or (N, 3) array
+        :return: (hit mask (N,), segment parameter (N,), PntArray of intersection points)
+                 parameter and point are nan where not hit
+        """
+        starts = cls.__coords(starts)
+        ray_o, ray_v = ray.view(np.ndarray)[:3, 0], ray.view(np.ndarray)[:3, 1]
+        lv = cls.__coords(ends) - starts
+        w = starts - ray_o
+        # closest approach between two lines, ray direction is normalized
+        b = lv.dot(ray_v)
+        c = np.einsum('ij,ij->i', lv, lv)
+        d = w.dot(ray_v)
+        e = np.einsum('ij,ij->i', w, lv)
+        denom = c - b * b
+        hit = ATOL <= np.abs(denom)
+        param_l = np.divide(b * d - e, denom, out=np.full_like(denom, np.nan), where=hit)
+        param_r = d + b * param_l
+        hit &= (0 <= param_l) & (param_l <= 1) & (0 <= param_r)
+        lin_pnts = starts + param_l[:, None] * lv
+        ray_pnts = ray_o + param_r[:, None] * ray_v
+        gap = np.einsum('ij,ij->i', lin_pnts - ray_pnts, lin_pnts - ray_pnts)
+        hit &= gap <= ATOL ** 2
+        param_l[~hit] = np.nan
+        lin_pnts[~hit] = np.nan
+        return hit, param_l, PntArray(lin_pnts)
 
     @classmethod
     def __Ray_Pln(cls, ray, plane):
@@ -0,0 +1,274 @@
+from bisect import bisect_left
+from math import atan2
+
+import numpy as np
+
+
+class Triangulator:
+    """
+    Polygon triangulation by y-monotone partition
+
+    reference: Computational Geometry: Algorithms and Applications, de Berg et al. chapter 3
+    1. sweep vertices from top to bottom adding diagonals at split and merge vertices
+    2. walk faces formed by polygon edges and diagonals, each face is y-monotone
+    3. triangulate each monotone face with a stack
+    O(n log n) for polygon of n vertices, holes included.
+
+    ! works on 2D coordinates, normalize planar polygon onto xy plane prior
+    ! rings has to be simple and holes should not touch outer boundary or each other,
+      crossing met while sweeping raises ValueError but not every crossing is met
+    """
+    START, END, SPLIT, MERGE, REGULAR = 'START', 'END', 'SPLIT', 'MERGE', 'REGULAR'
+    LEFT, RIGHT = 'LEFT', 'RIGHT'
+
+    @classmethod
+    def triangulate(cls, outer, holes=()):
+        """
+        triangulate polygon with holes
+
+        :param outer: (N, 2) coordinates of outer boundary, first vertex not repeated at the end
+        :param holes: iterable of (M, 2) coordinates of holes
+        :return: (K, 3) int array of counter clockwise triangles,
+                 indexing vertices of outer followed by vertices of holes in given order
+        """
+        xs, ys, prv, nxt = cls.__link_rings(outer, holes)
+        order = np.lexsort((xs, -np.asarray(ys)))  # top to bottom, left to right
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        order, rank = order.tolist(), rank.tolist()
+
+        diagonals = cls.__sweep(xs, ys, prv, nxt, order, rank)
+        tris = []
+        for face in cls.__iter_faces(xs, ys, nxt, diagonals):
+            cls.__triangulate_monotone(xs, ys, face, rank, tris)
+
+        tris = np.array(tris, dtype=np.int64).reshape(-1, 3)
+        # orient counter clockwise
+        x, y = np.asarray(xs)[tris], np.asarray(ys)[tris]
+        area = (x[:, 1] - x[:, 0]) * (y[:, 2] - y[:, 0]) - (y[:, 1] - y[:, 0]) * (x[:, 2] - x[:, 0])
+        tris[area < 0] = tris[area < 0][:, ::-1]
+        return tris
+
+    @classmethod
+    def triangulate_all(cls, polygons):
+        """
+        triangulate many polygons at once
+
+        ! raises at the first failing polygon, `Tessellator` isolates failures per polygon instead
+        :param polygons: [(outer, holes), ...]
+        :return: [(K, 3) int array, ...]
+        """
+        return [cls.triangulate(outer, holes) for outer, holes in polygons]
+
+    @staticmethod
+    def __link_rings(outer, holes):
+        """
+        flatten rings and link neighbors so that interior is always on the left
+
+        :return: xs, ys, prev vertex, next vertex lists
+        """
+        xs, ys, prv, nxt = [], [], [], []
+        rings = [outer] + list(holes)
+        offset = 0
+        for i, ring in enumerate(rings):
+            ring = np.asarray(ring, dtype=float).reshape(-1, 2)
+            n = len(ring)
+            if n < 3:
+                raise ValueError('ring needs at least 3 vertices')
+            rx, ry = ring[:, 0], ring[:, 1]
+            area = (rx * np.roll(ry, -1) - np.roll(rx, -1) * ry).sum()
+            # outer counter clockwise, holes clockwise
+            is_forward = (0 < area) == (i == 0)
+            for k in range(n):
+                a, b = offset + (k - 1) % n, offset + (k + 1) % n
+                prv.append(a if is_forward else b)
+                nxt.append(b if is_forward else a)
+            xs += rx.tolist()
+            ys += ry.tolist()
+            offset += n
+        return xs, ys, prv, nxt
+
+    @classmethod
+    def __sweep(cls, xs, ys, prv, nxt, order, rank):
+        """
+        find diagonals partitioning polygon into y-monotone pieces
+
+        Status holds edges having polygon interior on its right, sorted by x at sweep line.
+        Edge is identified by its start vertex, edge v is (v, nxt[v]).
+        :return: [(a, b), ...] diagonals
+        """
+        def edge_x(e, y):
+            a, b = e, nxt[e]
+            ay, by = ys[a], ys[b]
+            if ay == by:
+                return xs[a]
+            return xs[a] + (y - ay) * (xs[b] - xs[a]) / (by - ay)
+
+        def left_of(v):
+            # index of the edge directly left of vertex v
+            x, y = xs[v], ys[v]
+            lo, hi = 0, len(status)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if edge_x(status[mid], y) <= x:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if not lo:  # nothing on the left means boundary crosses itself
+                raise ValueError('rings are not simple')
+            return status[lo - 1]
+
+        def insert(e, v):
+            x, y = xs[v], ys[v]
+            lo, hi = 0, len(status)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if edge_x(status[mid], y) < x:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            status.insert(lo, e)
+            helper[e] = v
+
+        def remove(e):
+            if e not in status:  # edge ending before it started
+                raise ValueError('rings are not simple')
+            status.remove(e)
+
+        def connect_merge(v, e):
+            # connect to helper if it is a merge vertex
+            h = helper[e]
+            if types[h] == cls.MERGE:
+                diagonals.append((v, h))
+
+        types = [cls.__vrtx_type(v, xs, ys, prv, nxt, rank) for v in range(len(xs))]
+        status, helper, diagonals = [], {}, []
+        for v in order:
+            t, p = types[v], prv[v]
+            if t == cls.START:
+                insert(v, v)
+            elif t == cls.END:
+                connect_merge(v, p)
+                remove(p)
+            elif t == cls.SPLIT:
+                e = left_of(v)
+                diagonals.append((v, helper[e]))
+                helper[e] = v
+                insert(v, v)
+            elif t == cls.MERGE:
+                connect_merge(v, p)
+                remove(p)
+                e = left_of(v)
+                connect_merge(v, e)
+                helper[e] = v
+            elif rank[p] < rank[v]:  # regular, interior on the right
+                connect_merge(v, p)
+                remove(p)
+                insert(v, v)
+            else:  # regular, interior on the left
+                e = left_of(v)
+                connect_merge(v, e)
+                helper[e] = v
+        return diagonals
+
+    @classmethod
+    def __vrtx_type(cls, v, xs, ys, prv, nxt, rank):
+        p, n = prv[v], nxt[v]
+        is_convex = 0 < (xs[v] - xs[p]) * (ys[n] - ys[v]) - (ys[v] - ys[p]) * (xs[n] - xs[v])
+        if rank[v] < rank[p] and rank[v] < rank[n]:
+            return cls.START if is_convex else cls.SPLIT
+        if rank[p] < rank[v] and rank[n] < rank[v]:
+            return cls.END if is_convex else cls.MERGE
+        return cls.REGULAR
+
+    @staticmethod
+    def __iter_faces(xs, ys, nxt, diagonals):
+        """
+        walk faces of polygon edges and diagonals keeping face on the left
+
+        :return: generator of faces, each as list of vertices in counter clockwise order
+        """
+        outs = {}
+        for a, b in diagonals:
+            outs.setdefault(a, [nxt[a]]).append(b)
+            outs.setdefault(b, [nxt[b]]).append(a)
+        # outgoing edges sorted by angle
+        angles = {}
+        for v, targets in outs.items():
+            angled = sorted((atan2(ys[t] - ys[v], xs[t] - xs[v]), t) for t in targets)
+            angles[v] = [a for a, _ in angled]
+            outs[v] = [t for _, t in angled]
+
+        def next_of(u, v):
+            if v not in outs:
+                return nxt[v]
+            # outgoing edge right after (v, u) in clockwise order
+            i = bisect_left(angles[v], atan2(ys[u] - ys[v], xs[u] - xs[v])) - 1
+            return outs[v][i]
+
+        visited = set()
+        half_edges = [(v, nxt[v]) for v in range(len(xs))]
+        half_edges += diagonals + [(b, a) for a, b in diagonals]
+        for start in half_edges:
+            if start in visited:
+                continue
+            face = []
+            u, v = start
+            while (u, v) not in visited:
+                visited.add((u, v))
+                face.append(u)
+                u, v = v, next_of(u, v)
+            yield face
+
+    @classmethod
+    def __triangulate_monotone(cls, xs, ys, face, rank, tris):
+        """
+        triangulate y-monotone face
+
+        :param face: vertices in counter clockwise order
+        :param tris: list to append triangles into
+        :return:
+        """
+        n = len(face)
+        if n < 3:
+            return
+        if n == 3:
+            tris.append(tuple(face))
+            return
+        # going counter clockwise from the top descends left chain
+        ranks = [rank[v] for v in face]
+        top, bottom = ranks.index(min(ranks)), ranks.index(max(ranks))
+        chain = {}
+        i = top
+        while i != bottom:
+            chain[face[i]] = cls.LEFT
+            i = (i + 1) % n
+        while i != top:
+            chain[face[i]] = cls.RIGHT
+            i = (i + 1) % n
+
+        def is_inside(v, a, b):
+            # diagonal (v, b) lies inside when (v, a, b) turns away from the chain
+            cross = (xs[a] - xs[v]) * (ys[b] - ys[v]) - (ys[a] - ys[v]) * (xs[b] - xs[v])
+            return cross < 0 if chain[v] == cls.LEFT else 0 < cross
+
+        vs = sorted(face, key=rank.__getitem__)
+        stack = [vs[0], vs[1]]
+        for j in range(2, n - 1):
+            v = vs[j]
+            if chain[v] != chain[stack[-1]]:
+                while 1 < len(stack):
+                    a = stack.pop()
+                    tris.append((v, a, stack[-1]))
+                stack = [vs[j - 1], v]
+            else:
+                last = stack.pop()
+                while stack and is_inside(v, last, stack[-1]):
+                    tris.append((v, last, stack[-1]))
+                    last = stack.pop()
+                stack += [last, v]
+        v = vs[-1]
+        last = stack.pop()
+        while stack:
+            tris.append((v, last, stack[-1]))
+            last = stack.pop()
@@ -0,0 +1,73 @@
+import bisect
+
+
+class IntervalSet:
+    """
+    Set of half open integer intervals [start, stop)
+
+    Intervals are kept sorted and minimal. Overlapping or touching intervals
+    are merged when added, so iteration always yields disjoint ranges
+    in ascending order.
+    """
+
+    def __init__(self):
+        self.__starts = []
+        self.__stops = []
+
+    def __len__(self):
+        return len(self.__starts)
+
+    def __bool__(self):
+        return bool(self.__starts)
+
+    def __iter__(self):
+        for s, e in zip(self.__starts, self.__stops):
+            yield s, e
+
+    def __str__(self):
+        return f"<IntervalSet {list(self)}>"
+
+    def __repr__(self):
+        return self.__str__()
+
+    @property
+    def span(self):
+        """
+        total number of integers covered
+
+        :return: int
+        """
+        return sum(e - s for s, e in self)
+
+    def add(self, start, stop):
+        """
+        add interval merging with overlapping and touching neighbors
+
+        :param start: int, inclusive
+        :param stop: int, exclusive
+        :return:
+        """
+        if stop <= start:
+            return
+        # first interval whose stop reaches start, last interval whose start reaches stop
+        l = bisect.bisect_left(self.__stops, start)
+        r = bisect.bisect_right(self.__starts, stop)
+        if l < r:  # merge all in between
+            start = min(start, self.__starts[l])
+            stop = max(stop, self.__stops[r - 1])
+        self.__starts[l:r] = [start]
+        self.__stops[l:r] = [stop]
+
+    def clear(self):
+        self.__starts.clear()
+        self.__stops.clear()
+
+    def pop_all(self):
+        """
+        return all intervals and clear
+
+        :return: tuple((start, stop), ...)
+        """
+        intervals = tuple(self)
+        self.clear()
+        return intervals
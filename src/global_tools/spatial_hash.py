@@ -0,0 +1,139 @@
+from itertools import product
+from math import floor
+
+
+class SpatialHash:
+    """
+    Tolerance aware hash of values keyed by coordinates
+
+    Keys are tuples of numbers of any fixed dimension, two keys coincide
+    when every component differs within `tol`.
+    Key space is divided into grid cells sized `tol * cell_scale`, a key is stored in the cell containing it
+    and lookup probes neighbor cells only along axes where the key lies within `tol` of the cell border,
+    so find and insert take O(1) expected.
+
+    ! multiple values of coincident keys can be stored, find returns the foremost inserted
+    """
+
+    def __init__(self, tol, cell_scale=4):
+        """
+
+        :param tol: tolerance of coincidence
+        :param cell_scale: cell size in multiple of tol, has to be bigger than 2
+        """
+        if cell_scale <= 2:
+            raise ValueError('cell_scale has to be bigger than 2')
+        self.__tol = tol
+        self.__cell_size = tol * cell_scale
+        self.__cells = {}  # {cell: [(key, value), ...]}
+        self.__size = 0
+
+    def __len__(self):
+        return self.__size
+
+    def __iter__(self):
+        """
+        iter values
+
+        :return:
+        """
+        for entries in self.__cells.values():
+            for _, value in entries:
+                yield value
+
+    def __contains__(self, key):
+        return self.__find_entry(key) is not None
+
+    def __str__(self):
+        return f"<SpatialHash {self.__size}>"
+
+    @property
+    def tol(self):
+        return self.__tol
+
+    def __cell_of(self, key):
+        return tuple(floor(c / self.__cell_size) for c in key)
+
+    def __probe_cells(self, key):
+        """
+        cells that may contain keys coincident with given key
+
+        :param key:
+        :return: generator of cells, cell containing the key comes first
+        """
+        size, tol = self.__cell_size, self.__tol
+        cell = self.__cell_of(key)
+        offsets = []
+        for c, i in zip(key, cell):
+            o = [0]
+            if c - i * size <= tol:
+                o.append(-1)
+            if (i + 1) * size - c <= tol:
+                o.append(1)
+            offsets.append(o)
+        for offset in product(*offsets):
+            yield tuple(i + o for i, o in zip(cell, offset))
+
+    def __find_entry(self, key):
+        tol = self.__tol
+        for cell in self.__probe_cells(key):
+            for entry in self.__cells.get(cell, ()):
+                if all(abs(a - b) <= tol for a, b in zip(entry[0], key)):
+                    return entry
+        return None
+
+    def find(self, key, default=None):
+        """
+        find value of coincident key
+
+        :param key: tuple of numbers
+        :param default: returned if not found
+        :return: value
+        """
+        entry = self.__find_entry(key)
+        return default if entry is None else entry[1]
+
+    def insert(self, key, value):
+        """
+        insert value regardless of coincident key existence
+
+        :param key: tuple of numbers
+        :param value:
+        :return:
+        """
+        self.__cells.setdefault(self.__cell_of(key), []).append((tuple(key), value))
+        self.__size += 1
+
+    def find_or_insert(self, key, value):
+        """
+        return value of coincident key, insert given value if absent
+
+        :param key: tuple of numbers
+        :param value: value to insert
+        :return: (value found or inserted, bool is inserted)
+        """
+        entry = self.__find_entry(key)
+        if entry is not None:
+            return entry[1], False
+        self.insert(key, value)
+        return value, True
+
+    def remove(self, key, value):
+        """
+        remove value stored with coincident key
+
+        :param key: tuple of numbers
+        :param value: value to remove, compared by identity
+        :return:
+        """
+        tol = self.__tol
+        for cell in self.__probe_cells(key):
+            entries = self.__cells.get(cell, [])
+            for i, (k, v) in enumerate(entries):
+                if v is value and all(abs(a - b) <= tol for a, b in zip(k, key)):
+                    del entries[i]
+                    if not entries:
+                        del self.__cells[cell]
+                    self.__size -= 1
+                    return
+        raise KeyError('value not found')
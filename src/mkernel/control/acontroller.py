@@ -1,6 +1,6 @@
 from mkernel.global_id_provider import GIDP
 from mkernel.control.util.executor import Executor
-from .util import VicinityPicker
+from .util import VicinityPicker, RegionPicker, pick_future
 import gkernel.dtype.geometric as gt
 
 
@@ -8,13 +8,15 @@ class AController:
     """
     basic testing controller
     """
+    # cursor travel in parameterized pane unit, under which press and release is a click
+    DRAG_THRESHOLD = 0.005
 
     def __init__(self, window, modeler, model, id_picker, coord_picker, camera, cursor):
         """
         :param window: interaction has to happen to a certain window
         :param modeler: modeler that contains manipulating functions
         :param model: model to manipulate
-        :param id_picker: id texture pixel picker
+        :param id_picker: AsyncPixelPicker of id texture updated by window's render thread, or FramePixelPicker
         :param coord_picker: coord texture pixel picker
         :param camera: interacting camera
         :param cursor: interacting cursor
@@ -27,6 +29,7 @@ class AController:
         self.__last_button_stat = {i: 0 for i in range(3)}
         self.__vp = VicinityPicker()
         self.__id_picker = id_picker
+        self.__region_picker = RegionPicker(id_picker)
         self.__coord_picker = coord_picker
         self.__camera = camera
         self.__cursor = cursor
@@ -34,17 +37,25 @@ class AController:
         self.__window.devices.mouse.append_mouse_button_callback(self.__callback_mouse)
         self.__window.devices.keyboard.append_key_callback(self.__callback_keyboard)
 
-        self.__selection = None
+        self.__selection = []
+        self.__press_pos = None
 
     def __callback_mouse(self, surface, button, action, mods, mouse):
         """
         respond to mouse button action
         :return:
         """
-        # basic sticky button
-        if button == 0 and self.__last_button_stat[button] == 0:
+        # basic sticky button, click on release so that press can start dragging
+        if button == 0 and action == 1 and self.__last_button_stat[button] == 0:
+            self.__press_pos = tuple(self.__cursor.pos_local.xy)
+        elif button == 0 and action == 0 and self.__last_button_stat[button] == 1 and self.__press_pos:
+            start, end = self.__press_pos, tuple(self.__cursor.pos_local.xy)
+            self.__press_pos = None
             if not self.__executor.active_exec_count:
-                self.__executor.execute(command=self.__left_button_press)
+                if max(abs(a - b) for a, b in zip(start, end)) < self.DRAG_THRESHOLD:
+                    self.__executor.execute(command=self.__left_button_press)
+                else:
+                    self.__executor.execute(command=self.__left_button_drag, args=(start, end))
         self.__last_button_stat[button] = action
 
     def __callback_keyboard(self, surface, key, scancode, action, mods, keyboard):
@@ -67,15 +78,11 @@ class AController:
         actions for left button press
         :return:
         """
-        # clear selection
-        if self.__selection:
-            self.__selection.clr = 1, 1, 1, 1
-            self.__selection = None
+        self.__clear_selection()
 
         # check for selection
-        # as this is a separate thread, need context binding
-        with self.__window.context.gl:
-            goid, bitpatt = self.__id_picker.pick(pos=self.__cursor.pos_local, size=(1, 1))
+        # readback is served by render thread, wait for it here on the executor thread
+        goid, bitpatt = pick_future(self.__id_picker, self.__cursor.pos_local).result()
         shape = GIDP().get_registered_byvalue(goid[0][0], bitpatt)
 
         # if nothing selected,
@@ -84,15 +91,36 @@ class AController:
             if pick:
                 self.__executor.execute(self.__draw_point, args=(pick[1],))
         else:  # picking drawn point
-            self.__executor.execute(self.__color_selected, args=(shape,))
+            self.__executor.execute(self.__color_selected, args=([shape],))
+
+    def __left_button_drag(self, start, end):
+        """
+        select every shape visible in the dragged rectangle
+
+        :param start: (x, y) parameterized cursor position of press
+        :param end: (x, y) parameterized cursor position of release
+        :return:
+        """
+        self.__clear_selection()
+        size = tuple(float(e - s) for s, e in zip(start, end))
+        shapes = self.__region_picker.pick_rect(pos=tuple(map(float, start)), size=size)
+        if shapes:
+            self.__executor.execute(self.__color_selected, args=(list(shapes.values()),))
+
+    def __clear_selection(self):
+        for shape in self.__selection:
+            shape.clr = 1, 1, 1, 1
+        self.__selection = []
 
     def __draw_point(self, pnt):
         self.__modeler.add_raw(self.__model, pnt)
 
-    def __color_selected(self, pnt):
-        self.__selection = pnt
-        pnt.clr = 1, 1, 0, 1
+    def __color_selected(self, shapes):
+        self.__selection = shapes
+        for shape in shapes:
+            shape.clr = 1, 1, 0, 1
 
     def __remove_point(self):
-        self.__modeler.remove_shape(self.__selection)
-        self.__selection = None
+        for shape in self.__selection:
+            self.__modeler.remove_shape(shape)
+        self.__selection = []
@@ -1,4 +1,4 @@
-
+from .util import pick_future
 
 
 class BController:
@@ -23,11 +23,9 @@ class BController:
         :return:
         """
         # check for selection
-        # as this is a separate thread, need context binding
-        with window.context.gl:
-            oid = id_picker.pick(pos=cursor.pos_local, size=(1, 1))[0][0]
-        oid = ClrRGBA(*oid).as_ubyte()[:3]
-        shape = GIDP().get_registered(oid)
+        # readback is served by render thread, wait for it here on the executor thread
+        oid, bitpattern = pick_future(id_picker, cursor.pos_local).result()
+        shape = GIDP().get_registered_byvalue(oid[0][0], bitpattern)
 
         if shape is None:
             # start drawing line
@@ -88,8 +86,7 @@ class BController:
                     clr[idx] = 1
                     guid_line.clr = clr
                 else:
-                    with window.context.gl:
-                        idx, tend = ap.pick_threshold()
+                    idx, tend = ap.pick_threshold()
                     # snap on to the axis, else pick vicinity
                     if idx is not None:
                         # snap on to the closest point and color
@@ -2,16 +2,46 @@ from mkernel.view.viewer import Viewer
 from mkernel.model import Model, AModel
 import mkernel.model.shapes as st
 import gkernel.dtype.geometric as gt
+from mkernel.control.util.tessellator import Tessellator
 
 
 class AModeler:
-    def __init__(self):
+    def __init__(self, tessellation_workers=None):
         """
         shape creator
 
-        :param model:
+        :param tessellation_workers: number of polygon tessellation processes,
+                                     None for cpu count, 0 for synchronous tessellation
         """
         self.__viewer = Viewer(self)
+        self.__tessellator = Tessellator(tessellation_workers)
+        self.__version = 0
+
+    @property
+    def version(self):
+        """
+        bumped whenever scene changes, frames rendered on demand compare it
+
+        :return: int
+        """
+        return self.__version
+
+    @property
+    def tessellator(self):
+        return self.__tessellator
+
+    def batch(self):
+        """
+        group shape edits into one transaction
+
+        Viewer cache writes are queued and applied once per frame by `render` anyway,
+        edits within the batch reach the queue together so no frame shows half of them.
+        ex) with modeler.batch():
+                pnt.clr = 1, 0, 0, 1
+                pnt.dia = 10
+        :return: context manager
+        """
+        return self.__viewer.batch()
 
     def add_model(self, parent):
         return self.__add_shape(parent, (self,), AModel)
@@ -41,7 +71,7 @@ class AModeler:
         else:
             raise NotImplementedError
 
-    def __add_shape(self, parent, args, shape_type):
+    def __add_shape(self, parent, args, shape_type, kwargs=None):
         """
         helper for adding geometric shapes like Point, Vector
 
@@ -50,8 +80,10 @@ class AModeler:
         :param renderer_type:
         :return:
         """
-        shape = shape_type(*args, __parent=parent) # hidden kwarg
+        kwargs = kwargs or {}
+        shape = shape_type(*args, __parent=parent, **kwargs) # hidden kwarg
         self.__viewer.malloc_shape(shape)
+        self.__version += 1
         return shape
 
     def remove_shape(self, shape):
@@ -63,11 +95,13 @@ class AModeler:
         """
         model = shape.parent
         model.remove_child(shape)
+        self.__tessellator.cancel(shape.goid)
         self.__viewer.free_shape(shape)
+        self.__version += 1
 
     def update_viewer_cache(self, shape, arg_name, value):
         """
-        viewer knows how to update cache
+        viewer knows how to update cache, write is queued until next `render`
 
         :param shape:
         :param arg_name:
@@ -75,6 +109,20 @@ class AModeler:
         :return:
         """
         self.__viewer.update_cache(shape, arg_name, value)
+        self.__version += 1
+
+    def tessellate(self, shape, outer, callback, priority=0):
+        """
+        request polygon tessellation, result is handed to callback within `render`
+
+        ! previous request of the shape is canceled
+        :param shape: requesting shape
+        :param outer: (N, 2) normalized coordinates of polygon
+        :param callback: called with (K, 3) triangle indices
+        :param priority: lower is tessellated first
+        :return:
+        """
+        self.__tessellator.submit(shape.goid, outer, callback=callback, priority=priority)
 
     def add_pnt(self, model, x, y, z) -> st.Pnt:
         """
@@ -87,6 +135,19 @@ class AModeler:
         """
         return self.__add_shape(model, args=(gt.Pnt(x, y, z),), shape_type=st.Pnt)
 
+    def add_pnts(self, model, coords) -> [st.Pnt]:
+        """
+        add many points at once
+
+        Buffer blocks of all points are requested in bulk.
+        :param coords: ((x, y, z), ...), coordinates of points
+        :return: [Pnt shape, ...]
+        """
+        coords = list(coords)
+        with self.batch():
+            self.__viewer.reserve_datasets(st.Pnt, [st.Pnt.__dataset_size__()] * len(coords))
+            return [self.__add_shape(model, args=(gt.Pnt(*c),), shape_type=st.Pnt) for c in coords]
+
     def add_lin(self, model, start, end) -> st.Lin:
         """
         add line
@@ -116,14 +177,16 @@ class AModeler:
         """
         return self.__add_shape(model, args=(gt.Plin(*vs),), shape_type=st.Plin)
 
-    def add_pgon(self, model, *vs) -> st.Pgon:
+    def add_pgon(self, model, *vs, priority=0) -> st.Pgon:
         """
         add polygon
 
+        Fill is tessellated in background and shown from the frame it is delivered.
         :param vs: vertices
+        :param priority: tessellation priority, lower is filled first, ex) visible polygons
         :return:
         """
-        return self.__add_shape(model, args=(gt.Pgon(*vs),), shape_type=st.Pgon)
+        return self.__add_shape(model, args=(gt.Pgon(*vs),), shape_type=st.Pgon, kwargs={'priority': priority})
 
     def add_brep(self):
         """
@@ -152,5 +215,15 @@ class AModeler:
         """
         return self.__add_shape(model, args=(color,), shape_type=st.Ground)
 
+    def poll(self):
+        """
+        deliver background work like tessellation without rendering
+
+        ! call every frame when rendering on demand, else results for clean frame are never delivered
+        :return:
+        """
+        self.__tessellator.poll()
+
     def render(self):
+        self.poll()
         self.__viewer.render()
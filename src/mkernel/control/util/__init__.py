@@ -1,2 +1,5 @@
 from .axis_picker.picker import AxisPicker
-from .vicinity_picker import VicinityPicker
\ No newline at end of file
+from .vicinity_picker import VicinityPicker
+from .tessellator import Tessellator
+from .region_picker import RegionPicker
+from .pick_future import pick_future
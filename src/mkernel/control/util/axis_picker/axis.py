@@ -6,7 +6,7 @@ class Axis(_MetaShape):
     def __init__(self, geo, renderer):
         vb = renderer.vbo.cache.request_block(size=1)
         ib = renderer.ibo.cache.request_block(size=1)
-        ib['idx'] = vb.indices
+        ib['idx'] = vb.indx_array
         goid = vb['oid'] = GIDP().register_entity(self).as_rgba_float()
         super().__init__(goid, (vb, ), (ib, ))
 
@@ -4,13 +4,19 @@ layout (points) in;
 layout (triangle_strip, max_vertices = 4) out;
 
 // camera plane coordinates and render pos
-layout (location=6) uniform mat4 fn_coord;
-layout (location=7) uniform mat4 ff_coord;
+// camera uniform block, see wkernel/devices/render/cameras/camera_ufrm_block.glsl
+layout (std140, row_major, binding = 0) uniform Camera {
+    mat4 PM;    // projection matrix
+    mat4 VM;    // view matrix
+    mat4 NCF;   // near clipping face in WCS, corners as columns
+    mat4 FCF;   // far clipping face in WCS, corners as columns
+    vec4 VPP;   // viewport pixel property (posx, posy, width, height)
+};
 
 // match vertex order
 const vec2 pos[] = {vec2(-1, -1), vec2(1, -1), vec2(-1, 1), vec2(1, 1)};
-const vec4 fn_coords[] = {fn_coord[0], fn_coord[1], fn_coord[3], fn_coord[2]};
-const vec4 ff_coords[] = {ff_coord[0], ff_coord[1], ff_coord[3], ff_coord[2]};
+const vec4 fn_coords[] = {NCF[0], NCF[1], NCF[3], NCF[2]};
+const vec4 ff_coords[] = {FCF[0], FCF[1], FCF[3], FCF[2]};
 
 in vsAttr {
     vec3 ori;
@@ -5,7 +5,6 @@ import ckernel.render_context.opengl_context.entities.meta as meta
 from ckernel.render_context.opengl_context.context_stack import get_current_ogl
 
 from mkernel.view.renderers import Renderer
-import ctypes
 
 
 class AxisRenderer(Renderer):
@@ -20,8 +19,9 @@ class AxisRenderer(Renderer):
     def __init__(self):
         self.__vbo = self.__prgrm.vrtx_attr_schema.create_vrtx_bffr()
 
-        self.__ibo = meta.MetaIndxBffr(dtype='uint')
+        self.__ibo = meta.MetaIndxBffr()
         self.__vao = meta.MetaVrtxArry(self.__vbo, indx_bffr=self.__ibo)
+        self.__ufrm_stamp = None  # (camera, version, pane size) uniforms were pushed at
 
     @property
     def vbo(self):
@@ -38,22 +38,20 @@ class AxisRenderer(Renderer):
         devices = get_current_ogl().manager.window.devices
         camera = devices.cameras.current
 
-        self.__prgrm.uniforms['PM'] = camera.body.PM
-        self.__prgrm.uniforms['VM'] = camera.tripod.VM
-        self.__prgrm.uniforms['pane_size'] = devices.panes.current.glyph.size
-        self.__prgrm.uniforms['LRBT'] = camera.body.dim[:4]
-        self.__prgrm.uniforms['cam_near'] = camera.body.near
-        self.__prgrm.uniforms['cam_ori'] = camera.tripod.plane.origin.T
-        self.__prgrm.uniforms['fn_coord'] = camera.near_clipping_face
-        self.__prgrm.uniforms['ff_coord'] = camera.far_clipping_face
-        self.__prgrm.push_uniforms()
+        self.push_camera_block()
+        pane_size = devices.panes.current.glyph.size
+        stamp = camera, camera.version, tuple(pane_size)
+        if self.__ufrm_stamp != stamp:
+            self.__prgrm.uniforms['pane_size'] = pane_size
+            self.__prgrm.uniforms['LRBT'] = camera.body.dim[:4]
+            self.__prgrm.uniforms['cam_near'] = camera.body.near
+            self.__prgrm.uniforms['cam_ori'] = camera.tripod.plane.origin.T
+            self.__prgrm.push_uniforms()
+            self.__ufrm_stamp = stamp
 
         self.__vbo.push_cache()
         self.__ibo.push_cache()
 
         with self.__prgrm:
             with self.__vao:
-                gl.glDrawElements(gl.GL_POINTS,
-                                  self.__ibo.cache.active_size,
-                                  self.__ibo.cache.gldtype[0],
-                                  ctypes.c_void_p(0))
+                self.draw_elements(gl.GL_POINTS, self.__ibo)
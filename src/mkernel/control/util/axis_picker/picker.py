@@ -1,8 +1,8 @@
 import gkernel.dtype.geometric as gt
 from .axis_renderer import AxisRenderer
 from .axis import Axis
-from gkernel.color import ClrRGBA
 from mkernel.global_id_provider import GIDP
+from ..pick_future import pick_future
 
 
 class AxisPicker:
@@ -33,19 +33,23 @@ class AxisPicker:
     def pick_threshold(self):
         """
         pick using texture pixel picking
+
+        ! with AsyncPixelPicker blocks until render thread delivers readbacks
         :return: picked, is picked an axis, closest point on the axis
         """
+        # issue both before waiting so that they share a frame
+        goid = pick_future(self.__id_picker, self.__cursor.pos_local)
+        coord = pick_future(self.__coord_picker, self.__cursor.pos_local)
         # pick goid
-        goid = self.__id_picker.pick(pos=self.__cursor.pos_local, size=(1, 1))[0][0]
-        goid = ClrRGBA(*goid).as_ubyte()[:3]
-        entity = GIDP().get_registered(goid)
+        goid, bitpattern = goid.result()
+        entity = GIDP().get_registered_byvalue(goid[0][0], bitpattern)
         idx = None
         for i, axis in enumerate(self.__axes):
             if entity == axis:
                 idx = i
                 break
 
-        coord = self.__coord_picker.pick(self.__cursor.pos_global.astype(int), size=(1, 1))[0][0]
+        coord = coord.result()[0][0][0]
 
         return idx, gt.Pnt(*coord[:3])
 
@@ -0,0 +1,24 @@
+from concurrent.futures import Future
+
+
+def pick_future(picker, pos, size=(1, 1)):
+    """
+    pick from either synchronous or asynchronous pixel picker
+
+    `FramePixelPicker` returns picked right away while `AsyncPixelPicker` returns Future,
+    result of the former is wrapped in a completed Future so callers can wait the same way.
+    ! with `FramePixelPicker` caller has to bind gl context,
+      with `AsyncPixelPicker` waiting on the render thread dead locks
+    :param picker: FramePixelPicker or AsyncPixelPicker
+    :param pos: (x, y), as `Frame.pick_pixels`
+    :param size: (width, height), as `Frame.pick_pixels`
+    :return: Future of (pixel_val, bitpattern)
+    """
+    picked = picker.pick(pos=pos, size=size)
+    if isinstance(picked, Future):
+        return picked
+    if picked is None:
+        raise ValueError('frame of picker is gone')
+    future = Future()
+    future.set_result(picked)
+    return future
@@ -0,0 +1,125 @@
+import numpy as np
+
+import gkernel.dtype.geometric as gt
+from mkernel.global_id_provider import GIDP
+from .pick_future import pick_future
+
+
+class RegionPicker:
+    """
+    Rectangle and lasso selection on id texture
+
+    Region is read in one go and every pixel is decoded at once,
+    distinct goids are then resolved into shapes in a single locked pass.
+    ! with `FramePixelPicker` caller has to bind gl context,
+      with `AsyncPixelPicker` picking waits for render thread so call it off the render thread
+    """
+
+    def __init__(self, id_picker):
+        """
+        :param id_picker: FramePixelPicker or AsyncPixelPicker of id attachment
+        """
+        self.__id_picker = id_picker
+
+    def pick_rect(self, pos, size):
+        """
+        pick shapes visible in the rectangle
+
+        :param pos: (x, y) bottom left corner, int absolute pixel or float parameterized
+        :param size: (width, height) in the same unit as pos, negative extends to the left, bottom
+        :return: {GOID: shape}
+        """
+        if isinstance(pos, gt.Vec):
+            pos = pos.xy
+        rect = self.__to_pixel_rect(pos, size)
+        if rect is None:
+            return {}
+        pixels, bitpattern = self.__read(*rect)
+        return GIDP().get_registered_byvalues(pixels, bitpattern)
+
+    def pick_lasso(self, vertices):
+        """
+        pick shapes visible in the closed polygon, pixel counts when its center is inside
+
+        :param vertices: ((x, y), ...) int absolute pixel or float parameterized, closing vertex not needed
+        :return: {GOID: shape}
+        """
+        vrtxs = self.__to_pixel(vertices)
+        if len(vrtxs) < 3:
+            raise ValueError('lasso needs at least 3 vertices')
+        lo = np.floor(vrtxs.min(axis=0)).astype(int)
+        hi = np.ceil(vrtxs.max(axis=0)).astype(int)
+        rect = self.__to_pixel_rect(lo, hi - lo)
+        if rect is None:
+            return {}
+        x, y, w, h = rect
+        pixels, bitpattern = self.__read(x, y, w, h)
+        mask = self.lasso_mask(vrtxs - (x, y), (w, h))
+        return GIDP().get_registered_byvalues(pixels[mask], bitpattern)
+
+    @staticmethod
+    def lasso_mask(vertices, size):
+        """
+        rasterize polygon by even-odd scanline
+
+        Crossings of every edge with every pixel row center are calculated at once,
+        sorted per row and paired into spans that are filled by cumulative sum.
+        :param vertices: (N, 2) pixel coordinates relative to the mask origin
+        :param size: (width, height) of mask
+        :return: (height, width) bool array
+        """
+        w, h = size
+        vrtxs = np.asarray(vertices, dtype=float)
+        (ax, ay), (bx, by) = vrtxs.T, np.roll(vrtxs, -1, axis=0).T
+        is_slanted = ay != by  # horizontal edges never cross row center
+        ax, ay, bx, by = ax[is_slanted], ay[is_slanted], bx[is_slanted], by[is_slanted]
+
+        # rows whose center lies within [min y, max y) of each edge
+        row_lo = np.clip(np.ceil(np.minimum(ay, by) - 0.5), 0, h).astype(int)
+        row_hi = np.clip(np.ceil(np.maximum(ay, by) - 0.5), 0, h).astype(int)
+        counts = row_hi - row_lo
+        edges = np.repeat(np.arange(len(counts)), counts)
+        rows = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + row_lo[edges]
+        xs = ax[edges] + (rows + 0.5 - ay[edges]) * (bx - ax)[edges] / (by - ay)[edges]
+
+        # pair crossings of the same row into spans of pixel centers
+        order = np.lexsort((xs, rows))
+        rows, xs = rows[order][::2], xs[order]
+        col_lo = np.clip(np.ceil(xs[::2] - 0.5), 0, w).astype(int)
+        col_hi = np.clip(np.ceil(xs[1::2] - 0.5), 0, w).astype(int)
+        diff = np.zeros((h, w + 1), dtype=np.int32)
+        np.add.at(diff, (rows, col_lo), 1)
+        np.add.at(diff, (rows, col_hi), -1)
+        return 0 < np.cumsum(diff[:, :w], axis=1)
+
+    def __to_pixel(self, vertices):
+        """
+        :return: (N, 2) float array of absolute pixel coordinates
+        """
+        vrtxs = np.asarray(vertices)
+        if vrtxs.dtype.kind == 'f':
+            vrtxs = vrtxs * self.__id_picker.size
+        return vrtxs.astype(float).reshape(-1, 2)
+
+    def __to_pixel_rect(self, pos, size):
+        """
+        normalize rectangle and clip it by frame
+
+        :return: (x, y, width, height) in pixel, None if empty
+        """
+        (x0, y0), (x1, y1) = self.__to_pixel((pos, np.add(pos, size)))
+        (x0, x1), (y0, y1) = sorted((x0, x1)), sorted((y0, y1))
+        fw, fh = map(int, self.__id_picker.size)
+        x0, y0 = max(int(np.floor(x0)), 0), max(int(np.floor(y0)), 0)
+        x1, y1 = min(int(np.ceil(x1)), fw), min(int(np.ceil(y1)), fh)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return x0, y0, x1 - x0, y1 - y0
+
+    def __read(self, x, y, w, h):
+        """
+        :return: ((height, width) array of packed pixels, bitpattern)
+        """
+        values, bitpattern = pick_future(self.__id_picker, (x, y), (w, h)).result()
+        # glReadPixels writes rows bottom to top whatever shape returned array claims
+        return np.ravel(values).reshape(h, w), bitpattern
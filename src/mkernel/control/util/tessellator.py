@@ -0,0 +1,201 @@
+import os
+import heapq
+import concurrent.futures as cf
+from warnings import warn
+
+import numpy as np
+from gkernel.tools import Triangulator
+
+
+def _triangulate_chunk(polygons):
+    """
+    process pool entry, polygons are triangulated apart so that one failing doesn't fail the chunk
+
+    :param polygons: [(outer, holes), ...]
+    :return: [(K, 3) int array or exception raised, ...]
+    """
+    results = []
+    for outer, holes in polygons:
+        try:
+            results.append(Triangulator.triangulate(outer, holes))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+class Tessellator:
+    """
+    Polygon tessellation service running on process pool
+
+    Polygons are submitted with a key and a callback receiving (K, 3) triangle indices.
+    Jobs wait in a priority queue and are dispatched by `poll` in chunks,
+    `poll` also hands finished results to callbacks so call it once per frame from the thread
+    owning shapes' caches.
+
+    ! submitting with the same key supersedes the job not yet delivered
+    ! polygon failing to triangulate, ex) self intersecting, is dropped with a warning,
+      its callback is never called
+    ! with `max_workers` 0 or when the pool breaks, jobs run synchronously within `poll`
+    """
+    # number of vertices sent to a worker at once, small polygons are chunked to amortize ipc
+    CHUNK_VRTX = 4096
+    # number of chunks in flight per worker, rest waits in the priority queue
+    CHUNKS_PER_WORKER = 2
+
+    def __init__(self, max_workers=None):
+        """
+
+        :param max_workers: number of worker processes, None for cpu count, 0 for synchronous tessellation
+        """
+        self.__max_workers = os.cpu_count() if max_workers is None else max_workers
+        self.__pool = None
+        self.__queue = []  # heap of (priority, ticket, key, outer, holes)
+        self.__tickets = {}  # {key: ticket} of the latest submission
+        self.__callbacks = {}  # {ticket: callback} of jobs not yet delivered
+        self.__flying = {}  # {future: [(ticket, key, outer, holes), ...]}
+        self.__counter = 0
+
+    def __len__(self):
+        """
+        :return: number of jobs not yet delivered
+        """
+        return len(self.__callbacks)
+
+    def __str__(self):
+        return f"<Tessellator workers:{self.__max_workers} pending:{len(self)}>"
+
+    @property
+    def is_sync(self):
+        return not self.__max_workers
+
+    def submit(self, key, outer, holes=(), callback=None, priority=0):
+        """
+        queue polygon for tessellation
+
+        :param key: hashable, identifies the polygon, previous job of the same key is canceled
+        :param outer: (N, 2) coordinates of outer boundary
+        :param holes: iterable of (M, 2) coordinates of holes
+        :param callback: called with (K, 3) triangle indices when delivered
+        :param priority: Number, lower is dispatched first, ex) visible polygons
+        :return: int, ticket
+        """
+        self.cancel(key)
+        self.__counter += 1
+        ticket = self.__counter
+        self.__tickets[key] = ticket
+        self.__callbacks[ticket] = callback
+        outer = np.asarray(outer, dtype=float)
+        holes = tuple(np.asarray(h, dtype=float) for h in holes)
+        heapq.heappush(self.__queue, (priority, ticket, key, outer, holes))
+        return ticket
+
+    def cancel(self, key):
+        """
+        cancel job of given key, result of it will not be delivered
+
+        :param key:
+        :return:
+        """
+        ticket = self.__tickets.pop(key, None)
+        self.__callbacks.pop(ticket, None)
+
+    def poll(self):
+        """
+        deliver finished results and dispatch waiting jobs
+
+        :return:
+        """
+        for future in [f for f in self.__flying if f.done()]:
+            self.__collect(future)
+        self.__dispatch()
+
+    def flush(self):
+        """
+        block until every job is delivered
+
+        :return:
+        """
+        while self.__queue or self.__flying:
+            self.__dispatch()
+            if self.__flying:
+                done, _ = cf.wait(self.__flying, return_when=cf.FIRST_COMPLETED)
+                for future in done:
+                    self.__collect(future)
+
+    def shutdown(self):
+        """
+        drop every job and stop workers
+
+        :return:
+        """
+        for future in self.__flying:
+            future.cancel()
+        if self.__pool:
+            self.__pool.shutdown(wait=False)
+        self.__pool = None
+        self.__queue.clear()
+        self.__tickets.clear()
+        self.__callbacks.clear()
+        self.__flying.clear()
+
+    def __pop_chunk(self, size):
+        """
+        pop live jobs in priority order until vertex count reaches size
+
+        :return: [(ticket, key, outer, holes), ...]
+        """
+        chunk, num_vrtx = [], 0
+        while self.__queue and num_vrtx < size:
+            _, ticket, key, outer, holes = heapq.heappop(self.__queue)
+            if ticket not in self.__callbacks:  # canceled or superseded
+                continue
+            chunk.append((ticket, key, outer, holes))
+            num_vrtx += len(outer) + sum(len(h) for h in holes)
+        return chunk
+
+    def __dispatch(self):
+        if self.is_sync:
+            self.__run_sync(self.__pop_chunk(float('inf')))
+            return
+
+        if self.__pool is None:
+            self.__pool = cf.ProcessPoolExecutor(self.__max_workers)
+        limit = self.__max_workers * self.CHUNKS_PER_WORKER
+        while self.__queue and len(self.__flying) < limit:
+            chunk = self.__pop_chunk(self.CHUNK_VRTX)
+            if not chunk:
+                break
+            try:
+                future = self.__pool.submit(_triangulate_chunk, [(o, h) for _, _, o, h in chunk])
+            except RuntimeError:  # broken or shut down pool
+                self.__max_workers = 0
+                self.__run_sync(chunk)
+                continue
+            self.__flying[future] = chunk
+
+    def __collect(self, future):
+        chunk = self.__flying.pop(future)
+        try:
+            results = future.result()
+        except Exception:  # worker died, ex) broken pool
+            self.__run_sync(chunk)
+            return
+        for (ticket, key, _, _), tris in zip(chunk, results):
+            self.__deliver(ticket, key, tris)
+
+    def __run_sync(self, chunk):
+        chunk = [job for job in chunk if job[0] in self.__callbacks]
+        results = _triangulate_chunk([(o, h) for _, _, o, h in chunk])
+        for (ticket, key, _, _), tris in zip(chunk, results):
+            self.__deliver(ticket, key, tris)
+
+    def __deliver(self, ticket, key, tris):
+        if ticket not in self.__callbacks:  # canceled while in flight
+            return
+        callback = self.__callbacks.pop(ticket)
+        del self.__tickets[key]
+        if isinstance(tris, Exception):
+            warn(f"tessellation of {key} dropped: {tris!r}")
+            return
+        if callback:
+            callback(tris)
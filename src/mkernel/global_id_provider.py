@@ -1,6 +1,7 @@
+import gc
 import threading
-import random
 import weakref as wr
+from collections import deque
 from global_tools.singleton import Singleton
 import numpy as np
 
@@ -11,6 +12,20 @@ from gkernel.color import ClrRGBA
 _BITDEPTH = 30
 _COMP_BITDEPTH = 10
 _COMP_BITMAX = 2 ** _COMP_BITDEPTH - 1
+# raw id is generation bits over index bits, generation tells stale id of recycled index
+_GEN_BITDEPTH = 6
+_INDX_BITDEPTH = _BITDEPTH - _GEN_BITDEPTH
+_INDX_MAX = 2 ** _INDX_BITDEPTH - 1
+_GEN_MAX = 2 ** _GEN_BITDEPTH - 1
+# component shifts, red the most significant
+_COMP_SHIFTS = np.array([2 * _COMP_BITDEPTH, _COMP_BITDEPTH, 0], dtype=np.uint32)
+
+
+class _EntityRef(wr.ref):
+    """
+    weak reference remembering its index in the table
+    """
+    __slots__ = ('indx',)
 
 
 @Singleton
@@ -19,61 +34,125 @@ class GIDP:
     Global ID Provider
     to provide oid for all shapes
 
+    Entities are held weakly in a flat table indexed by goid's index bits.
+    Index of dead or deregistered entity is recycled with its generation bumped
+    so that stale goid decodes into nothing.
+    Index 0 is never given, it is what cleared id texture decodes into.
+    Entity keeps its goid until deregistered, registering it again returns the same goid.
+
     ! has to be thread safe
     """
 
     def __init__(self):
-        self.__entity_goid = wr.WeakKeyDictionary()
-        self.__goid_entity = wr.WeakValueDictionary()
-
+        self.__refs = [None]  # {index: _EntityRef}
+        self.__gens = [0]  # {index: generation}
+        self.__free = []  # recyclable indices
+        self.__dead = deque()  # refs of collected entities, appended by gc callback
         self.__lock = threading.Lock()
 
+    def __on_collect(self, ref):
+        # may run within any allocation so defer to the next lock holder
+        self.__dead.append(ref)
+
+    def __recycle(self):
+        """
+        release indices of collected entities
+
+        ! lock has to be held
+        :return:
+        """
+        while self.__dead:
+            ref = self.__dead.popleft()
+            if self.__refs[ref.indx] is ref:  # not deregistered explicitly
+                self.__release(ref.indx)
+
+    def __release(self, indx):
+        self.__refs[indx] = None
+        self.__gens[indx] = (self.__gens[indx] + 1) & _GEN_MAX
+        self.__free.append(indx)
+
+    def __register(self, entity):
+        """
+        ! lock has to be held
+        """
+        for ref in wr.getweakrefs(entity):  # already registered, weakrefs of an entity are few
+            if type(ref) is _EntityRef and self.__refs[ref.indx] is ref:
+                return self.__goid(ref.indx)
+        if self.__free:
+            indx = self.__free.pop()
+        else:
+            indx = len(self.__refs)
+            if _INDX_MAX < indx:
+                raise OverflowError('goid exhausted')
+            self.__refs.append(None)
+            self.__gens.append(0)
+        ref = _EntityRef(entity, self.__on_collect)
+        ref.indx = indx
+        self.__refs[indx] = ref
+        return self.__goid(indx)
+
+    def __goid(self, indx):
+        return GOID(self.__gens[indx] << _INDX_BITDEPTH | indx)
+
     def register_entity(self, entity):
         """
         register color id with the entity
 
         ! thread safe
         :param entity:
-        :return: oid
+        :return: GOID, existing one if entity is already registered
         """
-
         with self.__lock:
-            if entity in self.__entity_goid:
-                return self.__entity_goid[entity]
+            self.__recycle()
+            return self.__register(entity)
 
-            # find vacant id
-            while True:
-                goid = random.getrandbits(_BITDEPTH)
-                if goid not in self.__goid_entity:
-                    break
+    def register_entities(self, entities):
+        """
+        register color ids with many entities at once
 
-            goid = GOID(goid)
-            self.__entity_goid[entity] = goid
-            self.__goid_entity[goid] = entity
-            return goid
+        ! thread safe
+        ! cyclic gc is paused while registering as refs and ids created are not cyclic,
+          else gc keeps rescanning the growing table
+        :param entities: iterable of entities
+        :return: [GOID, ...]
+        """
+        is_gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with self.__lock:
+                self.__recycle()
+                return [self.__register(e) for e in entities]
+        finally:
+            if is_gc_enabled:
+                gc.enable()
 
-    def deregister(self, entity):
+    def deregister(self, goid):
         """
-        remove entity from the register
+        remove entity from the register, goid becomes stale
 
-        :param entity:
+        :param goid: GOID
         :return:
         """
         with self.__lock:
-            if entity not in self.__entity_goid:
-                raise
-            goid = self.__entity_goid[entity]
-            del self.__entity_goid[entity]
-            del self.__goid_entity[goid]
+            if self.__lookup(goid) is None:
+                raise KeyError('goid not registered')
+            self.__release(goid & _INDX_MAX)
 
-    def is_registered(self, entity):
+    def is_registered(self, goid):
         """
-        check if entity is registered
+        check if goid is registered and the entity is alive
 
-        :param entity:
+        :param goid:
         :return:
         """
-        return entity in self.__entity_id
+        return self.__lookup(goid) is not None
+
+    def __lookup(self, raw):
+        indx = raw & _INDX_MAX
+        if len(self.__refs) <= indx or self.__gens[indx] != raw >> _INDX_BITDEPTH:
+            return None
+        ref = self.__refs[indx]
+        return ref() if ref is not None else None
 
     def get_registered(self, goid):
         """
@@ -85,7 +164,7 @@ class GIDP:
         if not isinstance(goid, GOID):
             raise TypeError('use ~_byvalue version for encoded goid')
         with self.__lock:
-            return self.__goid_entity.get(goid, None)
+            return self.__lookup(goid)
 
     def get_registered_byvalue(self, value, bitpattern=None):
         """
@@ -96,63 +175,103 @@ class GIDP:
         :return:
         """
         # integer with alpha e.g. gl.GL_RGB10_A2
-        if isinstance(value, (int, np.uintc)):
-            if 3 < len(bitpattern):
+        if isinstance(value, (int, np.integer)):
+            value = int(value)
+            if bitpattern and 3 < len(bitpattern):
                 value >>= bitpattern[3]
             with self.__lock:
-                return self.__goid_entity.get(value, None)
+                return self.__lookup(value)
         raise NotImplementedError(value, type(value))
 
-
-class GOID:
-    def __init__(self, raw):
+    def get_registered_byvalues(self, values, bitpattern=None):
         """
-        Global Object IDentifier
+        decode array of packed values and return objects of distinct goids
 
-        id containter + encoder
+        ! id image is mostly runs of the same id, runs are collapsed before sorting
+        :param values: array of packed integer pixels
+        :param bitpattern:
+        :return: {GOID: entity} of alive entities
         """
-        self.__raw = raw
+        raws = GOID.decode_packed(values, bitpattern).ravel()
+        if len(raws):
+            raws = raws[np.concatenate(([True], raws[1:] != raws[:-1]))]
+        raws = np.unique(raws)
+        with self.__lock:
+            self.__recycle()
+            found = {}
+            for raw in raws[raws != 0].tolist():  # 0 is cleared background
+                entity = self.__lookup(raw)
+                if entity is not None:
+                    found[GOID(raw)] = entity
+            return found
 
-    def __str__(self):
-        return f"<GOID {self.__raw}>"
 
-    def __hash__(self):
-        return hash(self.__raw)
+class GOID(int):
+    """
+    Global Object IDentifier
 
-    def __eq__(self, other):
-        return hash(self) == hash(other)
+    id as int + encoder
+    Raw id of `_BITDEPTH` bits is split into rgb components of `_COMP_BITDEPTH` bits,
+    red holding the most significant bits.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        return f"<GOID {int(self)}>"
 
     def as_raw(self):
         """
         :return: raw id as unsigned int
         """
-        return self.__raw
+        return int(self)
+
+    @property
+    def indx(self):
+        return self & _INDX_MAX
 
-    def __get_color_bits(self):
+    @property
+    def gen(self):
+        return self >> _INDX_BITDEPTH
+
+    def as_rgb_uint(self):
+        return np.array((self >> 2 * _COMP_BITDEPTH, self >> _COMP_BITDEPTH & _COMP_BITMAX, self & _COMP_BITMAX),
+                        dtype='uint32')
+
+    def as_rgb_float(self):
+        return self.as_rgb_uint() / _COMP_BITMAX
+
+    @staticmethod
+    def encode_rgb_float(raws):
         """
-        translate goid's raw int expression into binary rgb color components
-        :return: (r, g, b) binary expression
+        batch encode
+
+        :param raws: (...) array of raw ids
+        :return: (..., 3) array of float rgb components
         """
-        # bits
-        bits = bin(self.__raw)[2:].rjust(_BITDEPTH, '0')
-        color = []
+        raws = np.asarray(raws, dtype=np.uint32)[..., None]
+        return (raws >> _COMP_SHIFTS & _COMP_BITMAX) / _COMP_BITMAX
 
-        # color component bit depth
-        cbits = _BITDEPTH // 3
-        for i in range(3):
-            comp = bits[i * cbits:(i + 1) * cbits]
-            color.append(comp)
-        return color
+    @staticmethod
+    def decode_rgb_float(rgb):
+        """
+        batch decode
 
-    # def as_rgb_uint(self):
-    #     return np.array([int(c, 2) for c in self.__get_color_bits()], dtype='uint32')
-    def as_rgb_float(self):
-        return np.array([int(c, 2) / _COMP_BITMAX for c in self.__get_color_bits()], dtype='float')
+        :param rgb: (..., 3 or 4) array of float rgb(a) components
+        :return: (...) array of raw ids
+        """
+        comps = np.rint(np.asarray(rgb)[..., :3] * _COMP_BITMAX).astype(np.uint32)
+        return np.bitwise_or.reduce(comps << _COMP_SHIFTS, axis=-1)
 
+    @staticmethod
+    def decode_packed(values, bitpattern=None):
+        """
+        batch decode integer pixels of packed format like GL_RGB10_A2UI
 
-if __name__ == '__main__':
-    a = GOID(5, 8)
-    print(a == 5)
-    s = {a}
-    print(5 in s)
-    print(np.array([1, 2, 3], dtype='uint128').dtype)
+        :param values: array of packed integer pixels
+        :param bitpattern: component bit depths, alpha bits are shifted out
+        :return: array of raw ids
+        """
+        values = np.asarray(values, dtype=np.uint32)
+        if bitpattern and 3 < len(bitpattern):
+            values = values >> bitpattern[3]
+        return values
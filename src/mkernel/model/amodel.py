@@ -27,5 +27,8 @@ class AModel(Shape):
     def update_viewer_cache(self, shape, arg_name, value):
         self.__modeler.update_viewer_cache(shape, arg_name, value)
 
+    def tessellate(self, shape, outer, callback, priority=0):
+        self.__modeler.tessellate(shape, outer, callback, priority)
+
     def __dataset_size__(self):
         return 0
\ No newline at end of file
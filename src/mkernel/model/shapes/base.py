@@ -64,7 +64,13 @@ class _MetaShape(type):
             obj.__parent = wr.ref(parent)
             parent.add_child(obj)
 
-        obj.__init__(*args, **kwargs)
+        try:
+            obj.__init__(*args, **kwargs)
+        except Exception:
+            # rejected shape, ex) invalid geometry, should not stay in the tree
+            if parent is not None:
+                parent.remove_child(obj)
+            raise
         return obj
 
     @staticmethod
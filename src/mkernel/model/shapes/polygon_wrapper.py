@@ -2,6 +2,7 @@ from math import inf
 from numbers import Number
 from collections import deque
 import bisect
+import weakref as wr
 
 import numpy as np
 from global_tools.red_black_tree import RedBlackTree
@@ -20,14 +21,22 @@ class Pgon(Shape):
     Polygon shape
     """
 
-    def __init__(self, geo: gt.Pgon):
-        vertices, fill_indxs, edge_indxs = _Trapezoidator().gen_quad_strip(geo)
-        self.__size = len(vertices)
-        self.parent.update_viewer_cache(self, 'fill_indxs', fill_indxs)
-        self.parent.update_viewer_cache(self, 'edge_indxs', edge_indxs)
+    def __init__(self, geo: gt.Pgon, priority=0):
+        """
+
+        :param geo: polygon
+        :param priority: tessellation priority, lower is filled first, ex) visible polygons
+        """
+        if not isinstance(geo, gt.Pgon):
+            raise TypeError
+        self.__size = geo.shape[1] - 1
+        self.__priority = priority
+        # geo first, invalid one raises before anything is queued
+        self._geo = self.geo = geo
+        # close loop and pad adjacency for GL_LINE_STRIP_ADJACENCY
+        self.parent.update_viewer_cache(self, 'edge_indxs', list(range(self.__size)) + [0, 1, 2])
 
         self.parent.update_viewer_cache(self, 'goid', self.goid.as_rgb_float())
-        self._geo = self.geo = vertices
         self._clr = self.clr = 1, 1, 1, 1
         self._edge_thk = self.edge_thk = 1
         self._clr_edge = self.clr_edge = ClrRGBA(0, 0, 0, 1)
@@ -41,9 +50,30 @@ class Pgon(Shape):
         return self._geo
 
     @geo.setter
-    def geo(self, val):
+    def geo(self, val: gt.Pgon):
+        """
+        vertices are updated at once, fill is updated when tessellation is delivered
+
+        :param val: polygon of the same number of vertices, planar and simple
+        :return:
+        """
+        if val.shape[1] - 1 != self.__size:
+            raise ValueError('number of vertices can not change')
+        # validates so that tessellator never meets crossing edges
+        normalized = val.normalized
         self._geo = val
-        self.parent.update_viewer_cache(self, 'geo', val)
+        self.parent.update_viewer_cache(self, 'geo', np.array(val[:, :-1].T))
+        # vertices are kept so triangulating on normalized plane indexes them as they are
+        self.parent.tessellate(self, normalized[:2, :-1].T, self.__fill_callback(), self.__priority)
+
+    def __fill_callback(self):
+        ref = wr.ref(self)
+
+        def fill(tris):
+            shape = ref()
+            if shape is not None and shape.parent is not None:
+                shape.parent.update_viewer_cache(shape, 'fill_indxs', tris)
+        return fill
 
     @property
     def clr(self):
@@ -151,7 +181,7 @@ class _Trapezoidator:
 
         rb = RedBlackTree(comparator=__vertex_comparator)  # sort by y,x
         far_x = -inf  # find far x for further research
-        vertices = deque([gt.Pnt(*coord) for coord in arr[:3].T])
+        vertices = deque(gt.PntArray.from_array(arr))
         edges, edge_vrtx = deque(), deque()
         while vertices:
             if not edges:
@@ -220,12 +250,10 @@ class _Trapezoidator:
         edges = RedBlackTree(__edge_comparator)
         # find trapezoids
         for i, vrtx in enumerate(vrtxs):
-            print(vrtx)
             if edges:
                 if vrtx.cat == CAT.MAX:
                     # weav peak
                     if vrtx.sweep_dir == SWEEP.NONE:
-                        edges.uprint()
                         trapezoids.tryadd_right_left(edges, vrtx.ending_edges[0], vrtx.y)
                     elif vrtx.sweep_dir == SWEEP.BOTH:
                         trapezoids.tryadd_left_right(edges, vrtx.ending_edges[0], vrtx.y)
@@ -246,10 +274,6 @@ class _Trapezoidator:
             for e in vrtx.starting_edges:
                 if not e.is_zero:
                     edges.insert_unique(e)
-
-            for i in trapezoids.geos:
-                print(i)
-            edges.uprint()
         return trapezoids
 
     def __stage_three(self, pgon, edge_vrtx, trapezoids):
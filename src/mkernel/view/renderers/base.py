@@ -1,6 +1,13 @@
 import abc
 import os
+import time
+import ctypes
 import weakref as wr
+from collections import deque
+
+import numpy as np
+import ckernel.render_context.opengl_context.opengl_hooker as gl
+from ckernel.render_context.opengl_context.context_stack import get_current_ogl
 
 
 __THIS_PATH = os.path.dirname(__file__)
@@ -10,8 +17,16 @@ def get_shader_fullpath(rel_path):
 
 
 class Renderer(metaclass=abc.ABCMeta):
+    # seconds per frame given to packing caches, shared by every cache of every renderer, see `BffrCache.compact`
+    COMPACT_TIME_BUDGET = 0.001
+    # index cache of hole ratio over this is drawn by live ranges only, else whole with restart values,
+    # see `scraps/bench/PRV vs multi draw rendering.py`
+    MULTI_DRAW_HOLE_RATIO = 0.25
+
     def __init__(self):
         self.__datasets = wr.WeakKeyDictionary()
+        self.__reserved = {}  # {dataset size: deque(dataset, ...)}
+        self.__compact_deadline = None
 
     @property
     def datasets(self):
@@ -26,10 +41,39 @@ class Renderer(metaclass=abc.ABCMeta):
         """
         if shape in self.datasets:
             return
-        dataset = self.create_dataset(shape.__dataset_size__())
+        size = shape.__dataset_size__()
+        reserved = self.__reserved.get(size)
+        if reserved:
+            dataset = reserved.popleft()
+        else:
+            dataset = self.create_dataset(size)
         self.datasets[shape] = dataset
         wr.finalize(shape, self.free_finalizer, dataset)
 
+    def reserve_datasets(self, sizes):
+        """
+        bulk create datasets for shapes about to be malloced
+
+        Reserved datasets are handed to `malloc_shape` in the given order, ones left are freed by `release_reserved`.
+        :param sizes: (int, ...), dataset size of each shape
+        :return:
+        """
+        for size, dataset in zip(sizes, self.create_datasets(sizes)):
+            self.__reserved.setdefault(size, deque()).append(dataset)
+
+    def release_reserved(self):
+        """
+        release reserved datasets no shape has taken
+
+        Shape removed before it is malloced leaves its reservation behind,
+        drawing whatever its blocks are holding.
+        :return:
+        """
+        for reserved in self.__reserved.values():
+            for dataset in reserved:
+                self.free_finalizer(dataset)
+        self.__reserved.clear()
+
     def free_shape(self, shape):
         """
         if present, remove
@@ -43,6 +87,79 @@ class Renderer(metaclass=abc.ABCMeta):
             return
         self.free_finalizer(self.datasets.pop(shape))
 
+    def set_compact_deadline(self, deadline):
+        """
+        share frame budget of compaction with other renderers, consumed by the next `compact_caches`
+
+        :param deadline: `time.perf_counter` value compaction has to end by
+        :return:
+        """
+        self.__compact_deadline = deadline
+
+    def compact_caches(self, vbo, *ibos):
+        """
+        incrementally pack vertex and index caches within frame budget
+
+        Caches share the deadline given by `set_compact_deadline`, else one `COMPACT_TIME_BUDGET` from now,
+        caches left when time runs out wait for the next frame.
+        Vertex indices stored in index caches are patched for moved vertices.
+        Index blocks are moved without splitting to keep primitives intact.
+        ! vertex blocks are split over holes so they may be non-contiguous,
+          index writers have to map local vertex index through `indx_array` of vertex block
+        :param vbo: MetaVrtxBffr
+        :param ibos: MetaIndxBffr referring the vbo
+        :return:
+        """
+        deadline, self.__compact_deadline = self.__compact_deadline, None
+        if deadline is None:
+            deadline = time.perf_counter() + self.COMPACT_TIME_BUDGET
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return
+        remap = vbo.cache.compact(time_budget=remaining)
+        for ibo in ibos:  # always, else indices point vacated vertices
+            ibo.remap_indices(remap)
+        for ibo in ibos:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            ibo.cache.compact(time_budget=remaining, split=False)
+
+    @staticmethod
+    def push_camera_block():
+        """
+        bind uniform block of current camera for programs declaring `Camera` block
+
+        Block is uploaded only when camera or viewport has changed, so renderers can call this freely.
+        :return:
+        """
+        devices = get_current_ogl().manager.window.devices
+        devices.cameras.current.push_ufrm_block(devices.panes.current)
+
+    def draw_elements(self, mode, ibo):
+        """
+        draw index buffer picking cheaper path
+
+        Released index blocks are filled with primitive restart value, so drawing whole active range
+        walks through holes. When holes are many, only live runs are drawn by `glMultiDrawElements`.
+        ! blocks are kept whole in a run so primitives are never cut
+        :param mode: gl primitive mode, ex) gl.GL_POINTS
+        :param ibo: MetaIndxBffr, has to be bound
+        :return:
+        """
+        cache = ibo.cache
+        gldtype = cache.gldtype[0]
+        if cache.hole_ratio <= self.MULTI_DRAW_HOLE_RATIO:
+            gl.glDrawElements(mode, cache.active_size, gldtype, ctypes.c_void_p(0))
+            return
+        offsets, counts = cache.live_runs
+        ptrs = (offsets * cache.array.itemsize).astype(np.uintp)
+        gl.glMultiDrawElements(mode,
+                               counts.astype(np.int32),
+                               gldtype,
+                               (ctypes.c_void_p * len(ptrs)).from_buffer(ptrs),
+                               len(ptrs))
+
     @abc.abstractmethod
     def create_dataset(self, size):
         """
@@ -51,10 +168,59 @@ class Renderer(metaclass=abc.ABCMeta):
         """
         pass
 
+    def create_datasets(self, sizes):
+        """
+        create multiple datasets
+
+        Override to use bulk block request.
+        :param sizes: (int, ...)
+        :return: [dataset, ...]
+        """
+        return [self.create_dataset(size) for size in sizes]
+
+    @staticmethod
+    def request_indexed_blocks(vbo, ibo, sizes):
+        """
+        request vertex and index blocks of many shapes at once
+
+        Index blocks are initialized to point vertices of their vertex blocks
+        by a single vectorized write.
+        :param vbo: MetaVrtxBffr
+        :param ibo: MetaIndxBffr
+        :param sizes: (int, ...)
+        :return: [(vertex block, index block), ...]
+        """
+        vstart, vstop, vbs = vbo.cache.request_blocks(sizes)
+        istart, istop, ibs = ibo.cache.request_blocks(sizes)
+        ibo.cache.write_range('idx', istart, istop, np.arange(vstart, vstop))
+        return zip(vbs, ibs)
+
     @abc.abstractmethod
     def update_cache(self, shape, arg_name, value):
         pass
 
+    def update_caches(self, shapes, arg_name, values):
+        """
+        update the same attribute of many shapes
+
+        Override to write in bulk, ex) `BffrCache.write_blocks`.
+        :param shapes: (shape, ...)
+        :param arg_name: attribute name
+        :param values: (value, ...), value of each shape
+        :return:
+        """
+        for shape, value in zip(shapes, values):
+            self.update_cache(shape, arg_name, value)
+
+    def write_vrtx_blocks(self, vbo, shapes, arg_name, values):
+        """
+        bulk write attribute into vertex blocks of shapes, dataset holding vertex block as 'vrtx'
+
+        :param vbo: MetaVrtxBffr shapes' vertex blocks belong to
+        :return:
+        """
+        vbo.cache.write_blocks(arg_name, [self.datasets[shape]['vrtx'] for shape in shapes], values)
+
     @abc.abstractmethod
     def free_finalizer(self, dataset):
         pass
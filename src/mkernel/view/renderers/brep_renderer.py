@@ -15,7 +15,7 @@ class BrepRenderer(Renderer):
         frgm_path=get_shader_fullpath('shaders/pnts/pntCir_frgm_shdr.glsl'))
 
     def __init__(self):
-        self.__pnt_ibo = meta.MetaIndxBffr(dtype='uint')
+        self.__pnt_ibo = meta.MetaIndxBffr()
         self.__pnt_vao = meta.MetaVrtxArry(
             self.__vrtx_vbo,
             self.__pnt_vbo,
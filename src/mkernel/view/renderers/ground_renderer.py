@@ -15,6 +15,7 @@ class GroundRenderer(Renderer):
 
     def __init__(self):
         super().__init__()
+        self.__camera_stamp = None  # (camera, version, num vertices) clipping faces were written at
 
         self.__vbo = self.__prgrm.vrtx_attr_schema.create_vrtx_bffr()
         self.__vao = meta.MetaVrtxArry(self.__vbo)
@@ -34,14 +35,16 @@ class GroundRenderer(Renderer):
 
     def render(self):
         camera = get_current_ogl().manager.window.devices.cameras.current
-        # update camera properties
-        for block in self.__vbo.cache.blocks:
-            block['near'] = camera.near_clipping_face[:3].T
-            block['far'] = camera.far_clipping_face[:3].T
+        # update camera properties only if camera or grounds have changed
+        stamp = camera, camera.version, self.__vbo.cache.num_vrtx_inuse
+        if self.__camera_stamp != stamp:
+            for block in self.__vbo.cache.blocks:
+                block['near'] = camera.near_clipping_face[:3].T
+                block['far'] = camera.far_clipping_face[:3].T
+            self.__camera_stamp = stamp
         self.__vbo.push_cache()
 
-        self.__prgrm.uniforms['PM'] = camera.body.PM
-        self.__prgrm.uniforms['VM'] = camera.tripod.VM
+        self.push_camera_block()
         self.__prgrm.push_uniforms()
 
         with self.__prgrm:
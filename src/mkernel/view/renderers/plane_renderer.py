@@ -1,6 +1,4 @@
-import ctypes
 import OpenGL.GL as gl
-import numpy as np
 
 from .base import Renderer, get_shader_fullpath
 import ckernel.render_context.opengl_context.entities.meta as meta
@@ -16,15 +14,18 @@ class PlaneRenderer(Renderer):
         super().__init__()
 
         self.__vbo = self.__prgrm.vrtx_attr_schema.create_vrtx_bffr()
-        self.__ibo = meta.MetaIndxBffr(dtype='uint')
+        self.__ibo = meta.MetaIndxBffr()
         self.__vao = meta.MetaVrtxArry(self.__vbo, indx_bffr=self.__ibo)
 
     def create_dataset(self, size):
         vb = self.__vbo.cache.request_block(size)
         ib = self.__ibo.cache.request_block(size)
-        ib['idx'] = vb.indices
+        ib['idx'] = vb.indx_array
         return {'vrtx': vb, 'indx': ib}
 
+    def create_datasets(self, sizes):
+        return [{'vrtx': vb, 'indx': ib} for vb, ib in self.request_indexed_blocks(self.__vbo, self.__ibo, sizes)]
+
     def free_finalizer(self, dataset):
         if dataset:
             for block in dataset.values():
@@ -34,19 +35,17 @@ class PlaneRenderer(Renderer):
     def update_cache(self, shape, arg_name, value):
         self.datasets[shape]['vrtx'][arg_name] = value
 
+    def update_caches(self, shapes, arg_name, values):
+        self.write_vrtx_blocks(self.__vbo, shapes, arg_name, values)
+
     def render(self):
+        self.compact_caches(self.__vbo, self.__ibo)
         with self.__prgrm:
-            camera = get_current_ogl().manager.window.devices.cameras.current
-            self.__prgrm.uniforms['PM'] = camera.body.PM
-            self.__prgrm.uniforms['VM'] = camera.tripod.VM
-            self.__prgrm.uniforms['MM'] = np.eye(4)
+            self.push_camera_block()
             self.__prgrm.push_uniforms()
 
             with self.__vao:
                 self.__vbo.push_cache()
                 self.__ibo.push_cache()
 
-                gl.glDrawElements(gl.GL_POINTS,
-                                  self.__ibo.cache.active_size,
-                                  self.__ibo.cache.gldtype[0],
-                                  ctypes.c_void_p(0))
+                self.draw_elements(gl.GL_POINTS, self.__ibo)
@@ -1,4 +1,4 @@
-import ctypes as ct
+import numpy as np
 
 import ckernel.render_context.opengl_context.entities.meta as meta
 from .base import Renderer, get_shader_fullpath
@@ -21,9 +21,9 @@ class PolygonRenderer(Renderer):
         super().__init__()
 
         self.__vbo = self.__fill_prgrm.vrtx_attr_schema.create_vrtx_bffr()
-        self.__fill_ibo = meta.MetaIndxBffr(dtype='uint')
+        self.__fill_ibo = meta.MetaIndxBffr()
         self.__fill_vao = meta.MetaVrtxArry(self.__vbo, indx_bffr=self.__fill_ibo)
-        self.__edge_ibo = meta.MetaIndxBffr(dtype='uint')
+        self.__edge_ibo = meta.MetaIndxBffr()
         self.__edge_vao = meta.MetaVrtxArry(self.__vbo, indx_bffr=self.__edge_ibo)
 
     def create_dataset(self, size):
@@ -34,40 +34,44 @@ class PolygonRenderer(Renderer):
     def free_finalizer(self, dataset):
         if dataset:
             for block in dataset.values():
-                block.release()
+                if block is not None:  # fill may not be tessellated yet
+                    block.release()
             dataset.clear()
 
     def update_cache(self, shape, arg_name, value):
         dataset = self.datasets[shape]
-        if arg_name == 'fill_indxs':
-            offset = dataset['vrtx'].indices[0]
-            ib = self.__fill_ibo.cache.request_block(size=len(value) + 1)
-            ib['idx', :-1] = [offset + i if i != PRV else PRV for i in value]
-            ib['idx', -1] = PRV
-            dataset[arg_name] = ib
-        elif arg_name == 'edge_indxs':
-            offset = dataset['vrtx'].indices[0]
-            ib = self.__edge_ibo.cache.request_block(size=len(value) + 1)
-            ib['idx', :-1] = [offset + i for i in value]
-            ib['idx', -1] = PRV
+        if arg_name in ('fill_indxs', 'edge_indxs'):
+            # vertex block may span holes, local vertex index is mapped through the block
+            vrtx_indxs = dataset['vrtx'].indx_array
+            if dataset[arg_name] is not None:  # re-tessellated or re-shaped
+                dataset[arg_name].release()
+            if arg_name == 'fill_indxs':
+                # triangles need no restart, (N, 3) indices are flattened as they are
+                value = np.asarray(value, dtype=np.int64).ravel()
+                ib = self.__fill_ibo.cache.request_block(size=len(value))
+                ib['idx'] = vrtx_indxs[value]
+            else:
+                ib = self.__edge_ibo.cache.request_block(size=len(value) + 1)
+                ib['idx', :-1] = vrtx_indxs[list(value)]
+                ib['idx', -1] = PRV
             dataset[arg_name] = ib
         else:
-            print(arg_name, value)
             self.datasets[shape]['vrtx'][arg_name] = value
 
+    def update_caches(self, shapes, arg_name, values):
+        if arg_name in ('fill_indxs', 'edge_indxs'):
+            super().update_caches(shapes, arg_name, values)
+        else:
+            self.write_vrtx_blocks(self.__vbo, shapes, arg_name, values)
+
     def render(self):
+        self.compact_caches(self.__vbo, self.__fill_ibo, self.__edge_ibo)
         self.__vbo.push_cache()
         self.__render_fill()
         self.__render_edge()
 
     def __update_umiforms(self, prgrm):
-        camera = get_current_ogl().manager.window.devices.cameras.current
-        prgrm.uniforms['PM'] = camera.body.PM
-        prgrm.uniforms['VM'] = camera.tripod.VM
-        prgrm.uniforms['MM'] = [[1, 0, 0, 0],
-                                [0, 1, 0, 0],
-                                [0, 0, 1, 0],
-                                [0, 0, 0, 1]]
+        self.push_camera_block()
         prgrm.push_uniforms()
 
     def __render_fill(self):
@@ -75,17 +79,11 @@ class PolygonRenderer(Renderer):
         with self.__fill_vao:
             with self.__fill_prgrm as prgrm:
                 self.__update_umiforms(prgrm)
-                gl.glDrawElements(gl.GL_QUAD_STRIP,
-                                  self.__fill_ibo.cache.active_size,
-                                  self.__fill_ibo.cache.gldtype[0],
-                                  ct.c_void_p(0))
+                self.draw_elements(gl.GL_TRIANGLES, self.__fill_ibo)
 
     def __render_edge(self):
         self.__edge_ibo.push_cache()
         with self.__edge_vao:
             with self.__edge_prgrm as prgrm:
                 self.__update_umiforms(prgrm)
-                gl.glDrawElements(gl.GL_LINE_STRIP_ADJACENCY,
-                                  self.__edge_ibo.cache.active_size,
-                                  self.__edge_ibo.cache.gldtype[0],
-                                  ct.c_void_p(0))
+                self.draw_elements(gl.GL_LINE_STRIP_ADJACENCY, self.__edge_ibo)
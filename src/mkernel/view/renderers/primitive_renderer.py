@@ -1,5 +1,4 @@
 import os
-import ctypes
 
 from ckernel.render_context.opengl_context.context_stack import get_current_ogl
 import ckernel.render_context.opengl_context.entities.meta as meta
@@ -60,11 +59,11 @@ class PointRenderer(Renderer):
         super().__init__()
 
         self.__vbo = self.__square_prgrm.vrtx_attr_schema.create_vrtx_bffr()
-        self.__circle_ibo = meta.MetaIndxBffr('uint')
+        self.__circle_ibo = meta.MetaIndxBffr()
         self.__circle_vao = meta.MetaVrtxArry(self.__vbo, indx_bffr=self.__circle_ibo)
-        self.__square_ibo = meta.MetaIndxBffr('uint')
+        self.__square_ibo = meta.MetaIndxBffr()
         self.__square_vao = meta.MetaVrtxArry(self.__vbo, indx_bffr=self.__square_ibo)
-        self.__triangle_ibo = meta.MetaIndxBffr('uint')
+        self.__triangle_ibo = meta.MetaIndxBffr()
         self.__triangle_vao = meta.MetaVrtxArry(self.__vbo, indx_bffr=self.__triangle_ibo)
 
         self.__ibos = {'s': self.__square_ibo,
@@ -86,17 +85,27 @@ class PointRenderer(Renderer):
             indx_block = new_ibo.cache.request_block(size=1)
             self.datasets[shape]['indx'] = indx_block
             # put index value
-            indx_block['idx'] = self.datasets[shape]['vrtx'].indices
+            indx_block['idx'] = self.datasets[shape]['vrtx'].indx_array
         else:
             self.datasets[shape]['vrtx'][arg_name] = val
 
+    def update_caches(self, shapes, arg_name, values):
+        if arg_name == 'frm':
+            super().update_caches(shapes, arg_name, values)
+        else:
+            self.write_vrtx_blocks(self.__vbo, shapes, arg_name, values)
+
     def create_dataset(self, size):
         dataset = {'vrtx': self.__vbo.cache.request_block(size),
                 'indx': self.__square_ibo.cache.request_block(size),
                 'ibo': self.__square_ibo}
-        dataset['indx']['idx'] = dataset['vrtx'].indices
+        dataset['indx']['idx'] = dataset['vrtx'].indx_array
         return dataset
 
+    def create_datasets(self, sizes):
+        return [{'vrtx': vb, 'indx': ib, 'ibo': self.__square_ibo}
+                for vb, ib in self.request_indexed_blocks(self.__vbo, self.__square_ibo, sizes)]
+
     def free_finalizer(self, dataset: dict):
         """
         automatically release blocks when blocks dict looses shape
@@ -112,6 +121,7 @@ class PointRenderer(Renderer):
             dataset.clear()
 
     def render(self):
+        self.compact_caches(self.__vbo, self.__square_ibo, self.__triangle_ibo, self.__circle_ibo)
         self.__vbo.push_cache()
         self.__render_square()
         self.__render_triangle()
@@ -123,20 +133,11 @@ class PointRenderer(Renderer):
         with self.__square_vao:
             with self.__square_prgrm:
                 # update uniforms
-                camera = get_current_ogl().manager.window.devices.cameras.current
-                self.__square_prgrm.uniforms['PM'] = camera.body.PM
-                self.__square_prgrm.uniforms['VM'] = camera.tripod.VM
-                self.__square_prgrm.uniforms['MM'] = [[1, 0, 0, 0],
-                                                      [0, 1, 0, 0],
-                                                      [0, 0, 1, 0],
-                                                      [0, 0, 0, 1]]
+                self.push_camera_block()
                 self.__square_prgrm.push_uniforms()
                 self.__square_ibo.push_cache()
                 # mode, count, type, indices
-                gl.glDrawElements(gl.GL_POINTS,
-                                  self.__square_ibo.cache.active_size,
-                                  self.__square_ibo.cache.gldtype[0],
-                                  ctypes.c_void_p(0))
+                self.draw_elements(gl.GL_POINTS, self.__square_ibo)
 
     def __render_circle(self):
         if not self.__circle_ibo.cache.active_size:
@@ -144,23 +145,11 @@ class PointRenderer(Renderer):
         with self.__circle_vao:
             with self.__circle_prgrm:
                 # update uniforms
-                camera = get_current_ogl().manager.window.devices.cameras.current
-
-                self.__circle_prgrm.uniforms['PM'] = camera.body.PM
-                self.__circle_prgrm.uniforms['VM'] = camera.tripod.VM
-                self.__circle_prgrm.uniforms['MM'] = [[1, 0, 0, 0],
-                                                      [0, 1, 0, 0],
-                                                      [0, 0, 1, 0],
-                                                      [0, 0, 0, 1]]
-                pane = get_current_ogl().manager.window.devices.panes.current
-                self.__circle_prgrm.uniforms['VPP'] = *pane.pos.xy, *pane.size.xy
+                self.push_camera_block()
                 self.__circle_prgrm.push_uniforms()
                 self.__circle_ibo.push_cache()
 
-                gl.glDrawElements(gl.GL_POINTS,
-                                  self.__circle_ibo.cache.active_size,
-                                  self.__circle_ibo.cache.gldtype[0],
-                                  ctypes.c_void_p(0))
+                self.draw_elements(gl.GL_POINTS, self.__circle_ibo)
 
     def __render_triangle(self):
         if not self.__triangle_ibo.cache.active_size:
@@ -168,20 +157,10 @@ class PointRenderer(Renderer):
         with self.__triangle_vao:
             with self.__triangle_prgrm:
                 # update uniforms
-                camera = get_current_ogl().manager.window.devices.cameras.current
-
-                self.__triangle_prgrm.uniforms['PM'] = camera.body.PM
-                self.__triangle_prgrm.uniforms['VM'] = camera.tripod.VM
-                self.__triangle_prgrm.uniforms['MM'] = [[1, 0, 0, 0],
-                                                        [0, 1, 0, 0],
-                                                        [0, 0, 1, 0],
-                                                        [0, 0, 0, 1]]
+                self.push_camera_block()
                 self.__triangle_prgrm.push_uniforms()
                 self.__triangle_ibo.push_cache()
-                gl.glDrawElements(gl.GL_POINTS,
-                                  self.__triangle_ibo.cache.active_size,
-                                  self.__triangle_ibo.cache.gldtype[0],
-                                  ctypes.c_void_p(0))
+                self.draw_elements(gl.GL_POINTS, self.__triangle_ibo)
 
 
 class LineRenderer(Renderer):
@@ -205,15 +184,18 @@ class LineRenderer(Renderer):
     def __init__(self):
         super().__init__()
         self.__vbo = self.__sharp_prgrm.vrtx_attr_schema.create_vrtx_bffr()
-        self.__ibo = meta.MetaIndxBffr(dtype='uint')
+        self.__ibo = meta.MetaIndxBffr()
         self.__vao = meta.MetaVrtxArry(self.__vbo, indx_bffr=self.__ibo)
 
     def create_dataset(self, size):
         dataset = {'vrtx': self.__vbo.cache.request_block(size),
                    'indx': self.__ibo.cache.request_block(size)}
-        dataset['indx']['idx'] = dataset['vrtx'].indices
+        dataset['indx']['idx'] = dataset['vrtx'].indx_array
         return dataset
 
+    def create_datasets(self, sizes):
+        return [{'vrtx': vb, 'indx': ib} for vb, ib in self.request_indexed_blocks(self.__vbo, self.__ibo, sizes)]
+
     def free_finalizer(self, dataset):
         if dataset:
             for v in dataset.values():
@@ -223,7 +205,11 @@ class LineRenderer(Renderer):
     def update_cache(self, shape, arg_name, value):
         self.datasets[shape]['vrtx'][arg_name] = value
 
+    def update_caches(self, shapes, arg_name, values):
+        self.write_vrtx_blocks(self.__vbo, shapes, arg_name, values)
+
     def render(self):
+        self.compact_caches(self.__vbo, self.__ibo)
         self.__vbo.push_cache()
         self.__render_sharp()
 
@@ -232,19 +218,10 @@ class LineRenderer(Renderer):
             return
         with self.__vao:
             with self.__sharp_prgrm:
-                camera = get_current_ogl().manager.window.devices.cameras.current
-                self.__sharp_prgrm.uniforms['VM'] = camera.tripod.VM
-                self.__sharp_prgrm.uniforms['PM'] = camera.body.PM
-                self.__sharp_prgrm.uniforms['MM'] = [[1, 0, 0, 0],
-                                                     [0, 1, 0, 0],
-                                                     [0, 0, 1, 0],
-                                                     [0, 0, 0, 1]]
+                self.push_camera_block()
                 self.__sharp_prgrm.push_uniforms()
                 self.__ibo.push_cache()
-                gl.glDrawElements(gl.GL_LINES,
-                                  self.__ibo.cache.active_size,
-                                  self.__ibo.cache.gldtype[0],
-                                  ctypes.c_void_p(0))
+                self.draw_elements(gl.GL_LINES, self.__ibo)
 
 
 @Singleton
@@ -258,15 +235,18 @@ class PolylineRenderer(Renderer):
     def __init__(self):
         super().__init__()
         self.__vbo = self.__sharp_prgrm.vrtx_attr_schema.create_vrtx_bffr()
-        self.__ibo = meta.MetaIndxBffr(dtype='uint')
+        self.__ibo = meta.MetaIndxBffr()
         self.__vao = meta.MetaVrtxArry(self.__vbo, indx_bffr=self.__ibo)
 
     def create_dataset(self, size):
         dataset = {'vrtx': self.__vbo.cache.request_block(size),
                    'indx': self.__ibo.cache.request_block(size)}
-        dataset['indx']['idx'] = dataset['vrtx'].indices
+        dataset['indx']['idx'] = dataset['vrtx'].indx_array
         return dataset
 
+    def create_datasets(self, sizes):
+        return [{'vrtx': vb, 'indx': ib} for vb, ib in self.request_indexed_blocks(self.__vbo, self.__ibo, sizes)]
+
     def free_finalizer(self, dataset, *args, **kargs):
         if dataset:
             dataset['vrtx'].release()
@@ -276,7 +256,11 @@ class PolylineRenderer(Renderer):
     def update_cache(self, shape, arg_name, value):
         self.datasets[shape]['vrtx'][arg_name] = value
 
+    def update_caches(self, shapes, arg_name, values):
+        self.write_vrtx_blocks(self.__vbo, shapes, arg_name, values)
+
     def render(self):
+        self.compact_caches(self.__vbo, self.__ibo)
         self.__vbo.push_cache()
         self.__ibo.push_cache()
         self.__render_sharp()
@@ -287,19 +271,10 @@ class PolylineRenderer(Renderer):
         with self.__vao:
             with self.__sharp_prgrm:
                 # uniforms
-                camera = get_current_ogl().manager.window.devices.cameras.current
-                self.__sharp_prgrm.uniforms['VM'] = camera.tripod.VM
-                self.__sharp_prgrm.uniforms['PM'] = camera.body.PM
-                self.__sharp_prgrm.uniforms['MM'] = [[1, 0, 0, 0],
-                                                     [0, 1, 0, 0],
-                                                     [0, 0, 1, 0],
-                                                     [0, 0, 0, 1]]
+                self.push_camera_block()
                 self.__sharp_prgrm.push_uniforms()
 
-                gl.glDrawElements(gl.GL_LINE_STRIP,
-                                  self.__ibo.cache.active_size,
-                                  self.__ibo.cache.gldtype[0],
-                                  ctypes.c_void_p(0))
+                self.draw_elements(gl.GL_LINE_STRIP, self.__ibo)
 
 
 class TriangleRenderer(Renderer):
@@ -329,15 +304,18 @@ class TriangleRenderer(Renderer):
         super().__init__()
 
         self.__vbo = self.__prgrm.vrtx_attr_schema.union(self.__prgrm.vrtx_attr_schema).create_vrtx_bffr()
-        self.__ibo = meta.MetaIndxBffr('uint')
+        self.__ibo = meta.MetaIndxBffr()
         self.__vao = meta.MetaVrtxArry(self.__vbo, indx_bffr=self.__ibo)
 
     def create_dataset(self, size):
         vb = self.__vbo.cache.request_block(size)
         ib = self.__ibo.cache.request_block(size)
-        ib['idx'] = vb.indices
+        ib['idx'] = vb.indx_array
         return {'vrtx': vb, 'indx': ib}
 
+    def create_datasets(self, sizes):
+        return [{'vrtx': vb, 'indx': ib} for vb, ib in self.request_indexed_blocks(self.__vbo, self.__ibo, sizes)]
+
     def free_finalizer(self, dataset):
         if dataset:
             for block in dataset.values():
@@ -347,18 +325,15 @@ class TriangleRenderer(Renderer):
     def update_cache(self, shape, arg_name, value):
         self.datasets[shape]['vrtx'][arg_name] = value
 
+    def update_caches(self, shapes, arg_name, values):
+        self.write_vrtx_blocks(self.__vbo, shapes, arg_name, values)
+
     def __update_global_ufrm(self, prgrm):
         """
         update transformation uniforms
         :return:
         """
-        camera = get_current_ogl().manager.window.devices.cameras.current
-        prgrm.uniforms['PM'] = camera.body.PM
-        prgrm.uniforms['VM'] = camera.tripod.VM
-        prgrm.uniforms['MM'] = [[1, 0, 0, 0],
-                                [0, 1, 0, 0],
-                                [0, 0, 1, 0],
-                                [0, 0, 0, 1]]
+        self.push_camera_block()
         prgrm.push_uniforms()
 
     def render(self, is_render_edge=True):
@@ -367,6 +342,7 @@ class TriangleRenderer(Renderer):
         :param is_render_edge: bool, do render edge?
         :return:
         """
+        self.compact_caches(self.__vbo, self.__ibo)
         self.__vbo.push_cache()
         self.__ibo.push_cache()
         with self.__vao:
@@ -374,7 +350,4 @@ class TriangleRenderer(Renderer):
                 return
             with self.__prgrm:
                 self.__update_global_ufrm(self.__prgrm)
-                gl.glDrawElements(gl.GL_TRIANGLES,
-                                  self.__ibo.cache.active_size,
-                                  self.__ibo.cache.gldtype[0],
-                                  ctypes.c_void_p(0))
+                self.draw_elements(gl.GL_TRIANGLES, self.__ibo)
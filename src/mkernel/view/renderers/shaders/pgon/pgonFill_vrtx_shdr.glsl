@@ -7,9 +7,15 @@ layout(location = 3) in vec4 clr_fill;
 layout(location = 4) in vec3 goid;
 layout(location = 5) in int goid_flag;
 
-layout(location = 0) uniform mat4 PM;
-layout(location = 1) uniform mat4 VM;
-layout(location = 2) uniform mat4 MM;
+// camera uniform block, see wkernel/devices/render/cameras/camera_ufrm_block.glsl
+layout (std140, row_major, binding = 0) uniform Camera {
+    mat4 PM;    // projection matrix
+    mat4 VM;    // view matrix
+    mat4 NCF;   // near clipping face in WCS, corners as columns
+    mat4 FCF;   // far clipping face in WCS, corners as columns
+    vec4 VPP;   // viewport pixel property (posx, posy, width, height)
+};
+layout(location = 2) uniform mat4 MM = mat4(1.0);
 
 out vsOut {
     vec4 clr;
@@ -1,6 +1,13 @@
 #version 450 core
 // viewport size
-layout (location = 4) uniform vec4 VPP; // viewport pixel property (posx, posy, width, height)
+// camera uniform block, see wkernel/devices/render/cameras/camera_ufrm_block.glsl
+layout (std140, row_major, binding = 0) uniform Camera {
+    mat4 PM;    // projection matrix
+    mat4 VM;    // view matrix
+    mat4 NCF;   // near clipping face in WCS, corners as columns
+    mat4 FCF;   // far clipping face in WCS, corners as columns
+    vec4 VPP;   // viewport pixel property (posx, posy, width, height)
+};
 
 in vsOut {
     vec4 fclr;
@@ -4,8 +4,14 @@ layout (points) in;
 layout (triangle_strip, max_vertices = 4) out;
 
 layout (location = 0) uniform mat4 MM = mat4(1.0);
-layout (location = 1) uniform mat4 VM = mat4(1.0);
-layout (location = 2) uniform mat4 PM = mat4(1.0);
+// camera uniform block, see wkernel/devices/render/cameras/camera_ufrm_block.glsl
+layout (std140, row_major, binding = 0) uniform Camera {
+    mat4 PM;    // projection matrix
+    mat4 VM;    // view matrix
+    mat4 NCF;   // near clipping face in WCS, corners as columns
+    mat4 FCF;   // far clipping face in WCS, corners as columns
+    vec4 VPP;   // viewport pixel property (posx, posy, width, height)
+};
 
 in vsOut {
     vec4 clr;
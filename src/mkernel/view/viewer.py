@@ -1,3 +1,7 @@
+import time
+import threading
+from contextlib import contextmanager
+
 import mkernel.model.shapes as st
 import mkernel.view.renderers as rend
 from mkernel.model.amodel import AModel
@@ -26,26 +30,162 @@ class RendererDict(dict):
         return super().__getitem__(item)
 
 
+class _UpdateQueue:
+    """
+    cache updates waiting for flush
+
+    Updates coalesce per (shape, attribute), the last value wins.
+    Shapes keep the order they are first queued in so that reserved datasets are malloced in order.
+    Shape is either freed or in updates, never both, latter operation decides.
+    """
+
+    def __init__(self):
+        self.reservations = []  # [(shape type, sizes), ...]
+        self.updates = {}  # {shape: {arg_name: value}}
+        self.mallocs = {}  # {shape: None}, ordered set of shapes malloced since their last free
+        self.frees = {}  # {shape: None}, ordered set
+
+    def __bool__(self):
+        return bool(self.reservations or self.updates or self.frees)
+
+    def reserve(self, shape_type, sizes):
+        self.reservations.append((shape_type, sizes))
+
+    def malloc(self, shape):
+        self.frees.pop(shape, None)  # freed then added again
+        self.mallocs[shape] = None
+        self.updates.setdefault(shape, {})
+
+    def update(self, shape, arg_name, value):
+        if shape not in self.frees:
+            self.updates.setdefault(shape, {})[arg_name] = value
+
+    def free(self, shape):
+        self.updates.pop(shape, None)
+        self.mallocs.pop(shape, None)
+        self.frees[shape] = None
+
+    def merge(self, other):
+        """
+        append other queue as if its operations were queued after this queue's
+
+        :param other: _UpdateQueue
+        :return:
+        """
+        self.reservations += other.reservations
+        for shape, args in other.updates.items():
+            if shape in other.mallocs:
+                self.malloc(shape)
+            elif shape in self.frees:  # updated after free
+                continue
+            self.updates.setdefault(shape, {}).update(args)
+        for shape in other.frees:
+            self.free(shape)
+
+
 class Viewer:
+    """
+    Renders shapes and keeps their caches
+
+    Cache writes are queued from any thread and applied by `flush` on the render thread,
+    grouped per renderer and attribute. Writes within `batch` reach the queue all at once
+    so a frame never shows half of a batch.
+    ! values are held until flush, don't mutate them after queueing
+    """
+
     def __init__(self, modeler):
         self.__modeler = modeler
         self.__renderers = RendererDict()
+        self.__queue = _UpdateQueue()
+        self.__lock = threading.Lock()
+        self.__local = threading.local()  # batch staging queue and depth of each thread
 
     @property
     def renderers(self):
         return self.__renderers
 
     def render(self):
+        self.flush()
+        # renderers share one compaction budget per frame
+        deadline = time.perf_counter() + rend.Renderer.COMPACT_TIME_BUDGET
         for renderer in self.renderers.values():
+            renderer.set_compact_deadline(deadline)
             renderer.render()
 
+    @contextmanager
+    def batch(self):
+        """
+        stage updates of this thread and queue them at once on exit, can be nested
+
+        :return:
+        """
+        depth = getattr(self.__local, 'depth', 0)
+        if not depth:
+            self.__local.stage = _UpdateQueue()
+        self.__local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self.__local.depth = depth
+            if not depth:
+                stage, self.__local.stage = self.__local.stage, None
+                with self.__lock:
+                    self.__queue.merge(stage)
+
+    def __enqueue(self, operation, *args):
+        stage = getattr(self.__local, 'stage', None)
+        if stage is not None:  # owned by this thread
+            operation(stage, *args)
+            return
+        with self.__lock:
+            operation(self.__queue, *args)
+
     def malloc_shape(self, shape):
-        self.renderers[shape.__class__].malloc_shape(shape)
+        self.__enqueue(_UpdateQueue.malloc, shape)
+
+    def reserve_datasets(self, shape_type, sizes):
+        """
+        bulk create datasets for shapes of given type about to be added
+
+        :param shape_type: type of shapes
+        :param sizes: (int, ...), dataset size of each shape
+        :return:
+        """
+        self.__enqueue(_UpdateQueue.reserve, shape_type, sizes)
 
     def free_shape(self, shape):
-        self.renderers[shape.__class__].free_shape(shape)
+        self.__enqueue(_UpdateQueue.free, shape)
 
     def update_cache(self, shape, arg_name, value):
-        # lazy mallocing
-        self.malloc_shape(shape)
-        self.renderers[shape.__class__].update_cache(shape, arg_name, value)
+        self.__enqueue(_UpdateQueue.update, shape, arg_name, value)
+
+    def flush(self):
+        """
+        apply queued updates
+
+        Shapes are malloced lazily, then values of the same renderer and attribute are written together.
+        Reserved datasets left unused are released.
+        ! render thread only
+        :return:
+        """
+        with self.__lock:
+            if not self.__queue:
+                return
+            queue, self.__queue = self.__queue, _UpdateQueue()
+
+        for shape_type, sizes in queue.reservations:
+            self.renderers[shape_type].reserve_datasets(sizes)
+        for shape in queue.frees:
+            self.renderers[shape.__class__].free_shape(shape)
+        groups = {}  # {(shape type, arg_name): ([shape, ...], [value, ...])}
+        for shape, args in queue.updates.items():
+            self.renderers[shape.__class__].malloc_shape(shape)
+            for arg_name, value in args.items():
+                shapes, values = groups.setdefault((shape.__class__, arg_name), ([], []))
+                shapes.append(shape)
+                values.append(value)
+        for shape_type in {shape_type for shape_type, _ in queue.reservations}:
+            # reserved for shapes removed within the same flush
+            self.renderers[shape_type].release_reserved()
+        for (shape_type, arg_name), (shapes, values) in groups.items():
+            self.renderers[shape_type].update_caches(shapes, arg_name, values)
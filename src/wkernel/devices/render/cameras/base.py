@@ -1,5 +1,7 @@
+import pathlib
 import weakref
 import gkernel.dtype.geometric as gt
+from ckernel.render_context.opengl_context.entities.meta.prgrm.shdr_parser import SimpleShdrParser
 from gkernel.dtype.nongeometric.matrix.primitive import ScaleMat
 from wkernel.devices.render._base import *
 from .dolly import *
@@ -63,12 +65,19 @@ class Camera(RenderDevice):
 
     Camera consists of Two parts; camera body, camera orientation(position)
     """
+    # layout of camera uniform block, shaders copy the declaration
+    UFRM_BLOCK_SCHEMA = SimpleShdrParser.parse_ufrm_blocks(
+        pathlib.Path(__file__).with_name('camera_ufrm_block.glsl').read_text())['Camera']
 
     def __init__(self, body, tripod, manager):
         super().__init__(manager)
         self.__body = body
         self.__tripod = tripod
         self.__dolly = None
+        # uniform buffer of the camera and (version, viewport) it was pushed at
+        self.__ufrm_bffr = self.UFRM_BLOCK_SCHEMA.create_ufrm_bffr()
+        self.__ufrm_stamp = None
+        self.__faces = None, None  # (version, (near face, far face))
 
     def __enter__(self):
         return super().__enter__()
@@ -88,36 +97,80 @@ class Camera(RenderDevice):
     def dolly(self):
         return self.__dolly
 
+    @property
+    def version(self):
+        """
+        changes whenever camera matrices change
+
+        :return: (tripod version, body version)
+        """
+        return self.__tripod.version, self.__body.version
+
     @property
     def near_clipping_face(self):
         """
         return frustum near clipping face in WCS
 
+        ! cached until camera changes, don't modify returned face
         order:
         3 2
         0 1
         :return: Plin
         """
-        pln = self.tripod.plane
-        l, r, b, t, n, f = self.body.dim
-        face = gt.Plin((l, b, -n), (r, b, -n), (r, t, -n), (l, t, -n))
-        return pln.TM * face
+        return self.__clipping_faces()[0]
 
     @property
     def far_clipping_face(self):
         """
         return frustum far clipping face in WCS
 
+        ! cached until camera changes, don't modify returned face
         :return: Plin
         """
-        pln = self.tripod.plane
-        l, r, b, t, n, f = self.body.dim
-        if self.body.fshape == 'p':
-            d = f - n
-            # far face dimensions
-            l, r, b, t = [(i * d) / n + i for i in (l, r, b, t)]
-        face = gt.Plin((l, b, -f), (r, b, -f), (r, t, -f), (l, t, -f))
-        return pln.TM * face
+        return self.__clipping_faces()[1]
+
+    def __clipping_faces(self):
+        """
+        calculate near and far clipping faces if camera has changed
+
+        :return: (near face, far face)
+        """
+        version, faces = self.__faces
+        if version != self.version:
+            tm = self.tripod.TM
+            l, r, b, t, n, f = self.body.dim
+            near = gt.Plin((l, b, -n), (r, b, -n), (r, t, -n), (l, t, -n))
+            if self.body.fshape == 'p':
+                d = f - n
+                # far face dimensions
+                l, r, b, t = [(i * d) / n + i for i in (l, r, b, t)]
+            far = gt.Plin((l, b, -f), (r, b, -f), (r, t, -f), (l, t, -f))
+            faces = tm * near, tm * far
+            self.__faces = self.version, faces
+        return faces
+
+    def push_ufrm_block(self, pane):
+        """
+        bind camera uniform block for programs declaring `Camera` block
+
+        Block is uploaded only when camera version or viewport has changed since last push,
+        else buffer is only rebound.
+        :param pane: Pane, current pane defining viewport
+        :return:
+        """
+        vpp = *pane.pos.xy, *pane.size.xy
+        stamp = self.version, vpp
+        if self.__ufrm_stamp == stamp:
+            self.__ufrm_bffr.bind_base()
+            return
+        ufrms = self.__ufrm_bffr.uniforms
+        ufrms['PM'] = self.body.PM
+        ufrms['VM'] = self.tripod.VM
+        ufrms['NCF'] = self.near_clipping_face
+        ufrms['FCF'] = self.far_clipping_face
+        ufrms['VPP'] = vpp
+        self.__ufrm_bffr.push_cache()
+        self.__ufrm_stamp = stamp
 
     def attach_dolly(self, dolly):
         """
@@ -157,7 +210,7 @@ class Camera(RenderDevice):
         offset = MoveMat(-.5, -.5, -n)
         frustum_point = sm * offset * Pnt(x=param_x, y=param_y, z=0)
         ray = gt.Ray([0, 0, 0], frustum_point.xyz)
-        return self.tripod.plane.TM * ray
+        return self.tripod.TM * ray
 
     def focus_pane(self, pane, focus, clip_off):
         """
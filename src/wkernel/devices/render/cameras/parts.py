@@ -12,10 +12,14 @@ class CameraTripod:
     Camera property defining camera orientaiton;
 
     including camera position and camera direction combined within camera_plane
+
+    ! view matrix is cached, every plane modification has to go through `__set_pln`
     """
 
     def __init__(self):
         self.__pln = Pln()
+        self.__version = 0
+        self.__VM = None
 
     @property
     def plane(self):
@@ -25,16 +29,46 @@ class CameraTripod:
     def plane(self, p):
         if not isinstance(p, Pln):
             raise
-        self.__pln = p
+        self.__set_pln(p)
+
+    def __set_pln(self, pln):
+        """
+        replace plane, bump version and drop cached matrix
+
+        :param pln: new camera plane
+        :return:
+        """
+        self.__pln = pln
+        self.__version += 1
+        self.__VM = None
+
+    @property
+    def version(self):
+        """
+        :return: int, changes whenever camera plane changes
+        """
+        return self.__version
 
     @property
     def VM(self):
         """
         veiw matrix
 
+        ! cached until plane changes, don't modify returned matrix
         :return:
         """
-        return ViewMatrix.from_pln(self.__pln)
+        if self.__VM is None:
+            self.__VM = ViewMatrix.from_pln(self.__pln)
+        return self.__VM
+
+    @property
+    def TM(self):
+        """
+        inverse of view matrix, camera space to world
+
+        :return:
+        """
+        return self.__pln.TM
 
     def lookat(self, eye, at, up):
         """
@@ -58,7 +92,7 @@ class CameraTripod:
         xaxis /= xaxis.length  # normalize
         yaxis = Vec.cross(xaxis, zaxis)  # find true up
         zaxis *= -1  # reverse z
-        self.__pln = Pln.from_ori_axies(eye, xaxis, yaxis, zaxis)
+        self.__set_pln(Pln.from_ori_axies(eye, xaxis, yaxis, zaxis))
 
     def rotate_around(self, axis, rad):
         """
@@ -75,7 +109,7 @@ class CameraTripod:
         axis = axis.as_lin()
         axis_o, axis_v = axis.start, axis.as_vec()
         axis_to_z = TrnsfMats([MoveMat(*(-axis_o).xyz), Vec.trnsf_to_z(axis_v)])
-        self.__pln = axis_to_z.I * RotZMat(rad) * axis_to_z * self.__pln
+        self.__set_pln(axis_to_z.I * RotZMat(rad) * axis_to_z * self.__pln)
 
     def yaw(self, rad):
         """
@@ -85,7 +119,7 @@ class CameraTripod:
         origin, camerax, cameray, cameraz = self.plane.components
         new_x = camerax.copy().amplify(np.cos(rad)) + cameraz.copy().amplify(np.sin(rad))
         new_z = Vec.cross(cameray, new_x)
-        self.__pln = Pln(origin.xyz, new_x.xyz, cameray.xyz, new_z.xyz)
+        self.__set_pln(Pln(origin.xyz, new_x.xyz, cameray.xyz, new_z.xyz))
 
     def pitch(self, rad):
         """
@@ -95,7 +129,7 @@ class CameraTripod:
         origin, camerax, cameray, cameraz = self.plane.components
         new_y = cameray.copy().amplify(np.cos(rad)) + cameraz.copy().amplify(np.sin(rad))
         new_z = Vec.cross(camerax, new_y)
-        self.__pln = Pln(origin.xyz, camerax.xyz, new_y.xyz, new_z.xyz)
+        self.__set_pln(Pln(origin.xyz, camerax.xyz, new_y.xyz, new_z.xyz))
 
     def roll(self, rad):
         """
@@ -126,7 +160,7 @@ class CameraTripod:
         :return:
         """
         tm = MoveMat(*vec.xyz)
-        self.__pln = tm * self.__pln
+        self.__set_pln(tm * self.__pln)
 
     def orient(self, pos):
         """
@@ -147,15 +181,27 @@ class CameraBody:
         if fshape not in ('o', 'p'):
             raise ValueError('frustum shape has to be one on (o:orthogonal, p:perspective)')
         self.__fshape = fshape  # frustum shape
+        self.__version = 0
+        self.__PM = None
+
+    @property
+    def version(self):
+        """
+        :return: int, changes whenever frustum dimension changes
+        """
+        return self.__version
 
     @property
     def PM(self):
         """
         projection matrix
 
+        ! cached until dimension changes, don't modify returned matrix
         :return:
         """
-        return ProjectionMatrix(*self.dim, self.__fshape)
+        if self.__PM is None:
+            self.__PM = ProjectionMatrix(*self.dim, self.__fshape)
+        return self.__PM
 
     @property
     def hfov(self):
@@ -218,6 +264,8 @@ class CameraBody:
             if not isinstance(v, Number):
                 raise TypeError
             self.__dim[k] = v
+        self.__version += 1
+        self.__PM = None
 
     @property
     def fshape(self):
@@ -0,0 +1,191 @@
+import threading
+import weakref as wr
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+import gkernel.dtype.geometric as gt
+import ckernel.render_context.opengl_context.opengl_hooker as gl
+
+
+class _Slot:
+    """
+    pixel pack buffer of the ring and the readback it is holding
+    """
+    __slots__ = ('bffr', 'fence', 'key', 'future', 'layout', 'age')
+
+    def __init__(self, bffr):
+        self.bffr = bffr
+        self.fence = None
+        self.key = None
+        self.future = None
+        self.layout = None  # (shape, dtype, bitpattern)
+        self.age = 0  # number of updates since issued
+
+
+class AsyncPixelPicker:
+    """
+    Wrap frame and texture id to be picked without stalling
+
+    Picks are queued from any thread and issued by `update` into a ring of pixel pack buffers, each fenced.
+    Later `update` reads buffers whose fence has signaled and resolves futures,
+    so result arrives a frame or two later without waiting for gpu.
+    Repeated picks of the same area not yet delivered share one readback.
+
+    ! `update` has to be called once per frame from the render thread with frame drawn,
+      waiting for a future on the render thread dead locks
+    """
+    # updates a readback may wait before `update` blocks for it
+    MAX_LATENCY = 2
+    # nanoseconds to block for readback exceeding `MAX_LATENCY`
+    WAIT_TIMEOUT = 100_000_000
+
+    def __init__(self, frame, attachment_id, ring_size=3):
+        """
+        :param frame: Frame to pick from
+        :param attachment_id: attachment to pick
+        :param ring_size: number of pixel pack buffers, number of readbacks in flight
+        """
+        if ring_size < 1:
+            raise ValueError('ring_size has to be positive')
+        self.__frame = wr.ref(frame)
+        self.__aid = attachment_id
+        self.__ring_size = ring_size
+        self.__slots = []  # every slot created, buffers are created lazily in render thread
+        self.__free = []
+        self.__flying = deque()  # slots in issue order
+        self.__pending = {}  # {key: future} not yet issued
+        self.__lock = threading.Lock()
+
+    def __str__(self):
+        return f"<AsyncPixelPicker {self.__aid} flying:{len(self.__flying)}>"
+
+    @property
+    def size(self):
+        """
+        :return: (width, height) of picked frame, None if frame is gone
+        """
+        f = self.__frame()
+        return None if f is None else f.size.xy
+
+    def pick(self, pos, size=(1, 1), callback=None):
+        """
+        queue pick
+
+        ! thread safe
+        :param pos: (x, y), as `Frame.pick_pixels`
+        :param size: (width, height), as `Frame.pick_pixels`
+        :param callback: called with (pixel_val, bitpattern) on the render thread when delivered
+        :return: Future of (pixel_val, bitpattern), same as `Frame.pick_pixels` returns
+        """
+        if isinstance(pos, gt.Vec):
+            pos = pos.xy
+        if isinstance(size, gt.Vec):
+            size = size.xy
+        key = tuple(pos), tuple(size)
+        with self.__lock:
+            future = self.__pending.get(key) or self.__find_flying(key)
+            if future is None:
+                future = self.__pending[key] = Future()
+        if callback:
+            def deliver(f):
+                if not f.cancelled() and f.exception() is None:
+                    callback(*f.result())
+            future.add_done_callback(deliver)
+        return future
+
+    def __find_flying(self, key):
+        for slot in self.__flying:
+            if slot.key == key:
+                return slot.future
+        return None
+
+    def update(self):
+        """
+        deliver signaled readbacks and issue queued picks
+
+        ! render thread only
+        :return:
+        """
+        self.__harvest()
+        self.__issue()
+
+    def __harvest(self):
+        for slot in self.__flying:
+            slot.age += 1
+        while self.__flying:
+            slot = self.__flying[0]
+            # fences signal in issue order so stop at the first busy one
+            timeout = self.WAIT_TIMEOUT if self.MAX_LATENCY <= slot.age else 0
+            status = gl.glClientWaitSync(slot.fence, gl.GL_SYNC_FLUSH_COMMANDS_BIT, timeout)
+            if status not in (gl.GL_ALREADY_SIGNALED, gl.GL_CONDITION_SATISFIED):
+                break
+            shape, dtype, bitpattern = slot.layout
+            data = np.empty(int(np.prod(shape)) * dtype.itemsize, dtype=np.uint8)
+            gl.glBindBuffer(gl.GL_PIXEL_PACK_BUFFER, slot.bffr)
+            gl.glGetBufferSubData(gl.GL_PIXEL_PACK_BUFFER, 0, data.nbytes, data)
+            gl.glBindBuffer(gl.GL_PIXEL_PACK_BUFFER, 0)
+            gl.glDeleteSync(slot.fence)
+            with self.__lock:
+                self.__flying.popleft()
+                self.__free.append(slot)
+            future = slot.future
+            slot.fence = slot.key = slot.future = slot.layout = None
+            future.set_result((data.view(dtype).reshape(shape), bitpattern))
+
+    def __issue(self):
+        frame = self.__frame()
+        if frame is None:
+            return
+        while True:
+            with self.__lock:
+                if not self.__pending:
+                    return
+                if not self.__free:
+                    if len(self.__slots) == self.__ring_size:
+                        return  # ring is full, wait for the next frame
+                    slot = _Slot(gl.glGenBuffers(1))
+                    slot.bffr.set_target(gl.GL_PIXEL_PACK_BUFFER)
+                    self.__slots.append(slot)
+                    self.__free.append(slot)
+                key = next(iter(self.__pending))
+                future = self.__pending.pop(key)
+                slot = self.__free.pop()
+            if not future.set_running_or_notify_cancel():
+                with self.__lock:
+                    self.__free.append(slot)
+                continue
+            try:
+                with frame:
+                    slot.layout = frame.pick_pixels_into(self.__aid, *key, slot.bffr)
+                slot.fence = gl.glFenceSync(gl.GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+            except Exception as e:
+                with self.__lock:
+                    self.__free.append(slot)
+                future.set_exception(e)
+                continue
+            slot.key, slot.future, slot.age = key, future, 0
+            with self.__lock:
+                self.__flying.append(slot)
+
+    def delete(self):
+        """
+        release buffers and fences, futures not delivered are canceled or failed
+
+        ! render thread only
+        :return:
+        """
+        with self.__lock:
+            pending, flying = list(self.__pending.values()), [slot.future for slot in self.__flying]
+            for slot in self.__flying:
+                gl.glDeleteSync(slot.fence)
+            for slot in self.__slots:
+                slot.bffr.delete()
+            self.__pending.clear()
+            self.__flying.clear()
+            self.__slots.clear()
+            self.__free.clear()
+        for future in pending:
+            future.cancel()
+        for future in flying:  # running futures can not be canceled
+            future.set_exception(RuntimeError('picker deleted'))
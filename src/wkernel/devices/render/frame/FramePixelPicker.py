@@ -19,4 +19,11 @@ class FramePixelPicker:
         f = self.__frame()
         if f is not None:
             with f:
-                return f.pick_pixels(self.__aid, pos, size)
\ No newline at end of file
+                return f.pick_pixels(self.__aid, pos, size)
+    @property
+    def size(self):
+        """
+        :return: (width, height) of picked frame, None if frame is gone
+        """
+        f = self.__frame()
+        return None if f is None else f.size.xy
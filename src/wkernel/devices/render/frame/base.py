@@ -1,4 +1,5 @@
 import os
+import ctypes
 import weakref as wr
 import numpy as np
 from numbers import Number
@@ -16,6 +17,16 @@ import gkernel.color as clr
 from wkernel.devices.render._base import RenderDevice, RenderDeviceManager
 from ckernel.render_context.opengl_context.constant_enum import TextureFormats as TF, TextureTargets as TT
 from .FramePixelPicker import FramePixelPicker
+from .AsyncPixelPicker import AsyncPixelPicker
+
+# numpy dtype of pixel component for pixel pack type, packed types are read as one uint per pixel
+_TYPE_DTYPES = {gl.GL_UNSIGNED_BYTE: np.uint8, gl.GL_UNSIGNED_INT: np.uint32, gl.GL_INT: np.int32,
+                gl.GL_FLOAT: np.float32}
+_PACKED_TYPES = {gl.GL_UNSIGNED_INT_10_10_10_2}
+_FORMAT_COMPS = {gl.GL_RED: 1, gl.GL_RED_INTEGER: 1, gl.GL_DEPTH_COMPONENT: 1,
+                 gl.GL_RG: 2, gl.GL_RG_INTEGER: 2,
+                 gl.GL_RGB: 3, gl.GL_RGB_INTEGER: 3,
+                 gl.GL_RGBA: 4, gl.GL_RGBA_INTEGER: 4}
 
 
 class FrameRenderer:
@@ -98,13 +109,8 @@ class FrameRenderer:
             with self.__quad_vao:
                 with self.__quad_prgrm:
                     # update uniforms
-                    camera = get_current_ogl().manager.window.devices.cameras.current
-                    self.__quad_prgrm.uniforms['PM'] = camera.body.PM
-                    self.__quad_prgrm.uniforms['VM'] = camera.tripod.VM
-                    self.__quad_prgrm.uniforms['MM'] = [[1, 0, 0, 0],
-                                                        [0, 1, 0, 0],
-                                                        [0, 0, 1, 0],
-                                                        [0, 0, 0, 1]]
+                    devices = get_current_ogl().manager.window.devices
+                    devices.cameras.current.push_ufrm_block(devices.panes.current)
                     self.__quad_prgrm.push_uniforms()
                     gl.glDrawArrays(gl.GL_QUADS, 0, 4)
 
@@ -117,6 +123,10 @@ class Frame(RenderDevice):
         self.__size = gt.Vec(width, height, 0)
         # for drawing
         self.__renderer = FrameRenderer()
+        # for rendering on demand, (redraw, stamp) callables and stamp of the last redraw
+        self.__redraw = None
+        self.__stamp = None
+        self.__is_dirty = True
 
     def __enter__(self):
         """
@@ -150,6 +160,52 @@ class Frame(RenderDevice):
         """
         return self.__size
 
+    def set_redraw(self, redraw, stamp):
+        """
+        render frame on demand
+
+        Frame is redrawn by `validate` only when it is dirty; when invalidated
+        or when stamp differs from the one taken after the last redraw.
+        Picks validate the frame so id image is redrawn only after scene, camera or pane changes.
+        :param redraw: callable drawing the frame, called with the frame bound as the only argument
+        :param stamp: callable returning comparable state the frame depends on,
+                      ex) (modeler.version, camera.version, pane.size.xy)
+        :return:
+        """
+        self.__redraw = redraw, stamp
+        self.__is_dirty = True
+
+    def invalidate(self):
+        """
+        mark frame dirty regardless of stamp
+
+        :return:
+        """
+        self.__is_dirty = True
+
+    @property
+    def is_dirty(self):
+        if self.__is_dirty:
+            return True
+        return self.__redraw is not None and self.__redraw[1]() != self.__stamp
+
+    def validate(self):
+        """
+        redraw frame if dirty
+
+        :return: bool, is redrawn
+        """
+        if self.__redraw is None or not self.is_dirty:
+            return False
+        redraw, stamp = self.__redraw
+        # cleared first so that invalidation while drawing survives
+        self.__is_dirty = False
+        with self:
+            redraw(self)
+        # taken after drawing as drawing may deliver pending changes
+        self.__stamp = stamp()
+        return True
+
     def render_pane_space(self, tid, txtr_domain=(0, 1, 0, 1), pane_domain=(-1, 1, -1, 1), pane_z=0):
         """
         render frame's given attachment on pane space
@@ -217,6 +273,8 @@ class Frame(RenderDevice):
         """
         pick texture pixel of a given attachment id, position
 
+        ! blocks until gpu finishes drawing, use `pick_pixels_into` for asynchronous readback
+        ! frame rendered on demand is redrawn prior if dirty
         :param aid: int, color attachment id
         :param pos: (x, y), pixel coordinate
                     int   - absolute texture coordinate
@@ -226,6 +284,49 @@ class Frame(RenderDevice):
                     float - parameterized relative to texture size
         :return: (pixel_val, bitpattern) peripheral if to help decode returned value
         """
+        self.validate()
+        src, (x, y, w, h), texture = self.__parse_pick(aid, pos, size)
+        gl.glReadBuffer(src)
+        return gl.glReadPixels(x, y, w, h, texture.format, texture.type), texture.iformat.bitpattern
+
+    def pick_pixels_into(self, aid, pos, size, bffr):
+        """
+        issue pixel pick into pixel pack buffer without waiting for gpu
+
+        Storage of the buffer is reallocated each pick, orphaning the one gpu may still be writing into.
+        Caller should fence and read the buffer frames later.
+        :param aid: int, color attachment id
+        :param pos: (x, y), as `pick_pixels`
+        :param size: (width, height), as `pick_pixels`
+        :param bffr: _Bffr to pack pixels into
+        :return: (shape, dtype, bitpattern) to decode buffer content into what `pick_pixels` returns
+        """
+        self.validate()
+        src, (x, y, w, h), texture = self.__parse_pick(aid, pos, size)
+        fmt = getattr(texture.format, 'val', texture.format)
+        if texture.type in _PACKED_TYPES:
+            dtype, shape = np.dtype(np.uint32), (w, h)
+        elif texture.type in _TYPE_DTYPES and fmt in _FORMAT_COMPS:
+            dtype, comps = np.dtype(_TYPE_DTYPES[texture.type]), _FORMAT_COMPS[fmt]
+            shape = (w, h) if comps == 1 else (w, h, comps)
+        else:
+            raise NotImplementedError(texture.format, texture.type)
+
+        gl.glReadBuffer(src)
+        gl.glPixelStorei(gl.GL_PACK_ALIGNMENT, 1)
+        gl.glBindBuffer(gl.GL_PIXEL_PACK_BUFFER, bffr)
+        gl.glBufferData(gl.GL_PIXEL_PACK_BUFFER, int(np.prod(shape)) * dtype.itemsize, None, gl.GL_STREAM_READ)
+        gl.glReadPixels(x, y, w, h, texture.format, texture.type, ctypes.c_void_p(0))
+        # unbind else following synchronous picks write into the buffer
+        gl.glBindBuffer(gl.GL_PIXEL_PACK_BUFFER, 0)
+        return shape, dtype, texture.iformat.bitpattern
+
+    def __parse_pick(self, aid, pos, size):
+        """
+        parse pick expression
+
+        :return: (read buffer source, (x, y, width, height) in pixel, texture)
+        """
         aid = self.frame_bffr.get_autonym(aid)
         # parse pos expression
         texture = self.frame_bffr.get_attachment(aid)
@@ -234,7 +335,7 @@ class Frame(RenderDevice):
         x, y = [int(v * b) if isinstance(v, float) else v for v, b in zip(pos, texture.size)]
 
         # parse size expression
-        if isinstance(pos, gt.Vec):
+        if isinstance(size, gt.Vec):
             size = size.xy
         w, h = [int(v * b) if isinstance(v, float) else v for v, b in zip(size, texture.size)]
 
@@ -242,14 +343,12 @@ class Frame(RenderDevice):
         if isinstance(aid, int):
             src = eval(f"gl.GL_COLOR_ATTACHMENT{aid}")
         elif aid == 'd':
-            src = eval(gl.GL_DEPTH_ATTACHMENT)
+            src = gl.GL_DEPTH_ATTACHMENT
         elif aid == 'ds':
-            src = eval(gl.GL_DEPTH_STENCIL_ATTACHMENT)
+            src = gl.GL_DEPTH_STENCIL_ATTACHMENT
         else:
             raise
-
-        gl.glReadBuffer(src)
-        return gl.glReadPixels(x, y, w, h, texture.format, texture.type), texture.iformat.bitpattern
+        return src, (x, y, w, h), texture
 
     def clear(self, r=0, g=0, b=0, a=1):
         """
@@ -313,6 +412,9 @@ class Frame(RenderDevice):
     def create_pixel_picker(self, aid) -> FramePixelPicker:
         return FramePixelPicker(self, aid)
 
+    def create_async_pixel_picker(self, aid, ring_size=3) -> AsyncPixelPicker:
+        return AsyncPixelPicker(self, aid, ring_size)
+
 
 class _Frame(Frame):
     """